@@ -0,0 +1,570 @@
+"""
+오프라인 벤치마크용 로컬 픽스처 서버
+new.land / fin.land 의 list·상세 API와 매물 카드 HTML을 합성(또는 녹화) 응답으로 흉내냄
+
+사용법:
+    python benchmarks/fixture_server.py --port 8765 --pages 5 --latency-ms 50 --rate-429 0.05
+    python -m crawler 117804 --land-base-url http://127.0.0.1:8765 --fin-base-url http://127.0.0.1:8765 --channel ""
+    python -m crawler --discover-cortar 1100000000 --land-base-url http://127.0.0.1:8765 ...
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+LIST_PATH = "/front-api/v1/complex/article/list"
+DETAIL_RE = re.compile(r"^/api/articles/(\d+)$")
+COMPLEX_RE = re.compile(r"^/complexes/(\d+)$")
+ARTICLE_PAGE_RE = re.compile(r"^/articles/(\d+)$")
+REGION_LIST_PATH = "/api/regions/list"
+REGION_COMPLEXES_PATH = "/api/regions/complexes"
+MARKERS_PATH = "/api/complexes/single-markers/2.0"
+
+
+class FixtureConfig:
+    """픽스처 서버 설정 (지연/페이지 수/오류 주입 비율)"""
+
+    def __init__(self, pages: int = 3, page_size: int = 20, latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, rate_401: float = 0.0, rate_404: float = 0.0,
+                 rate_429: float = 0.0, retry_after: int = 1, low_mid_high_ratio: float = 0.5,
+                 total_floors: int = 30, seed: int = 42, recorded_dir: Optional[str] = None,
+                 region_complexes: int = 300, marker_limit: int = 50,
+                 string_price_ratio: float = 0.5):
+        self.pages = pages
+        self.page_size = page_size
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_401 = rate_401
+        self.rate_404 = rate_404
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.low_mid_high_ratio = low_mid_high_ratio
+        self.total_floors = total_floors
+        self.seed = seed
+        self.recorded_dir = recorded_dir
+        # 단지 탐색용 합성 지역 데이터 (단지 수, 마커 API 1회 응답 최대 건수)
+        self.region_complexes = region_complexes
+        self.marker_limit = marker_limit
+        # 가격이 list API 문자열 형식("5억 5,000")으로 오는 매물 비율
+        self.string_price_ratio = string_price_ratio
+
+
+class FixtureData:
+    """단지별 합성 매물 데이터 (시드 고정으로 재현 가능)"""
+
+    TRADE_TYPES = ("A1", "B1", "B2")
+
+    def __init__(self, config: FixtureConfig):
+        self.config = config
+        self._cache: Dict[str, List[Dict]] = {}
+        self._index: Dict[str, Dict] = {}
+        # 매물 번호 → 실제 층 (저/중/고 매물은 list 항목에 없고 상세 응답으로만 제공)
+        self._floors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def articles(self, complex_id: str) -> List[Dict]:
+        """단지 전체 매물 목록 (거래유형별 pages * page_size 건)"""
+        with self._lock:
+            if complex_id not in self._cache:
+                articles = self._generate(complex_id)
+                self._cache[complex_id] = articles
+                self._index.update((a["articleNumber"], a) for a in articles)
+            return self._cache[complex_id]
+
+    def _generate(self, complex_id: str) -> List[Dict]:
+        rng = random.Random(f"{self.config.seed}:{complex_id}")
+        per_trade_type = self.config.pages * self.config.page_size
+        total_floors = self.config.total_floors
+        articles = []
+        for trade_type in self.TRADE_TYPES:
+            for _ in range(per_trade_type):
+                floor = rng.randint(1, total_floors)
+                if rng.random() < self.config.low_mid_high_ratio:
+                    if floor <= total_floors // 3:
+                        band = "저"
+                    elif floor <= total_floors * 2 // 3:
+                        band = "중"
+                    else:
+                        band = "고"
+                    floor_info = f"{band}/{total_floors}"
+                else:
+                    floor_info = f"{floor}/{total_floors}"
+                price = rng.randrange(50000, 300000, 500)
+                if rng.random() < self.config.string_price_ratio:
+                    price = _price_text(price)
+                article = {
+                    "articleNumber": f"{complex_id}{len(articles):05d}",
+                    "complexNumber": complex_id,
+                    "dongName": f"{rng.randint(101, 110)}동",
+                    "tradeType": trade_type,
+                    "dealOrWarrantPrc": price,
+                    "area1": rng.choice((59.97, 84.95, 114.8, 135.2)),
+                    "floorInfo": floor_info,
+                    "totalFloor": total_floors,
+                }
+                if floor_info[0].isdigit():
+                    article["floor"] = floor
+                self._floors[article["articleNumber"]] = floor
+                articles.append(article)
+        return articles
+
+    def find(self, article_no: str) -> Optional[Dict]:
+        """매물 번호로 매물 조회"""
+        with self._lock:
+            return self._index.get(article_no)
+
+    def floor(self, article_no: str) -> Optional[int]:
+        """매물의 실제 층 (상세 응답용)"""
+        with self._lock:
+            return self._floors.get(article_no)
+
+
+class RegionData:
+    """
+    단지 탐색용 합성 지역 (시 → 구 → 법정동 → 단지)
+
+    단지 일부는 좁은 구역에 몰려 있어 마커 API 응답이 잘리는 밀집 타일을 만듦
+    """
+
+    ROOT = "1100000000"
+    BOUNDS = (37.45, 126.85, 37.65, 127.15)  # south, west, north, east
+
+    def __init__(self, config: FixtureConfig):
+        rng = random.Random(f"{config.seed}:regions")
+        south, west, north, east = self.BOUNDS
+        self.children: Dict[str, List[Dict]] = {self.ROOT: []}
+        self.complexes: List[Dict] = []
+        self.by_cortar: Dict[str, List[Dict]] = {}
+        dongs = []
+        for gu_idx in range(4):
+            gu_code = f"11{110 + gu_idx * 30:03d}00000"
+            gu_lat = south + (north - south) * (gu_idx // 2 + 0.5) / 2
+            gu_lon = west + (east - west) * (gu_idx % 2 + 0.5) / 2
+            self.children[self.ROOT].append(self._region(gu_code, f"{gu_idx + 1}구", "sgg", gu_lat, gu_lon))
+            self.children[gu_code] = []
+            for dong_idx in range(5):
+                dong_code = f"{gu_code[:5]}{101 + dong_idx * 10:03d}00"
+                lat = gu_lat + rng.uniform(-0.04, 0.04)
+                lon = gu_lon + rng.uniform(-0.06, 0.06)
+                self.children[gu_code].append(self._region(dong_code, f"{dong_idx + 1}동", "sec", lat, lon))
+                dongs.append((dong_code, lat, lon))
+        dense_lat, dense_lon = (south + north) / 2, (west + east) / 2
+        for idx in range(config.region_complexes):
+            if idx % 3 == 0:
+                # 밀집 구역 (약 500m 범위)
+                lat = dense_lat + rng.uniform(-0.0025, 0.0025)
+                lon = dense_lon + rng.uniform(-0.0025, 0.0025)
+                cortar_no = dongs[0][0]
+            else:
+                cortar_no, center_lat, center_lon = dongs[rng.randrange(len(dongs))]
+                lat = min(north - 1e-6, max(south, center_lat + rng.uniform(-0.01, 0.01)))
+                lon = min(east - 1e-6, max(west, center_lon + rng.uniform(-0.01, 0.01)))
+            complex_info = {
+                "complexNo": str(200000 + idx),
+                "complexName": f"합성단지{idx + 1}",
+                "cortarNo": cortar_no,
+                "realEstateTypeCode": "APT",
+                "latitude": round(lat, 6),
+                "longitude": round(lon, 6),
+                "totalHouseholdCount": rng.randrange(100, 3000, 10),
+            }
+            self.complexes.append(complex_info)
+            self.by_cortar.setdefault(cortar_no, []).append(complex_info)
+
+    @staticmethod
+    def _region(code: str, name: str, kind: str, lat: float, lon: float) -> Dict:
+        return {"cortarNo": code, "cortarName": name, "cortarType": kind,
+                "centerLat": round(lat, 6), "centerLon": round(lon, 6)}
+
+    def markers(self, south: float, west: float, north: float, east: float, limit: int) -> List[Dict]:
+        """영역 안 단지 마커 (실제 API처럼 limit 건에서 잘림)"""
+        found = [
+            {"markerId": c["complexNo"], "markerType": "COMPLEX", "complexName": c["complexName"],
+             "latitude": c["latitude"], "longitude": c["longitude"],
+             "realEstateTypeCode": c["realEstateTypeCode"], "totalHouseholdCount": c["totalHouseholdCount"]}
+            for c in self.complexes
+            if south <= c["latitude"] < north and west <= c["longitude"] < east
+        ]
+        return found[:limit]
+
+
+class FixtureStats:
+    """엔드포인트/상태코드별 요청 수 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints: Dict[str, int] = {}
+        self.statuses: Dict[str, int] = {}
+
+    def add(self, endpoint: str, status: int):
+        with self._lock:
+            self.endpoints[endpoint] = self.endpoints.get(endpoint, 0) + 1
+            self.statuses[str(status)] = self.statuses.get(str(status), 0) + 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "endpoints": dict(self.endpoints),
+                "statuses": dict(self.statuses),
+                "api_requests": self.endpoints.get("list", 0) + self.endpoints.get("detail", 0),
+                "discovery_requests": self.endpoints.get("discovery", 0),
+            }
+
+    def reset(self):
+        with self._lock:
+            self.endpoints.clear()
+            self.statuses.clear()
+
+
+def _price_text(man: int) -> str:
+    """만원 단위 금액 → list API 가격 문자열 ("5억 5,000", "5억")"""
+    eok, rest = divmod(man, 10000)
+    return f"{eok}억 {rest:,}" if rest else f"{eok}억"
+
+
+def _card_price(price) -> str:
+    """카드 표시 가격 (문자열 가격은 그대로, 정수는 억 단위)"""
+    return price if isinstance(price, str) else f"{price // 10000}억"
+
+
+def _complex_page_html(complex_id: str, articles: List[Dict]) -> str:
+    """매물 카드 + 상세 패널이 있는 최소 단지 페이지"""
+    cards = "\n".join(
+        f'<a class="item_card" href="/articles/{a["articleNumber"]}" data-no="{a["articleNumber"]}">'
+        f'{a["dongName"]} 매매 {_card_price(a["dealOrWarrantPrc"])} {a["area1"]}㎡ {a["floorInfo"]}층</a>'
+        for a in articles
+    )
+    return f"""<!doctype html>
+<html lang="ko"><head><meta charset="utf-8"><title>단지 매물</title></head>
+<body>
+<div role="tab">매물</div>
+<div id="list">
+{cards}
+</div>
+<div id="detail"><dl><dt>해당층/총층</dt><dd id="floor"></dd></dl></div>
+<script>
+function loadList() {{
+  fetch("{LIST_PATH}", {{
+    method: "POST",
+    headers: {{"Content-Type": "application/json"}},
+    body: JSON.stringify({{complexNumber: "{complex_id}", tradeTypes: ["A1"], page: 1, size: 20}})
+  }});
+}}
+document.querySelector("[role=tab]").addEventListener("click", loadList);
+document.querySelectorAll("a.item_card").forEach(function (a) {{
+  a.addEventListener("click", function (ev) {{
+    ev.preventDefault();
+    fetch("/api/articles/" + a.dataset.no).then(function (r) {{ return r.json(); }}).then(function (d) {{
+      document.getElementById("floor").innerText = d.floor + "/" + d.totalFloor + "층";
+    }}).catch(function () {{}});
+  }});
+}});
+loadList();
+</script>
+</body></html>"""
+
+
+def _article_page_html(article: Dict, floor: int) -> str:
+    """상세 정보 표만 있는 매물 상세 페이지 (dom 모드 상세 탭용)"""
+    return f"""<!doctype html>
+<html lang="ko"><head><meta charset="utf-8"><title>매물 {article["articleNumber"]}</title></head>
+<body>
+<dl><dt>동</dt><dd>{article["dongName"]}</dd></dl>
+<dl><dt>해당층/총층</dt><dd>{floor}/{article["totalFloor"]}층</dd></dl>
+</body></html>"""
+
+
+def make_handler(config: FixtureConfig, data: FixtureData, stats: FixtureStats,
+                 regions: Optional[RegionData] = None):
+    """설정을 바인딩한 요청 핸들러 클래스 생성"""
+    rng = random.Random(config.seed)
+    rng_lock = threading.Lock()
+    regions = regions or RegionData(config)
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        server_version = "EstateFixture/1.0"
+
+        def log_message(self, format, *args):
+            return
+
+        def _roll(self, rate: float) -> bool:
+            if rate <= 0:
+                return False
+            with rng_lock:
+                return rng.random() < rate
+
+        def _delay(self):
+            if config.latency_ms or config.jitter_ms:
+                with rng_lock:
+                    jitter = rng.uniform(0, config.jitter_ms)
+                time.sleep((config.latency_ms + jitter) / 1000)
+
+        def _send(self, endpoint: str, status: int, body: bytes,
+                  content_type: str = "application/json; charset=utf-8",
+                  headers: Optional[Dict[str, str]] = None):
+            stats.add(endpoint, status)
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_json(self, endpoint: str, status: int, payload: object,
+                       headers: Optional[Dict[str, str]] = None):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self._send(endpoint, status, body, headers=headers)
+
+        def _inject_error(self, endpoint: str) -> bool:
+            """401/404/429 주입 (Retry-After 포함)"""
+            if self._roll(config.rate_429):
+                self._send_json(endpoint, 429, {"error": "TOO_MANY_REQUESTS"},
+                                headers={"Retry-After": str(config.retry_after)})
+                return True
+            if self._roll(config.rate_401):
+                self._send_json(endpoint, 401, {"error": "UNAUTHORIZED"})
+                return True
+            if self._roll(config.rate_404):
+                self._send_json(endpoint, 404, {"error": "NOT_FOUND"})
+                return True
+            return False
+
+        def _read_json_body(self) -> Dict:
+            length = int(self.headers.get("Content-Length") or 0)
+            if not length:
+                return {}
+            try:
+                return json.loads(self.rfile.read(length).decode("utf-8"))
+            except ValueError:
+                return {}
+
+        def _recorded(self, name: str) -> Optional[bytes]:
+            if not config.recorded_dir:
+                return None
+            path = os.path.join(config.recorded_dir, name)
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    return f.read()
+            return None
+
+        def do_GET(self):
+            self._route("GET")
+
+        def do_POST(self):
+            self._route("POST")
+
+        def _route(self, method: str):
+            parsed = urlparse(self.path)
+            path = parsed.path
+            query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+
+            if path == "/__stats":
+                self._send_json("stats", 200, stats.snapshot())
+                return
+
+            if path == LIST_PATH:
+                body = self._read_json_body() if method == "POST" else {}
+                self._delay()
+                if self._inject_error("list"):
+                    return
+                self._handle_list(dict(query, **body))
+                return
+
+            match = DETAIL_RE.match(path)
+            if match:
+                self._delay()
+                if self._inject_error("detail"):
+                    return
+                self._handle_detail(match.group(1))
+                return
+
+            if path in (REGION_LIST_PATH, REGION_COMPLEXES_PATH, MARKERS_PATH):
+                self._delay()
+                if self._inject_error("discovery"):
+                    return
+                self._handle_discovery(path, query)
+                return
+
+            match = ARTICLE_PAGE_RE.match(path)
+            if match:
+                self._delay()
+                article = data.find(match.group(1))
+                if not article:
+                    self._send_json("detail", 404, {"error": "NOT_FOUND"})
+                    return
+                html = _article_page_html(article, data.floor(match.group(1))).encode("utf-8")
+                self._send("detail", 200, html, content_type="text/html; charset=utf-8")
+                return
+
+            match = COMPLEX_RE.match(path)
+            if match:
+                articles = data.articles(match.group(1))[:config.page_size]
+                html = _complex_page_html(match.group(1), articles).encode("utf-8")
+                self._send("html", 200, html, content_type="text/html; charset=utf-8")
+                return
+
+            if path in ("/", "/index.html"):
+                html = "<!doctype html><html><head><meta charset='utf-8'><title>fixture</title></head><body>ok</body></html>"
+                self._send("html", 200, html.encode("utf-8"), content_type="text/html; charset=utf-8")
+                return
+
+            self._send_json("other", 404, {"error": "NOT_FOUND", "path": path})
+
+        def _handle_list(self, params: Dict):
+            complex_id = str(params.get("complexNumber") or params.get("complexNo") or "117804")
+            page = max(1, int(params.get("page") or 1))
+            size = int(params.get("size") or params.get("pageSize") or config.page_size)
+            recorded = self._recorded(f"list_{complex_id}_{page}.json") or self._recorded(f"list_{page}.json")
+            if recorded is not None:
+                self._send("list", 200, recorded)
+                return
+            trade_types = params.get("tradeTypes")
+            articles = data.articles(complex_id)
+            if isinstance(trade_types, str):
+                # GET 쿼리는 "A1,B1" 형식
+                trade_types = [t for t in trade_types.split(",") if t]
+            if trade_types:
+                articles = [a for a in articles if a["tradeType"] in trade_types]
+            start = (page - 1) * size
+            chunk = articles[start:start + size]
+            self._send_json("list", 200, {
+                "isSuccess": True,
+                "result": {
+                    "list": chunk,
+                    "totalCount": len(articles),
+                    "hasNextPage": start + size < len(articles),
+                },
+            })
+
+        def _handle_discovery(self, path: str, query: Dict):
+            if path == REGION_LIST_PATH:
+                cortar_no = query.get("cortarNo") or RegionData.ROOT
+                self._send_json("discovery", 200, {"regionList": regions.children.get(cortar_no, [])})
+                return
+            if path == REGION_COMPLEXES_PATH:
+                cortar_no = query.get("cortarNo") or ""
+                self._send_json("discovery", 200, {"complexList": regions.by_cortar.get(cortar_no, [])})
+                return
+            try:
+                box = [float(query[k]) for k in ("bottomLat", "leftLon", "topLat", "rightLon")]
+            except (KeyError, ValueError):
+                self._send_json("discovery", 400, {"error": "BAD_REQUEST"})
+                return
+            self._send_json("discovery", 200, regions.markers(*box, limit=config.marker_limit))
+
+        def _handle_detail(self, article_no: str):
+            recorded = self._recorded(f"article_{article_no}.json")
+            if recorded is not None:
+                self._send("detail", 200, recorded)
+                return
+            article = data.find(article_no)
+            if not article:
+                self._send_json("detail", 404, {"error": "NOT_FOUND"})
+                return
+            floor = data.floor(article_no)
+            self._send_json("detail", 200, {
+                "articleNo": article_no,
+                "floor": floor,
+                "totalFloor": article["totalFloor"],
+                "articleDetail": {"floorInfo": f"{floor}/{article['totalFloor']}"},
+            })
+
+    return FixtureHandler
+
+
+class FixtureServer:
+    """백그라운드 스레드에서 동작하는 픽스처 서버"""
+
+    def __init__(self, config: Optional[FixtureConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or FixtureConfig()
+        self.data = FixtureData(self.config)
+        self.stats = FixtureStats()
+        self.regions = RegionData(self.config)
+        handler = make_handler(self.config, self.data, self.stats, self.regions)
+        self._httpd = ThreadingHTTPServer((host, port), handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._httpd.server_address[:2]
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}"
+
+    def serve_forever(self):
+        """현재 스레드에서 서버 실행 (단독 실행용)"""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def start(self) -> "FixtureServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="네이버 부동산 로컬 픽스처 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-401", type=float, default=0.0)
+    parser.add_argument("--rate-404", type=float, default=0.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--low-mid-high-ratio", type=float, default=0.5,
+                        help="층수가 저/중/고로만 표시되는 매물 비율")
+    parser.add_argument("--recorded-dir", default=None,
+                        help="녹화 응답 디렉터리 (list_{단지}_{page}.json, article_{번호}.json)")
+    parser.add_argument("--region-complexes", type=int, default=300,
+                        help="단지 탐색용 합성 단지 수")
+    parser.add_argument("--marker-limit", type=int, default=50,
+                        help="마커 API 1회 응답 최대 건수 (초과 시 잘림)")
+    parser.add_argument("--string-price-ratio", type=float, default=0.5,
+                        help='가격이 "5억 5,000" 문자열로 오는 매물 비율')
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    config = FixtureConfig(
+        pages=args.pages, page_size=args.page_size, latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms, rate_401=args.rate_401, rate_404=args.rate_404,
+        rate_429=args.rate_429, retry_after=args.retry_after,
+        low_mid_high_ratio=args.low_mid_high_ratio, seed=args.seed,
+        recorded_dir=args.recorded_dir, region_complexes=args.region_complexes,
+        marker_limit=args.marker_limit, string_price_ratio=args.string_price_ratio,
+    )
+    server = FixtureServer(config, host=args.host, port=args.port)
+    print(f"fixture server: {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+API 응답 JSON 디코딩 마이크로벤치마크 (오프라인)
+기존 경로(text 디코딩 + 300자 미리보기 + response.json() 재파싱)와
+단일 디코딩 경로(body bytes 1회 파싱, orjson 사용 가능 시 orjson)를 비교
+
+사용법:
+    python benchmarks/json_decode_bench.py --page-size 20 --iterations 2000
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fixture_server import FixtureConfig, FixtureData  # noqa: E402
+from utils import fastjson  # noqa: E402
+
+
+def build_payloads(page_size: int, pages: int) -> List[bytes]:
+    """픽스처 서버와 같은 형태의 목록 응답 본문"""
+    data = FixtureData(FixtureConfig(pages=pages, page_size=page_size))
+    articles = data.articles("117804")
+    bodies = []
+    for start in range(0, len(articles), page_size):
+        chunk = articles[start:start + page_size]
+        bodies.append(json.dumps({
+            "isSuccess": True,
+            "result": {
+                "list": chunk,
+                "totalCount": len(articles),
+                "hasNextPage": start + page_size < len(articles),
+            },
+        }, ensure_ascii=False).encode("utf-8"))
+    return bodies
+
+
+def legacy_path(body: bytes, log: Callable[[str], None]) -> Dict:
+    """변경 전: text() → 미리보기 로그 → json() (본문 디코딩 2회, 파싱 1회)"""
+    text = body.decode("utf-8")
+    log(f"API 응답 status=200, body_preview={text[:300]}")
+    _ = len(text)
+    return json.loads(body.decode("utf-8"))
+
+
+def fast_path(body: bytes, log: Callable[[str], None]) -> Dict:
+    """변경 후: body bytes 1회 파싱, 미리보기 생략"""
+    _ = len(body)
+    return fastjson.loads(body)
+
+
+def measure(fn, payloads: List[bytes], iterations: int) -> Dict:
+    """CPU 시간 기준 요청당 처리 시간"""
+    sink: List[str] = []
+    log = sink.append
+    count = 0
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    while count < iterations:
+        for body in payloads:
+            fn(body, log)
+            count += 1
+            if count >= iterations:
+                break
+        sink.clear()
+    cpu = time.process_time() - cpu_started
+    wall = time.perf_counter() - wall_started
+    return {
+        "requests": count,
+        "cpu_sec": round(cpu, 4),
+        "us_per_request": round(wall / count * 1e6, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 응답 JSON 디코딩 경로 비교")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    payloads = build_payloads(args.page_size, args.pages)
+    avg_bytes = sum(len(p) for p in payloads) // len(payloads)
+    print(f"payloads={len(payloads)}, avg_bytes={avg_bytes}, backend={fastjson.BACKEND}")
+
+    legacy = measure(legacy_path, payloads, args.iterations)
+    fast = measure(fast_path, payloads, args.iterations)
+    print(f"{'path':<8}{'requests':>10}{'cpu(s)':>10}{'us/req':>10}")
+    for name, result in (("legacy", legacy), ("fast", fast)):
+        print(f"{name:<8}{result['requests']:>10}{result['cpu_sec']:>10.3f}{result['us_per_request']:>10.1f}")
+    if fast["us_per_request"] > 0:
+        print(f"speedup x{legacy['us_per_request'] / fast['us_per_request']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
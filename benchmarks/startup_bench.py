@@ -0,0 +1,126 @@
+"""
+GUI 시작 속도 벤치마크
+-X importtime 합계/상위 모듈과 첫 윈도우 표시까지 걸린 시간 측정
+
+사용법:
+    python benchmarks/startup_bench.py [--runs 5] [--top 15]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 첫 윈도우가 이벤트 루프에서 그려진 직후 종료하는 스니펫
+FIRST_WINDOW_SNIPPET = """
+import sys
+from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QTimer
+from gui.main_window import MainWindow
+
+app = QApplication(sys.argv)
+window = MainWindow()
+window.show()
+
+def ready():
+    print("WINDOW_READY", flush=True)
+    app.quit()
+
+QTimer.singleShot(0, ready)
+app.exec()
+"""
+
+HEAVY_MODULES = ("pandas", "openpyxl", "playwright", "numpy")
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """-X importtime 출력 파싱 -> (모듈, self us, cumulative us)"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return rows
+
+
+def measure_importtime(module: str) -> Dict:
+    """모듈 import 비용 측정"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True
+    )
+    rows = parse_importtime(proc.stderr)
+    total_us = sum(self_us for _name, self_us, _cum in rows)
+    loaded = {name.strip().split(".")[0] for name, _self_us, _cum_us in rows}
+    return {
+        "module": module,
+        "ok": proc.returncode == 0,
+        "total_ms": total_us / 1000,
+        "rows": rows,
+        "heavy_loaded": sorted(m for m in HEAVY_MODULES if m in loaded),
+        "error": proc.stderr.strip().splitlines()[-1] if proc.returncode else "",
+    }
+
+
+def measure_first_window(runs: int) -> List[float]:
+    """프로세스 시작 -> 첫 윈도우 표시까지 시간(ms) 측정"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, "-c", FIRST_WINDOW_SNIPPET],
+            cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+        )
+        for line in proc.stdout:
+            if line.startswith("WINDOW_READY"):
+                timings.append((time.perf_counter() - started) * 1000)
+                break
+        proc.wait()
+        if proc.returncode not in (0, None) and not timings:
+            raise RuntimeError(proc.stderr.read().strip())
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GUI 시작 속도 벤치마크")
+    parser.add_argument("--runs", type=int, default=5, help="첫 윈도우 측정 반복 횟수")
+    parser.add_argument("--top", type=int, default=15, help="누적 import 시간 상위 모듈 수")
+    args = parser.parse_args()
+
+    print("=== -X importtime ===")
+    for module in ("gui.main_window", "crawler.cli", "utils.excel_exporter"):
+        result = measure_importtime(module)
+        if not result["ok"]:
+            print(f"{module:<24} import 실패: {result['error']}")
+            continue
+        heavy = ", ".join(result["heavy_loaded"]) or "없음"
+        print(f"{module:<24} 합계 {result['total_ms']:8.1f} ms | 무거운 의존성: {heavy}")
+
+    result = measure_importtime("gui.main_window")
+    if result["ok"]:
+        print(f"\n--- gui.main_window 누적 상위 {args.top} ---")
+        for name, _self_us, cum_us in sorted(result["rows"], key=lambda r: r[2], reverse=True)[:args.top]:
+            print(f"{cum_us / 1000:8.1f} ms  {name}")
+
+    print("\n=== 첫 윈도우 표시 시간 ===")
+    try:
+        timings = measure_first_window(args.runs)
+    except Exception as e:
+        print(f"측정 실패: {e}")
+        return
+    if timings:
+        print(f"runs={len(timings)} median={statistics.median(timings):.0f} ms "
+              f"min={min(timings):.0f} ms max={max(timings):.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
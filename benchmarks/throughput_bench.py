@@ -0,0 +1,141 @@
+"""
+수집 처리량 벤치마크 (로컬 픽스처 서버 대상, 오프라인)
+크롤링 모드별 listings/sec, 매물당 요청 수, 첫 레코드까지 시간, 크롤러 프로세스 CPU 시간 측정
+
+사용법:
+    python benchmarks/throughput_bench.py --modes api dom --pages 3 --latency-ms 30
+    python benchmarks/throughput_bench.py --modes api --transports browser http
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from fixture_server import FixtureConfig, FixtureServer  # noqa: E402
+
+
+async def run_mode(server: FixtureServer, mode: str, complex_id: str,
+                   channel: Optional[str], concurrency: int, verbose: bool,
+                   transport: str = "browser") -> Dict:
+    """단일 모드 1회 실행 결과 측정"""
+    from crawler.naver_crawler import NaverEstateCrawler
+
+    workdir = tempfile.mkdtemp(prefix=f"bench_{mode}_")
+    first_record_at = None
+
+    def on_found(_record):
+        nonlocal first_record_at
+        if first_record_at is None:
+            first_record_at = time.perf_counter()
+
+    def on_log(message: str):
+        if verbose:
+            print(f"[{mode}/{transport}] {message}", file=sys.stderr)
+
+    server.stats.reset()
+    crawler = NaverEstateCrawler(
+        url=f"{server.url}/complexes/{complex_id}",
+        log_callback=on_log,
+        property_found_callback=on_found,
+        min_wait=0.0,
+        max_wait=0.0,
+        headless=True,
+        checkpoint_dir=os.path.join(workdir, "checkpoints"),
+        mode=mode,
+        concurrency=concurrency,
+        user_data_dir=os.path.join(workdir, "profile"),
+        land_base_url=server.url,
+        fin_base_url=server.url,
+        browser_channel=channel,
+        transport=transport,
+        building_index_dir=os.path.join(workdir, "building_index"),
+    )
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    try:
+        await crawler.crawl()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    stats = server.stats.snapshot()
+    records = len(crawler.results)
+    return {
+        "mode": mode,
+        "transport": transport,
+        "ok": crawler.finished,
+        "records": records,
+        "elapsed_sec": round(elapsed, 3),
+        "listings_per_sec": round(records / elapsed, 2) if elapsed > 0 else 0.0,
+        "requests_per_listing": round(stats["api_requests"] / records, 3) if records else None,
+        "time_to_first_record_sec": round(first_record_at - started, 3) if first_record_at else None,
+        # Python 프로세스 CPU (브라우저 프로세스 제외)
+        "cpu_sec": round(cpu, 3),
+        "server": stats,
+    }
+
+
+def print_table(results: List[Dict]):
+    """결과 요약 표 출력"""
+    header = (f"{'mode':<6} {'transport':<10} {'ok':<5} {'records':>8} {'elapsed(s)':>11} {'listings/s':>11} "
+              f"{'req/listing':>12} {'TTFR(s)':>8} {'cpu(s)':>7}")
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        rpl = "-" if r["requests_per_listing"] is None else f"{r['requests_per_listing']:.2f}"
+        ttfr = "-" if r["time_to_first_record_sec"] is None else f"{r['time_to_first_record_sec']:.2f}"
+        print(f"{r['mode']:<6} {r['transport']:<10} {str(r['ok']):<5} {r['records']:>8} {r['elapsed_sec']:>11.2f} "
+              f"{r['listings_per_sec']:>11.2f} {rpl:>12} {ttfr:>8} {r['cpu_sec']:>7.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 모드별 처리량 벤치마크 (오프라인)")
+    parser.add_argument("--modes", nargs="+", default=["api", "dom"])
+    parser.add_argument("--complex-id", default="117804")
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--low-mid-high-ratio", type=float, default=0.5)
+    parser.add_argument("--concurrency", type=int, default=4, help="상세 요청 동시 실행 수")
+    parser.add_argument("--transports", nargs="+", default=["browser"], choices=["browser", "http"],
+                        help="api 모드 JSON 전송 방식 (dom 모드는 browser만)")
+    parser.add_argument("--channel", default="", help="브라우저 채널 (기본: Playwright Chromium)")
+    parser.add_argument("--json", dest="json_path", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    config = FixtureConfig(
+        pages=args.pages, page_size=args.page_size, latency_ms=args.latency_ms,
+        rate_429=args.rate_429, low_mid_high_ratio=args.low_mid_high_ratio,
+    )
+    results = []
+    with FixtureServer(config) as server:
+        print(f"fixture server: {server.url}")
+        for mode in args.modes:
+            transports = args.transports if mode == "api" else ["browser"]
+            for transport in transports:
+                results.append(asyncio.run(run_mode(
+                    server, mode, args.complex_id, args.channel or None, args.concurrency, args.verbose,
+                    transport,
+                )))
+
+    print_table(results)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
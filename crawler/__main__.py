@@ -0,0 +1,11 @@
+"""
+python -m crawler 실행 진입점
+"""
+
+import sys
+
+from crawler.cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
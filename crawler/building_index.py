@@ -0,0 +1,119 @@
+"""
+단지별 동/층 색인
+동별 전체 층수와 매물별 확인된 층수를 단지 단위 JSON 파일로 보존
+list 항목/상세 응답에서 확인된 층수로 학습하고, 다음 수집부터 전체 층수를 바로 채우며
+이미 확인한 매물은 상세 요청 없이 층수를 재사용
+"""
+
+import json
+import os
+import re
+import time
+from typing import Dict, Optional, Tuple
+
+# "15/30층", "B1/30", "저/30층"
+_FLOOR_TOTAL_RE = re.compile(r"^\s*([^\s/]+?)\s*층?\s*/\s*(\d+)\s*층?\s*$")
+# 전체 층수 없이 층만 있는 표기 ("15", "15층", "B1")
+_FLOOR_ONLY_RE = re.compile(r"^\s*(B?\d+)\s*층?\s*$")
+_RESOLVED_RE = re.compile(r"^B?\d+$")
+
+
+def dong_key(dong: str) -> str:
+    """동 이름 정규화 ("101동", "101 동", "101" → "101")"""
+    return re.sub(r"\s+", "", str(dong or "")).rstrip("동")
+
+
+def split_floor(text: str) -> Tuple[str, Optional[int]]:
+    """층수 표기 → (층, 전체 층수) ("15/30층" → ("15", 30), "저" → ("저", None))"""
+    text = str(text or "").strip()
+    match = _FLOOR_TOTAL_RE.match(text)
+    if match:
+        return match.group(1), int(match.group(2))
+    match = _FLOOR_ONLY_RE.match(text)
+    if match:
+        return match.group(1), None
+    return text, None
+
+
+class BuildingIndex:
+    """단지 1개의 동별 전체 층수 + 매물별 층수 색인"""
+
+    def __init__(self, complex_id: str, directory: str = "./building_index"):
+        self.complex_id = complex_id
+        self.directory = directory
+        self.path = os.path.join(directory, f"{complex_id}.json")
+        # 동 → {"total_floors": int}
+        self.dongs: Dict[str, Dict] = {}
+        # 매물번호 → 확인된 층수 ("15/30층")
+        self.articles: Dict[str, str] = {}
+        self._dirty = False
+
+    def load(self) -> "BuildingIndex":
+        """저장된 색인 읽기 (없거나 손상되면 빈 색인)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        self.dongs = dict(data.get("dongs") or {})
+        self.articles = dict(data.get("articles") or {})
+        return self
+
+    def save(self) -> bool:
+        """변경 시 저장 (다른 프로세스가 먼저 저장한 내용과 병합 후 원자적 교체)"""
+        if not self._dirty:
+            return False
+        os.makedirs(self.directory, exist_ok=True)
+        merged = BuildingIndex(self.complex_id, self.directory).load()
+        for dong, info in self.dongs.items():
+            total = max(info.get("total_floors", 0), merged.dongs.get(dong, {}).get("total_floors", 0))
+            merged.dongs[dong] = {**merged.dongs.get(dong, {}), **info, "total_floors": total}
+        merged.articles.update(self.articles)
+        data = {
+            "complex_id": self.complex_id,
+            "updated": time.time(),
+            "dongs": merged.dongs,
+            "articles": merged.articles,
+        }
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self.dongs, self.articles = merged.dongs, merged.articles
+        self._dirty = False
+        return True
+
+    def total_floors(self, dong: str) -> Optional[int]:
+        """동의 전체 층수 (모르면 None)"""
+        info = self.dongs.get(dong_key(dong))
+        return info.get("total_floors") if info else None
+
+    def learn(self, dong: str, floor: str, article_no: Optional[str] = None):
+        """확인된 층수 표기로 동 전체 층수/매물 층수 갱신"""
+        level, total = split_floor(floor)
+        key = dong_key(dong)
+        if total and key:
+            info = self.dongs.setdefault(key, {})
+            if total > info.get("total_floors", 0):
+                info["total_floors"] = total
+                self._dirty = True
+        if article_no and total and _RESOLVED_RE.match(level) and self.articles.get(article_no) != floor:
+            self.articles[article_no] = floor
+            self._dirty = True
+
+    def lookup(self, article_no: Optional[str]) -> Optional[str]:
+        """이전에 확인한 매물 층수"""
+        return self.articles.get(article_no) if article_no else None
+
+    def fill(self, dong: str, floor: str) -> str:
+        """전체 층수가 빠진 표기에 동 전체 층수 채우기 ("15" → "15/30층", "저" → "저/30층")"""
+        level, total = split_floor(floor)
+        if total or not level:
+            return floor
+        known = self.total_floors(dong)
+        if not known:
+            return floor
+        return f"{level}/{known}층"
+
+    def __len__(self) -> int:
+        return len(self.articles)
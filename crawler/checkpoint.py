@@ -0,0 +1,189 @@
+"""
+크롤링 체크포인트 저널
+run ID별 append-only JSONL 기록 (배치 fsync) 및 중단된 크롤링 재개
+"""
+
+import json
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+
+def _edge_entries(path: str, tail_bytes: int = 4096) -> Tuple[Dict, Dict]:
+    """저널 첫 줄/마지막 줄 기록 (해석할 수 없는 줄은 빈 dict)"""
+    def parse(line: bytes) -> Dict:
+        try:
+            entry = json.loads(line.decode("utf-8"))
+        except ValueError:
+            return {}
+        return entry if isinstance(entry, dict) else {}
+
+    with open(path, "rb") as f:
+        first = parse(f.readline())
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - tail_bytes))
+        lines = [line for line in f.read().splitlines() if line.strip()]
+    return first, parse(lines[-1]) if lines else {}
+
+
+class CheckpointState:
+    """저널 재생 결과 (완료 페이지/매물 ID/파싱 레코드/마지막 위치)"""
+
+    def __init__(self):
+        self.meta: Dict = {}
+        self.records: List[Dict[str, str]] = []
+        self.article_ids: Set[str] = set()
+        self.completed_pages: Set[int] = set()
+        # 거래유형별 완료 페이지 (api 모드 거래유형 병렬 수집)
+        self.completed_trade_pages: Dict[str, Set[int]] = {}
+        self.last_position = -1
+        self.finished = False
+
+
+class CheckpointJournal:
+    """run ID 단위 append-only JSONL 체크포인트 저널"""
+
+    def __init__(self, run_id: str, directory: str = "./checkpoints",
+                 fsync_every: int = 20, fsync_interval: float = 2.0):
+        self.run_id = run_id
+        self.directory = directory
+        self.path = os.path.join(directory, f"{run_id}.jsonl")
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._file = None
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    @staticmethod
+    def new_run_id() -> str:
+        """새 run ID 생성 (시각 + 임의 접미사)"""
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+    @staticmethod
+    def latest_unfinished_run(directory: str = "./checkpoints", url: Optional[str] = None) -> Optional[str]:
+        """
+        완료되지 않은 가장 최근 run ID 반환
+
+        Args:
+            directory: 저널 경로
+            url: 시작 기록의 단지 URL이 같은 저널만 대상 (None이면 전체)
+
+        완료 여부는 마지막 줄, URL은 첫 줄만 읽어 확인 (저널 전체 재생 없음)
+        """
+        if not os.path.isdir(directory):
+            return None
+        candidates = []
+        for name in os.listdir(directory):
+            if name.endswith(".jsonl"):
+                path = os.path.join(directory, name)
+                candidates.append((os.path.getmtime(path), name[:-len(".jsonl")], path))
+        for _mtime, run_id, path in sorted(candidates, reverse=True):
+            try:
+                first, last = _edge_entries(path)
+            except OSError:
+                continue
+            if last.get("type") == "done":
+                continue
+            if url is not None and (first.get("meta") or {}).get("url") != url:
+                continue
+            return run_id
+        return None
+
+    def open(self):
+        """저널 파일 열기 (이어쓰기)"""
+        if self._file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+            self._last_sync = time.monotonic()
+
+    def _append(self, entry: Dict, force_sync: bool = False):
+        """한 줄 기록 후 배치 조건 충족 시 fsync"""
+        if self._file is None:
+            self.open()
+        entry["ts"] = round(time.time(), 3)
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._pending += 1
+        if (force_sync or self._pending >= self.fsync_every
+                or time.monotonic() - self._last_sync >= self.fsync_interval):
+            self.sync()
+
+    def sync(self):
+        """버퍼 flush + fsync (커밋 지점)"""
+        if self._file is None or self._pending == 0:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def record_start(self, meta: Dict):
+        """크롤링 시작 메타 정보 기록"""
+        self._append({"type": "start", "run_id": self.run_id, "meta": meta}, force_sync=True)
+
+    def record_article(self, position: int, article_id: Optional[str], record: Dict[str, str]):
+        """매물 1건 완료 기록"""
+        self._append({
+            "type": "article",
+            "position": position,
+            "article_id": article_id,
+            "record": record,
+        })
+
+    def record_page(self, page: int, trade_type: Optional[str] = None):
+        """리스트 페이지 완료 기록 (거래유형별 페이지는 trade_type 포함)"""
+        entry = {"type": "page", "page": page}
+        if trade_type:
+            entry["trade_type"] = trade_type
+        self._append(entry, force_sync=True)
+
+    def record_done(self, total: int):
+        """크롤링 정상 완료 기록"""
+        self._append({"type": "done", "total": total}, force_sync=True)
+
+    def close(self):
+        """저널 닫기 (남은 버퍼 fsync)"""
+        if self._file is None:
+            return
+        self.sync()
+        self._file.close()
+        self._file = None
+
+    def replay(self) -> CheckpointState:
+        """저널을 재생하여 마지막 커밋 위치까지의 상태 복원"""
+        state = CheckpointState()
+        if not os.path.exists(self.path):
+            return state
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # 크래시로 잘린 마지막 줄은 무시
+                    continue
+                kind = entry.get("type")
+                if kind == "start":
+                    state.meta = entry.get("meta") or {}
+                    state.finished = False
+                elif kind == "article":
+                    article_id = entry.get("article_id")
+                    if article_id and article_id in state.article_ids:
+                        continue
+                    if article_id:
+                        state.article_ids.add(article_id)
+                    state.records.append(entry.get("record") or {})
+                    state.last_position = max(state.last_position, int(entry.get("position", -1)))
+                elif kind == "page":
+                    trade_type = entry.get("trade_type")
+                    if trade_type:
+                        state.completed_trade_pages.setdefault(trade_type, set()).add(int(entry.get("page", 0)))
+                    else:
+                        state.completed_pages.add(int(entry.get("page", 0)))
+                elif kind == "done":
+                    state.finished = True
+        return state
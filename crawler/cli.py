@@ -0,0 +1,362 @@
+"""
+헤드리스 명령줄 진입점 (python -m crawler)
+Qt 없이 NaverEstateCrawler를 실행하고 매물을 JSON Lines로 stdout에 스트리밍
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+from crawler.context_pool import STANDBY_MODES
+from crawler.list_capture import DEFAULT_MEMORY_MB
+from utils.dedup import GROUP_FIELD, DuplicateGrouper
+
+# 종료 코드
+EXIT_OK = 0
+EXIT_PARTIAL = 1
+EXIT_USAGE = 2
+EXIT_FAILED = 3
+EXIT_INTERRUPTED = 130
+
+RECORD_FIELDS = ['complex_id', '매물번호', '거래유형', '동', '가격', '면적', '층수']
+TRADE_TYPES = ['A1', 'B1', 'B2']
+
+
+class RecordSink:
+    """매물 레코드 출력 대상 (stdout JSONL + 선택 파일)"""
+
+    def __init__(self, stream: bool = True, output: Optional[str] = None,
+                 fields: Optional[List[str]] = None):
+        self.stream = stream
+        self.output = output
+        self.count = 0
+        self._buffer: List[Dict[str, str]] = []
+        self._file = None
+        self._csv_writer = None
+        self._format = self._detect_format(output) if output else None
+
+        if self._format == "jsonl":
+            self._file = open(output, "w", encoding="utf-8")
+        elif self._format == "csv":
+            self._file = open(output, "w", newline="", encoding="utf-8-sig")
+            self._csv_writer = csv.DictWriter(self._file, fieldnames=fields or RECORD_FIELDS,
+                                              extrasaction="ignore")
+            self._csv_writer.writeheader()
+
+    @staticmethod
+    def _detect_format(path: str) -> str:
+        """확장자로 출력 형식 결정"""
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".xlsx":
+            return "xlsx"
+        if ext == ".csv":
+            return "csv"
+        return "jsonl"
+
+    def write(self, record: Dict[str, str]):
+        """레코드 1건 즉시 기록"""
+        self.count += 1
+        if self.stream:
+            sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+        if self._format == "jsonl":
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._file.flush()
+        elif self._format == "csv":
+            self._csv_writer.writerow(record)
+            self._file.flush()
+        elif self._format == "xlsx":
+            # 엑셀은 스트리밍 불가: 종료 시 일괄 저장
+            self._buffer.append(record)
+
+    def close(self) -> bool:
+        """파일 닫기 (엑셀 싱크는 이 시점에만 openpyxl 로드)"""
+        if self._file:
+            self._file.close()
+            self._file = None
+        if self._format == "xlsx" and self._buffer:
+            from utils.excel_exporter import save_to_excel
+            return save_to_excel(self._buffer, self.output)
+        return True
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령줄 인자 정의"""
+    parser = argparse.ArgumentParser(
+        prog="python -m crawler",
+        description="네이버 부동산 매물 헤드리스 크롤러 (JSON Lines 스트리밍 출력)",
+    )
+    parser.add_argument("complexes", nargs="*", metavar="COMPLEX",
+                        help="단지 ID 또는 단지 URL (여러 개 가능, 단지 탐색 옵션과 함께 사용 가능)")
+    parser.add_argument("--discover-cortar", action="append", default=[], metavar="CODE",
+                        help="법정동/구/시 코드 하위의 모든 단지를 탐색해 수집 대상에 추가")
+    parser.add_argument("--discover-bbox", action="append", default=[], metavar="S,W,N,E",
+                        help="위경도 영역(남,서,북,동) 안의 모든 단지를 탐색해 수집 대상에 추가")
+    parser.add_argument("--discover-only", action="store_true",
+                        help="탐색한 단지 목록만 stdout JSONL로 출력하고 종료")
+    parser.add_argument("--discovery-cache", default="./cache/discovery",
+                        help="단지 탐색 결과 캐시 경로 (빈 문자열이면 캐시 안 함)")
+    parser.add_argument("--discovery-ttl", type=float, default=86400.0,
+                        help="단지 탐색 캐시 유효 시간(초)")
+    parser.add_argument("--mode", choices=["dom", "api"], default="api",
+                        help="수집 방식 (기본: api)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="동시에 수집할 단지 수 (기본: 1)")
+    parser.add_argument("--detail-concurrency", type=int, default=4,
+                        help="단지별 상세 요청 동시 실행 수 (기본: 4, dom 모드는 상세 조회 탭 수)")
+    parser.add_argument("--trade-types", nargs="+", choices=TRADE_TYPES, default=["A1"],
+                        help="거래유형 (A1 매매, B1 전세, B2 월세). api 모드는 한 세션에서 병렬 수집")
+    parser.add_argument("--filter", dest="filters", action="append", default=[], metavar="KEY=VALUE",
+                        help="list 요청에 추가할 필터 (여러 번 지정 가능, 값은 JSON으로 해석 시도)")
+    parser.add_argument("-o", "--output", default=None,
+                        help="추가 출력 파일 (.jsonl/.csv/.xlsx)")
+    parser.add_argument("--no-stream", action="store_true",
+                        help="stdout JSONL 스트리밍 비활성화")
+    parser.add_argument("--summary", default=None,
+                        help="요약 JSON 저장 경로 (기본: stderr 마지막 줄)")
+    parser.add_argument("--dedup", action="store_true",
+                        help="중복 매물(여러 중개사 등록)에 그룹 ID 부여 ('그룹' 필드)")
+    parser.add_argument("--price-tolerance", type=float, default=0.01,
+                        help="중복 판정 가격 허용 오차 비율 (기본: 0.01)")
+    parser.add_argument("--transport", choices=["browser", "http"], default="browser",
+                        help="JSON API 전송 (http: 브라우저 쿠키를 공유하는 httpx 직접 요청, httpx 필요)")
+    parser.add_argument("--deadline", type=float, default=None, metavar="SEC",
+                        help="단지별 시간 제한 (초과 시 수집한 매물까지만 저장하고 종료, resume으로 이어서 수집)")
+    parser.add_argument("--min-wait", type=float, default=1.0)
+    parser.add_argument("--max-wait", type=float, default=3.0)
+    parser.add_argument("--headed", action="store_true", help="브라우저 창 표시")
+    parser.add_argument("--resume", action="store_true", help="체크포인트에서 재개")
+    parser.add_argument("--checkpoint-dir", default="./checkpoints")
+    parser.add_argument("--building-index", default="./building_index", metavar="DIR",
+                        help="단지별 동/층 색인 경로 (확인된 층수 재사용으로 상세 요청 절감, 빈 값이면 사용 안 함)")
+    parser.add_argument("--standby", choices=list(STANDBY_MODES), default="page",
+                        help="page/context 종료 시 교체할 대기 항목 (page: 같은 컨텍스트 대기 탭, "
+                             "context: + 쿠키를 복사한 별도 브라우저 컨텍스트)")
+    parser.add_argument("--list-memory-mb", type=float, default=DEFAULT_MEMORY_MB, metavar="MB",
+                        help=f"페이지에서 캡처한 list 응답 보관 메모리 상한 (기본: {DEFAULT_MEMORY_MB:g}MB)")
+    parser.add_argument("--list-archive", default=None, metavar="DIR",
+                        help="캡처한 list 응답 원본을 실행별 gzip JSONL로 보관할 경로 (기본: 보관 안 함)")
+    parser.add_argument("--profile-dir", default="./playwright_data",
+                        help="Chrome 프로필 경로 (동시 실행 시 작업자별 접미사 추가)")
+    parser.add_argument("--land-base-url", default="https://new.land.naver.com",
+                        help="new.land 기본 URL (로컬 픽스처 서버 지정용)")
+    parser.add_argument("--fin-base-url", default="https://fin.land.naver.com",
+                        help="fin.land 기본 URL (로컬 픽스처 서버 지정용)")
+    parser.add_argument("--channel", default="chrome",
+                        help="브라우저 채널 (빈 문자열이면 Playwright 기본 Chromium)")
+    parser.add_argument("--replay-har", default=None,
+                        help="네트워크 대신 HAR 파일 응답으로 재생 (api_floor_crawler.py 녹화본)")
+    parser.add_argument("--trace", action="store_true",
+                        help="단계별 스팬 요약 출력 + ./traces/<run_id>.trace.json 저장 (Chrome trace)")
+    parser.add_argument("--debug", action="store_true",
+                        help="API 응답 본문 미리보기 로그 출력 (-v와 함께 사용)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="크롤러 로그를 stderr로 출력")
+    return parser
+
+
+def parse_filters(values: List[str]) -> Dict:
+    """KEY=VALUE 목록 → list 요청 필터 (값은 JSON 우선, 실패 시 문자열)"""
+    filters = {}
+    for item in values:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise ValueError(f"필터 형식 오류: {item} (KEY=VALUE)")
+        try:
+            filters[key] = json.loads(value)
+        except ValueError:
+            filters[key] = value
+    return filters
+
+
+async def discover_complexes(args: argparse.Namespace) -> List[Dict]:
+    """--discover-cortar/--discover-bbox 영역의 단지 목록 (단지 ID 중복 제거)"""
+    from crawler.discovery import ComplexDiscovery, DiscoveryCache, parse_bbox
+
+    def log(message: str):
+        if args.verbose:
+            sys.stderr.write(message + "\n")
+
+    discovery = ComplexDiscovery(
+        base_url=args.land_base_url,
+        concurrency=max(1, args.detail_concurrency),
+        cache=DiscoveryCache(args.discovery_cache, args.discovery_ttl) if args.discovery_cache else None,
+        log_callback=log,
+    )
+    found: Dict[str, Dict] = {}
+    for code in args.discover_cortar:
+        for complex_info in await discovery.discover_cortar(code):
+            found.setdefault(complex_info["complex_id"], complex_info)
+    for value in args.discover_bbox:
+        for complex_info in await discovery.discover_bbox(parse_bbox(value)):
+            found.setdefault(complex_info["complex_id"], complex_info)
+    return list(found.values())
+
+
+def normalize_complex(value: str, land_base_url: str = "https://new.land.naver.com") -> str:
+    """단지 ID 또는 URL을 단지 URL로 변환"""
+    value = value.strip()
+    if value.isdigit():
+        return f"{land_base_url.rstrip('/')}/complexes/{value}"
+    return value
+
+
+async def run_crawls(args: argparse.Namespace, sink: RecordSink,
+                     grouper: Optional[DuplicateGrouper] = None) -> List[Dict]:
+    """단지별 크롤러를 동시 실행 (작업자 수 = concurrency)"""
+    from crawler.naver_crawler import NaverEstateCrawler
+
+    urls = [normalize_complex(c, args.land_base_url) for c in args.complexes]
+    workers = max(1, min(args.concurrency, len(urls)))
+    slots: asyncio.Queue = asyncio.Queue()
+    for slot in range(workers):
+        slots.put_nowait(slot)
+
+    def log(message: str):
+        if args.verbose:
+            sys.stderr.write(message + "\n")
+
+    async def run_one(url: str) -> Dict:
+        slot = await slots.get()
+        started = time.monotonic()
+        crawler = None
+        try:
+            profile_dir = args.profile_dir if workers == 1 else f"{args.profile_dir}_{slot}"
+            complex_id = None
+
+            def on_found(record: Dict[str, str]):
+                record = dict(record, complex_id=complex_id)
+                if grouper is not None:
+                    record[GROUP_FIELD] = grouper.add(record)
+                sink.write(record)
+
+            crawler = NaverEstateCrawler(
+                url=url,
+                log_callback=log,
+                property_found_callback=on_found,
+                min_wait=args.min_wait,
+                max_wait=args.max_wait,
+                headless=not args.headed,
+                resume=args.resume,
+                checkpoint_dir=args.checkpoint_dir,
+                mode=args.mode,
+                concurrency=args.detail_concurrency,
+                user_data_dir=profile_dir,
+                land_base_url=args.land_base_url,
+                fin_base_url=args.fin_base_url,
+                browser_channel=args.channel or None,
+                replay_har=args.replay_har,
+                trace=args.trace,
+                debug=args.debug,
+                trade_types=args.trade_types,
+                list_filters=args.list_filters,
+                deadline=args.deadline,
+                transport=args.transport,
+                building_index_dir=args.building_index or None,
+                standby=args.standby,
+                list_memory_mb=args.list_memory_mb,
+                list_archive_dir=args.list_archive,
+            )
+            complex_id = crawler.complex_id
+            await crawler.crawl()
+            ok = crawler.finished
+            error = None
+        except Exception as e:
+            ok = False
+            error = str(e)
+        finally:
+            slots.put_nowait(slot)
+        return {
+            "complex_id": crawler.complex_id if crawler else None,
+            "url": url,
+            "ok": ok,
+            "records": len(crawler.results) if crawler else 0,
+            "run_id": crawler.run_id if crawler else None,
+            "elapsed_sec": round(time.monotonic() - started, 3),
+            "metrics": crawler.metrics.snapshot() if crawler else None,
+            "deadline_reached": crawler.deadline_reached if crawler else False,
+            "peak_rss_bytes": crawler.peak_rss if crawler else None,
+            "error": error,
+        }
+
+    return await asyncio.gather(*(run_one(url) for url in urls))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI 메인 함수 (종료 코드 반환)"""
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return EXIT_USAGE if e.code else EXIT_OK
+    try:
+        args.list_filters = parse_filters(args.filters)
+    except ValueError as e:
+        sys.stderr.write(f"{e}\n")
+        return EXIT_USAGE
+
+    if args.discover_cortar or args.discover_bbox:
+        try:
+            discovered = asyncio.run(discover_complexes(args))
+        except ValueError as e:
+            sys.stderr.write(f"{e}\n")
+            return EXIT_USAGE
+        except KeyboardInterrupt:
+            return EXIT_INTERRUPTED
+        if args.discover_only:
+            for complex_info in discovered:
+                sys.stdout.write(json.dumps(complex_info, ensure_ascii=False) + "\n")
+            return EXIT_OK if discovered else EXIT_FAILED
+        known = set(args.complexes)
+        args.complexes += [c["complex_id"] for c in discovered if c["complex_id"] not in known]
+    if not args.complexes:
+        sys.stderr.write("수집할 단지가 없습니다 (COMPLEX 또는 --discover-* 지정)\n")
+        return EXIT_USAGE
+
+    started = time.monotonic()
+    grouper = DuplicateGrouper(args.price_tolerance) if args.dedup else None
+    fields = RECORD_FIELDS + [GROUP_FIELD] if args.dedup else RECORD_FIELDS
+    sink = RecordSink(stream=not args.no_stream, output=args.output, fields=fields)
+    interrupted = False
+    fatal_error = None
+    complexes: List[Dict] = []
+    try:
+        complexes = asyncio.run(run_crawls(args, sink, grouper))
+    except KeyboardInterrupt:
+        interrupted = True
+    except Exception as e:
+        fatal_error = str(e)
+    finally:
+        saved = sink.close()
+
+    failed = [c for c in complexes if not c["ok"]]
+    if interrupted:
+        code = EXIT_INTERRUPTED
+    elif fatal_error or (complexes and len(failed) == len(complexes)):
+        code = EXIT_FAILED
+    elif failed or not saved:
+        code = EXIT_PARTIAL
+    else:
+        code = EXIT_OK
+
+    summary = {
+        "type": "summary",
+        "exit_code": code,
+        "records": sink.count,
+        "unique_records": grouper.group_count if grouper else None,
+        "complexes": complexes,
+        "output": args.output,
+        "output_saved": saved,
+        "error": fatal_error,
+        "elapsed_sec": round(time.monotonic() - started, 3),
+    }
+    text = json.dumps(summary, ensure_ascii=False)
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    sys.stderr.write(text + "\n")
+    return code
@@ -0,0 +1,137 @@
+"""
+대기(standby) 컨텍스트 풀
+주 컨텍스트 옆에 단지 페이지까지 미리 진입한 대기 페이지(같은 컨텍스트)와
+선택적으로 대기 컨텍스트(별도 브라우저, 주 컨텍스트 쿠키 복사)를 1개씩 유지
+page/context 종료 시 재실행 + 워밍업 대신 대기 항목으로 즉시 교체하고, 빈 자리는 백그라운드에서 다시 채움
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+# 대기 항목 종류
+STANDBY_MODES = ("off", "page", "context")
+
+
+class Standby:
+    """예열된 대기 페이지 (kind가 context면 별도 컨텍스트 소유)"""
+
+    __slots__ = ("kind", "context", "page", "alive")
+
+    def __init__(self, kind: str, context, page):
+        self.kind = kind
+        self.context = context
+        self.page = page
+        self.alive = True
+        page.on("close", self._on_closed)
+        if kind == "context":
+            context.on("close", self._on_closed)
+
+    def _on_closed(self, *_):
+        self.alive = False
+
+    def usable(self) -> bool:
+        try:
+            return self.alive and not self.page.is_closed()
+        except Exception:
+            return False
+
+    async def close(self):
+        self.alive = False
+        target = self.context if self.kind == "context" else self.page
+        try:
+            await target.close()
+        except Exception:
+            pass
+
+
+class ContextPool:
+    """대기 페이지/컨텍스트 보충 및 교체"""
+
+    def __init__(self,
+                 prepare: Callable[[object], Awaitable[bool]],
+                 new_context: Optional[Callable[[object], Awaitable[object]]] = None,
+                 log: Callable[[str], None] = print):
+        """
+        Args:
+            prepare: 새 페이지를 단지 페이지까지 진입시키는 코루틴 (실패 시 False)
+            new_context: 주 컨텍스트 → 쿠키를 복사한 대기 컨텍스트 생성 코루틴 (None이면 대기 페이지만)
+            log: 로그 함수
+        """
+        self._prepare = prepare
+        self._new_context = new_context
+        self._log = log
+        self._page: Optional[Standby] = None
+        self._context: Optional[Standby] = None
+        self._refill_task: Optional[asyncio.Task] = None
+        self._refill_primary = None
+        self._closed = False
+
+    def refill(self, primary):
+        """대기 항목 보충 시작 (같은 주 컨텍스트로 진행 중이면 무시, 주 컨텍스트가 바뀌었으면 새로 시작)"""
+        if self._closed:
+            return
+        task = self._refill_task
+        if task is not None and not task.done():
+            if self._refill_primary is primary:
+                return
+            task.cancel()
+        self._refill_primary = primary
+        self._refill_task = asyncio.ensure_future(self._refill(primary))
+
+    async def _refill(self, primary):
+        try:
+            if self._page is None or not self._page.usable():
+                page = await primary.new_page()
+                self._page = await self._warm(Standby("page", primary, page))
+            if self._new_context is not None and (self._context is None or not self._context.usable()):
+                context = await self._new_context(primary)
+                page = await context.new_page()
+                self._context = await self._warm(Standby("context", context, page))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._log(f"⚠ 대기 컨텍스트 준비 실패: {e}")
+
+    async def _warm(self, standby: Standby) -> Optional[Standby]:
+        """단지 페이지 진입 (실패하거나 그 사이 풀이 닫혔으면 폐기)"""
+        try:
+            if await self._prepare(standby.page) and not self._closed and standby.usable():
+                return standby
+        except BaseException:
+            await standby.close()
+            raise
+        await standby.close()
+        return None
+
+    def take(self, context_lost: bool = False) -> Optional[Standby]:
+        """
+        사용 가능한 대기 항목 꺼내기 (await 없이 교체하므로 다른 작업과 경합 없음)
+
+        Args:
+            context_lost: 주 컨텍스트 자체가 종료됨 (같은 컨텍스트의 대기 페이지는 사용 불가)
+
+        Returns:
+            대기 항목 (없으면 None → 호출 측에서 재실행 복구)
+        """
+        if not context_lost and self._page is not None and self._page.usable():
+            standby, self._page = self._page, None
+            return standby
+        if self._context is not None and self._context.usable():
+            standby, self._context = self._context, None
+            return standby
+        return None
+
+    async def close(self):
+        """보충 작업 취소 + 대기 항목 종료"""
+        self._closed = True
+        task, self._refill_task = self._refill_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except BaseException:
+                pass
+        for standby in (self._page, self._context):
+            if standby is not None:
+                await standby.close()
+        self._page = self._context = None
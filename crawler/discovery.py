@@ -0,0 +1,290 @@
+"""
+지역 단위 단지 탐색
+법정동 코드(하위 지역 재귀) 또는 위경도 영역(타일 분할)으로 단지 목록을 병렬 수집
+밀집 타일은 4분할, 단지 ID 중복 제거, 결과는 디스크 캐시 (배치 크롤러 입력용)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from utils import fastjson
+
+REGION_LIST_PATH = "/api/regions/list"
+REGION_COMPLEXES_PATH = "/api/regions/complexes"
+MARKERS_PATH = "/api/complexes/single-markers/2.0"
+
+# south, west, north, east
+BBox = Tuple[float, float, float, float]
+
+
+def parse_bbox(value: str) -> BBox:
+    """"남,서,북,동" 문자열 → 영역 (위도/경도 순서 검증)"""
+    parts = [float(p) for p in value.split(",")]
+    if len(parts) != 4:
+        raise ValueError(f"영역 형식 오류: {value} (south,west,north,east)")
+    south, west, north, east = parts
+    if south >= north or west >= east:
+        raise ValueError(f"영역 범위 오류: {value}")
+    return south, west, north, east
+
+
+class DiscoveryCache:
+    """탐색 결과 디스크 캐시 (키별 JSON 파일, TTL 경과 시 무효)"""
+
+    def __init__(self, directory: str = "./cache/discovery", ttl: float = 86400.0):
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get("key") != key or time.time() - cached.get("saved_at", 0) > self.ttl:
+            return None
+        return cached.get("complexes") or []
+
+    def put(self, key: str, complexes: List[Dict]):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "saved_at": time.time(), "complexes": complexes}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+class ComplexDiscovery:
+    """new.land 지역/마커 API 기반 단지 탐색기"""
+
+    def __init__(self, base_url: str = "https://new.land.naver.com",
+                 concurrency: int = 4,
+                 tile_size: float = 0.02,
+                 tile_limit: int = 50,
+                 max_depth: int = 6,
+                 real_estate_type: str = "APT:ABYG:JGC",
+                 cache: Optional[DiscoveryCache] = None,
+                 headers: Optional[Dict[str, str]] = None,
+                 log_callback: Optional[Callable] = None,
+                 min_wait: float = 0.0,
+                 max_retries: int = 3):
+        """
+        Args:
+            base_url: new.land 기본 URL (로컬 픽스처 서버 지정 가능)
+            concurrency: 동시 요청 수
+            tile_size: 영역 탐색 초기 타일 크기 (도)
+            tile_limit: 마커 응답이 이 건수 이상이면 밀집 타일로 보고 4분할
+            max_depth: 타일 최대 분할 깊이
+            real_estate_type: 부동산 유형 필터
+            cache: 결과 캐시 (None이면 캐시 없음)
+            headers: 추가 요청 헤더 (인증 토큰 등)
+            log_callback: 로그 콜백
+            min_wait: 요청 간 최소 대기 (초)
+            max_retries: 429/네트워크 오류 재시도 횟수
+        """
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = max(1, concurrency)
+        self.tile_size = tile_size
+        self.tile_limit = tile_limit
+        self.max_depth = max_depth
+        self.real_estate_type = real_estate_type
+        self.cache = cache
+        self.headers = {
+            "Accept": "application/json",
+            "Referer": f"{self.base_url}/",
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            ),
+        }
+        self.headers.update(headers or {})
+        self.log_callback = log_callback
+        self.min_wait = min_wait
+        self.max_retries = max_retries
+        self.stats = {"requests": 0, "failed": 0, "tiles": 0, "subdivided": 0, "regions": 0,
+                      "truncated": 0, "cache_hit": False}
+
+    def _log(self, message: str):
+        if self.log_callback:
+            self.log_callback(message)
+
+    def _get_blocking(self, url: str) -> Tuple[Optional[int], Optional[object], Dict[str, str]]:
+        request = urllib.request.Request(url, headers=self.headers)
+        try:
+            with urllib.request.urlopen(request, timeout=15) as response:
+                return response.status, fastjson.loads(response.read()), dict(response.headers)
+        except urllib.error.HTTPError as e:
+            return e.code, None, dict(e.headers or {})
+        except (urllib.error.URLError, OSError, ValueError):
+            return None, None, {}
+
+    async def _fetch_json(self, path: str, params: Dict) -> Optional[object]:
+        """GET JSON (429는 Retry-After 만큼, 네트워크 오류는 지수 백오프 후 재시도)"""
+        url = f"{self.base_url}{path}?{urlencode(params)}"
+        for attempt in range(self.max_retries + 1):
+            self.stats["requests"] += 1
+            status, data, headers = await asyncio.to_thread(self._get_blocking, url)
+            if status == 200:
+                if self.min_wait:
+                    await asyncio.sleep(self.min_wait)
+                return data
+            if status is not None and status not in (429, 500, 502, 503):
+                break
+            retry_after = headers.get("Retry-After") or headers.get("retry-after")
+            try:
+                wait = float(retry_after) if retry_after else 2 ** attempt
+            except ValueError:
+                wait = 2 ** attempt
+            await asyncio.sleep(min(wait, 30))
+        self.stats["failed"] += 1
+        self._log(f"⚠ 탐색 요청 실패: {url}")
+        return None
+
+    @staticmethod
+    def _normalize(item: Dict, cortar_no: Optional[str] = None) -> Optional[Dict]:
+        """지역/마커 응답 항목 → 단지 정보"""
+        complex_id = item.get("complexNo") or item.get("markerId")
+        if not complex_id:
+            return None
+        return {
+            "complex_id": str(complex_id),
+            "name": item.get("complexName") or "",
+            "lat": item.get("latitude"),
+            "lon": item.get("longitude"),
+            "cortar_no": item.get("cortarNo") or cortar_no or "",
+            "households": item.get("totalHouseholdCount"),
+        }
+
+    async def _run_pool(self, initial: List, handler: Callable) -> Dict[str, Dict]:
+        """작업 큐 + 작업자 풀 (handler가 반환한 하위 작업은 다시 큐에 추가)"""
+        found: Dict[str, Dict] = {}
+        queue: asyncio.Queue = asyncio.Queue()
+        for job in initial:
+            queue.put_nowait(job)
+
+        async def worker():
+            while True:
+                job = await queue.get()
+                try:
+                    children, complexes = await handler(job)
+                    for child in children:
+                        queue.put_nowait(child)
+                    for complex_info in complexes:
+                        # 타일 경계/지역 중복 응답은 첫 결과 유지
+                        found.setdefault(complex_info["complex_id"], complex_info)
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    self._log(f"⚠ 탐색 작업 오류: {e}")
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return found
+
+    async def _handle_region(self, cortar_no: str) -> Tuple[List[str], List[Dict]]:
+        """하위 지역이 있으면 하위 지역 작업, 없으면(법정동) 단지 목록 반환"""
+        self.stats["regions"] += 1
+        data = await self._fetch_json(REGION_LIST_PATH, {"cortarNo": cortar_no})
+        children = [r.get("cortarNo") for r in (data or {}).get("regionList") or [] if r.get("cortarNo")]
+        children = [c for c in children if c != cortar_no]
+        if children:
+            return children, []
+        data = await self._fetch_json(REGION_COMPLEXES_PATH, {
+            "cortarNo": cortar_no, "realEstateType": self.real_estate_type, "order": "",
+        })
+        complexes = [self._normalize(c, cortar_no) for c in (data or {}).get("complexList") or []]
+        return [], [c for c in complexes if c]
+
+    async def _handle_tile(self, job: Tuple[BBox, int]) -> Tuple[List[Tuple[BBox, int]], List[Dict]]:
+        """타일 1개 마커 조회 (응답이 잘렸으면 4분할 후 하위 타일 작업 반환)"""
+        (south, west, north, east), depth = job
+        self.stats["tiles"] += 1
+        data = await self._fetch_json(MARKERS_PATH, {
+            "zoom": 16, "realEstateType": self.real_estate_type,
+            "leftLon": west, "rightLon": east, "topLat": north, "bottomLat": south,
+        })
+        markers = data if isinstance(data, list) else []
+        if len(markers) >= self.tile_limit and depth < self.max_depth:
+            self.stats["subdivided"] += 1
+            mid_lat, mid_lon = (south + north) / 2, (west + east) / 2
+            return [
+                ((south, west, mid_lat, mid_lon), depth + 1),
+                ((south, mid_lon, mid_lat, east), depth + 1),
+                ((mid_lat, west, north, mid_lon), depth + 1),
+                ((mid_lat, mid_lon, north, east), depth + 1),
+            ], []
+        if len(markers) >= self.tile_limit:
+            # 최대 분할 깊이에서도 잘린 타일은 누락 단지가 있을 수 있음
+            self.stats["truncated"] += 1
+            self._log(f"⚠ 최대 분할 깊이에서도 마커 {len(markers)}개로 잘린 타일: "
+                      f"{south:.5f},{west:.5f},{north:.5f},{east:.5f}")
+        complexes = [self._normalize(m) for m in markers if m.get("markerType", "COMPLEX") == "COMPLEX"]
+        return [], [c for c in complexes if c]
+
+    def _tiles(self, bbox: BBox) -> List[Tuple[BBox, int]]:
+        """영역을 tile_size 격자로 분할"""
+        south, west, north, east = bbox
+        tiles = []
+        lat = south
+        while lat < north:
+            lon = west
+            next_lat = min(north, lat + self.tile_size)
+            while lon < east:
+                next_lon = min(east, lon + self.tile_size)
+                tiles.append(((lat, lon, next_lat, next_lon), 0))
+                lon = next_lon
+            lat = next_lat
+        return tiles
+
+    async def _cached(self, key: str, run: Callable) -> List[Dict]:
+        if self.cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats["cache_hit"] = True
+                self._log(f"단지 탐색 캐시 사용: {key} ({len(cached)}개)")
+                return cached
+        started = time.monotonic()
+        self.stats = dict.fromkeys(self.stats, 0)
+        self.stats["cache_hit"] = False
+        found = await run()
+        complexes = sorted(found.values(), key=lambda c: c["complex_id"])
+        self._log(
+            f"단지 탐색 완료: {key} → {len(complexes)}개 "
+            f"(요청 {self.stats['requests']}, 타일 {self.stats['tiles']}, 분할 {self.stats['subdivided']}, "
+            f"지역 {self.stats['regions']}, {time.monotonic() - started:.1f}s)"
+        )
+        # 실패한 요청이나 잘린 타일이 있으면 불완전한 결과이므로 캐시하지 않음
+        if self.cache and not self.stats["failed"] and not self.stats["truncated"]:
+            self.cache.put(key, complexes)
+        return complexes
+
+    async def discover_cortar(self, cortar_no: str) -> List[Dict]:
+        """법정동/구/시 코드 하위의 모든 단지"""
+        return await self._cached(
+            f"cortar:{cortar_no}:{self.real_estate_type}",
+            lambda: self._run_pool([cortar_no], self._handle_region),
+        )
+
+    async def discover_bbox(self, bbox: BBox) -> List[Dict]:
+        """위경도 영역 안의 모든 단지"""
+        key = f"bbox:{','.join(f'{v:.5f}' for v in bbox)}:{self.real_estate_type}:{self.tile_size}"
+        return await self._cached(key, lambda: self._run_pool(self._tiles(bbox), self._handle_tile))
@@ -0,0 +1,153 @@
+"""
+응답 형태 학습 기반 필드 해석기
+list 응답의 매물 배열/다음 페이지 키 경로와 매물 필드 접근자를 응답 형태별로 1회 학습하여 재사용
+(첫 매물의 키 서명이 바뀔 때만 재학습)
+"""
+
+from collections import deque
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+# 필드별 후보 키 (우선순위 순)
+ITEM_FIELDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("article_id", ("articleNumber", "articleNo", "articleId")),
+    ("dong", ("dongName", "dong", "buildingName")),
+    ("price", ("dealOrWarrantPrc", "price", "dealPrice")),
+    ("area", ("area1", "area", "exclusiveArea")),
+    ("floor", ("floor", "floorInfo")),
+    ("total_floor", ("totalFloor", "maxFloor")),
+)
+FIELD_NAMES = tuple(name for name, _keys in ITEM_FIELDS)
+
+LIST_KEYS = ("list", "articleList")
+HAS_MORE_KEYS = ("hasNextPage", "isMoreData", "hasMore")
+
+# 응답 봉투 탐색 깊이 (매물 배열 내부로는 내려가지 않음)
+_MAX_ENVELOPE_DEPTH = 6
+
+Path = Tuple[str, ...]
+Accessor = Callable[[Dict], object]
+
+
+def _compile_accessor(keys: Tuple[str, ...], signature: FrozenSet[str]) -> Accessor:
+    """
+    필드 접근자 생성 (기존 `a or b or c` 체인과 같은 결과, 후보 키는 항상 우선순위 순)
+
+    서명에 최우선 키가 있으면 그 키만 보는 빠른 경로, 값이 비었을 때만 나머지 후보 키 확인
+    """
+    first, rest = keys[0], keys[1:]
+    if first in signature:
+        if not rest:
+            return lambda item: item.get(first)
+
+        def accessor(item: Dict):
+            value = item.get(first)
+            if value:
+                return value
+            for k in rest:
+                value = item.get(k)
+                if value:
+                    return value
+            return None
+        return accessor
+
+    def chain(item: Dict):
+        for k in keys:
+            value = item.get(k)
+            if value:
+                return value
+        return None
+    return chain
+
+
+def _find_paths(data: Dict, key: str) -> List[Tuple[Path, object]]:
+    """봉투(dict 중첩)에서 key 경로 탐색 (얕은 경로 우선, list 내부는 탐색하지 않음)"""
+    results = []
+    queue = deque([((), data)])
+    while queue:
+        path, node = queue.popleft()
+        for k, v in node.items():
+            if k == key:
+                results.append((path + (k,), v))
+            if isinstance(v, dict) and len(path) < _MAX_ENVELOPE_DEPTH:
+                queue.append((path + (k,), v))
+    return results
+
+
+def _get_path(data: Dict, path: Path):
+    node = data
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
+class FieldResolver:
+    """list 응답 형태/매물 필드 해석기 (형태별 학습 결과 캐시)"""
+
+    def __init__(self):
+        self._list_path: Optional[Path] = None
+        self._has_more_path: Optional[Path] = None
+        self._signature: Optional[FrozenSet[str]] = None
+        self._accessors: Tuple[Accessor, ...] = ()
+        self.learn_count = 0
+
+    def _learn_list_path(self, data: Dict) -> Optional[Path]:
+        fallback = None
+        for key in LIST_KEYS:
+            for path, value in _find_paths(data, key):
+                if isinstance(value, list):
+                    if value:
+                        return path
+                    fallback = fallback or path
+        return fallback
+
+    def _learn_has_more_path(self, data: Dict) -> Optional[Path]:
+        for key in HAS_MORE_KEYS:
+            for path, value in _find_paths(data, key):
+                if isinstance(value, bool):
+                    return path
+        return None
+
+    def list_page(self, data: Dict) -> Tuple[List[Dict], Optional[bool]]:
+        """list 응답에서 매물 배열과 다음 페이지 여부 추출 (학습된 경로가 맞지 않으면 재학습)"""
+        if not isinstance(data, dict):
+            return [], None
+        items = _get_path(data, self._list_path) if self._list_path else None
+        if not isinstance(items, list) or not items:
+            path = self._learn_list_path(data)
+            if path is not None:
+                self._list_path = path
+                items = _get_path(data, path)
+        has_more = _get_path(data, self._has_more_path) if self._has_more_path else None
+        if not isinstance(has_more, bool):
+            self._has_more_path = self._learn_has_more_path(data)
+            has_more = _get_path(data, self._has_more_path) if self._has_more_path else None
+        return [item for item in (items or []) if isinstance(item, dict)], has_more
+
+    def _ensure_accessors(self, sample: Dict):
+        signature = frozenset(sample)
+        if signature == self._signature:
+            return
+        self._signature = signature
+        self._accessors = tuple(_compile_accessor(keys, signature) for _name, keys in ITEM_FIELDS)
+        self.learn_count += 1
+
+    def resolve_items(self, items: List[Dict]) -> List[Tuple]:
+        """
+        매물 목록 → 필드 값 튜플 목록 (FIELD_NAMES 순서)
+
+        첫 매물 서명으로 접근자를 준비한 뒤 목록 전체에 한 번에 적용
+        """
+        if not items:
+            return []
+        self._ensure_accessors(items[0])
+        article_id, dong, price, area, floor, total_floor = self._accessors
+        return [
+            (article_id(item), dong(item), price(item), area(item), floor(item), total_floor(item))
+            for item in items
+        ]
+
+    def resolve_item(self, item: Dict) -> Tuple:
+        """매물 1건 필드 값 튜플"""
+        return self.resolve_items([item])[0]
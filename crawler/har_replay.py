@@ -0,0 +1,133 @@
+"""
+HAR 재생 (api_floor_crawler.py 녹화 파일 기반)
+context.request / 페이지 요청을 네트워크 대신 HAR 응답으로 처리하여 결정적 재실행
+"""
+
+import json
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from utils.har_stream import decode_content, iter_har_entries
+
+# HAR 본문은 이미 디코딩된 상태이므로 전송 관련 헤더는 제외
+_SKIP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def canonical_body(body: Optional[object]) -> str:
+    """요청 본문 정규화 (JSON이면 키 정렬)"""
+    if body is None:
+        return ""
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    if not isinstance(body, str):
+        return json.dumps(body, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    text = body.strip()
+    if not text:
+        return ""
+    try:
+        return json.dumps(json.loads(text), ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        return text
+
+
+class HarResponse:
+    """HAR 응답 1건 (본문 base64는 사용 시점에 디코딩)"""
+
+    def __init__(self, status: int, headers: List[Dict], content: Dict):
+        self.status = status
+        self.headers = {
+            h.get("name", "").lower(): h.get("value", "")
+            for h in headers or []
+            if h.get("name", "").lower() not in _SKIP_HEADERS
+        }
+        self.mime_type = content.get("mimeType", "")
+        self._content = {"text": content.get("text") or "", "encoding": content.get("encoding")}
+        self._body: Optional[bytes] = None
+
+    @property
+    def body(self) -> bytes:
+        if self._body is None:
+            self._body = decode_content(self._content)
+            self._content = None
+        return self._body
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+
+class HarReplay:
+    """method/URL/body 기준 HAR 응답 조회 + 미일치 요청 기록"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._exact: Dict[Tuple[str, str, str], Deque[HarResponse]] = {}
+        self._by_url: Dict[Tuple[str, str], Deque[HarResponse]] = {}
+        self.entries = 0
+        self.hits = 0
+        self.fuzzy_hits = 0
+        self.unmatched: List[Tuple[str, str]] = []
+        self._load()
+
+    def _load(self):
+        # 대용량 HAR도 entry 단위로 색인 (본문 base64는 재생 시점에 디코딩)
+        for entry in iter_har_entries(self.path):
+            self.add_entry(entry)
+
+    def add_entry(self, entry: Dict):
+        """HAR entry 1건 색인"""
+        req = entry.get("request") or {}
+        res = entry.get("response") or {}
+        status = res.get("status") or 0
+        if status <= 0:
+            return
+        method = (req.get("method") or "GET").upper()
+        url = req.get("url") or ""
+        body = canonical_body((req.get("postData") or {}).get("text"))
+        response = HarResponse(status, res.get("headers"), res.get("content") or {})
+        self._exact.setdefault((method, url, body), deque()).append(response)
+        self._by_url.setdefault((method, url), deque()).append(response)
+        self.entries += 1
+
+    @staticmethod
+    def _take(queue: Deque[HarResponse]) -> HarResponse:
+        """녹화 순서대로 재생, 마지막 응답은 반복 사용"""
+        if len(queue) > 1:
+            return queue.popleft()
+        return queue[0]
+
+    def lookup(self, method: str, url: str, body: Optional[object] = None) -> Optional[HarResponse]:
+        """method+URL+body 일치 → method+URL 일치 순으로 조회"""
+        method = method.upper()
+        queue = self._exact.get((method, url, canonical_body(body)))
+        if queue:
+            self.hits += 1
+            return self._take(queue)
+        queue = self._by_url.get((method, url))
+        if queue:
+            self.fuzzy_hits += 1
+            return self._take(queue)
+        self.unmatched.append((method, url))
+        return None
+
+    async def handle_route(self, route):
+        """context.route 핸들러: HAR 응답으로 fulfill, 미일치는 404"""
+        request = route.request
+        response = self.lookup(request.method, request.url, request.post_data)
+        if response is None:
+            await route.fulfill(status=404, body="")
+            return
+        await route.fulfill(status=response.status, headers=response.headers, body=response.body)
+
+    def report(self) -> List[str]:
+        """재생 결과 요약 로그"""
+        lines = [
+            f"HAR 재생: entries={self.entries}, 일치={self.hits}, "
+            f"body 불일치(URL 일치)={self.fuzzy_hits}, 미일치={len(self.unmatched)}"
+        ]
+        seen = set()
+        for method, url in self.unmatched:
+            if (method, url) in seen:
+                continue
+            seen.add((method, url))
+            lines.append(f"  미일치: {method} {url}")
+        return lines
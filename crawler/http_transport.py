@@ -0,0 +1,121 @@
+"""
+직접 HTTP 전송 (httpx, 선택 패키지)
+워밍업된 Playwright 컨텍스트의 쿠키를 가져와 JSON API를 Python 클라이언트로 직접 요청
+keep-alive 연결 풀 + HTTP/2(h2 설치 시)로 요청당 브라우저 IPC 왕복 제거
+응답에서 쿠키가 갱신되면 브라우저 컨텍스트에도 반영 (세션 확립/복구는 브라우저가 담당)
+
+설치: pip install "httpx[http2]"
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # 선택 패키지
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+def is_available() -> bool:
+    """httpx 설치 여부"""
+    return httpx is not None
+
+
+class HttpTransport:
+    """Playwright 컨텍스트 쿠키를 공유하는 httpx 비동기 전송"""
+
+    def __init__(self, context, user_agent: str, concurrency: int = 4, timeout: float = 30.0):
+        """
+        Args:
+            context: 쿠키를 가져오고 갱신 쿠키를 되돌려 줄 Playwright BrowserContext
+            user_agent: 브라우저와 같은 User-Agent
+            concurrency: 동시 요청 수 (연결 풀 크기 기준)
+            timeout: 요청 타임아웃 (초)
+        """
+        if httpx is None:
+            raise ImportError("httpx가 설치되어 있지 않습니다 (pip install \"httpx[http2]\")")
+        self.context = context
+        self.http2 = HTTP2_AVAILABLE
+        self._client = httpx.AsyncClient(
+            http2=self.http2,
+            timeout=timeout,
+            follow_redirects=False,
+            limits=httpx.Limits(
+                max_connections=max(4, concurrency * 2),
+                max_keepalive_connections=max(4, concurrency * 2),
+                keepalive_expiry=60.0,
+            ),
+            headers={
+                "User-Agent": user_agent,
+                "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8",
+            },
+        )
+        # 브라우저에 마지막으로 반영한 쿠키 값 ((name, domain, path) → value)
+        self._synced: Dict[Tuple[str, str, str], str] = {}
+        self.cookie_syncs = 0
+
+    async def import_cookies(self) -> int:
+        """브라우저 컨텍스트 쿠키 → httpx 쿠키 저장소 (워밍업/복구 직후 호출, 쿠키 수 반환)"""
+        cookies = await self.context.cookies()
+        self._client.cookies.clear()
+        self._synced.clear()
+        for cookie in cookies:
+            self._client.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+            )
+            self._synced[(cookie["name"], cookie.get("domain", ""), cookie.get("path", "/"))] = cookie["value"]
+        return len(cookies)
+
+    def _rotated_cookies(self) -> List[Dict]:
+        """브라우저에 반영되지 않은 새/변경 쿠키 (Playwright add_cookies 형식)"""
+        changed = []
+        for cookie in self._client.cookies.jar:
+            key = (cookie.name, cookie.domain, cookie.path)
+            if self._synced.get(key) == cookie.value:
+                continue
+            self._synced[key] = cookie.value
+            entry = {
+                "name": cookie.name,
+                "value": cookie.value or "",
+                "domain": cookie.domain,
+                "path": cookie.path or "/",
+                "secure": bool(cookie.secure),
+            }
+            if cookie.expires:
+                entry["expires"] = float(cookie.expires)
+            changed.append(entry)
+        return changed
+
+    async def sync_cookies(self):
+        """httpx 응답으로 갱신된 쿠키를 브라우저 컨텍스트에 반영"""
+        changed = self._rotated_cookies()
+        if changed:
+            await self.context.add_cookies(changed)
+            self.cookie_syncs += 1
+
+    async def fetch(self, method: str, url: str, headers: Dict[str, str],
+                    body: Optional[str] = None) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        요청 1회
+
+        Returns:
+            (status, 응답 헤더(소문자 키), 본문 bytes)
+        """
+        response = await self._client.request(
+            method.upper(), url, headers=headers,
+            content=body.encode("utf-8") if body is not None else None,
+        )
+        if "set-cookie" in response.headers:
+            await self.sync_cookies()
+        return response.status_code, {k.lower(): v for k, v in response.headers.items()}, response.content
+
+    async def close(self):
+        """연결 풀 종료"""
+        await self._client.aclose()
+
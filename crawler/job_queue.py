@@ -0,0 +1,352 @@
+"""
+영속 크롤링 작업 큐 (임대 기반)
+작업 단위: 단지 + 거래유형 + list 페이지 범위
+작업자는 제한 시간 임대로 작업을 가져가고 heartbeat로 연장, 임대가 만료되면 다른 작업자가 회수
+실패 시 지수 백오프 재시도, 시도 한도를 넘으면 dead(보류) 상태
+
+기본 구현은 SQLite (같은 호스트 다중 프로세스, 공유 파일시스템의 다중 호스트)
+다른 저장소는 JobQueue 인터페이스를 구현하여 교체
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+import socket
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+DEAD = "dead"
+JOB_STATES = (PENDING, LEASED, DONE, DEAD)
+
+
+def default_worker_id() -> str:
+    """호스트명:PID 작업자 ID"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class Job:
+    """작업 1건 (단지, 거래유형, 페이지 범위)"""
+
+    def __init__(self, job_id: int, complex_id: str, trade_type: str,
+                 page_start: int = 1, page_end: Optional[int] = None,
+                 options: Optional[Dict] = None):
+        self.id = job_id
+        self.complex_id = complex_id
+        self.trade_type = trade_type
+        self.page_start = page_start
+        self.page_end = page_end
+        # 작업별 크롤러 옵션 (list 필터 등)
+        self.options = dict(options or {})
+        self.state = PENDING
+        self.attempts = 0
+        self.max_attempts = 3
+        self.lease_owner: Optional[str] = None
+        self.lease_expires: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.result: Optional[Dict] = None
+
+    @property
+    def key(self) -> str:
+        """중복 등록 방지 키"""
+        end = "" if self.page_end is None else self.page_end
+        return f"{self.complex_id}:{self.trade_type}:{self.page_start}-{end}"
+
+    @property
+    def run_id(self) -> str:
+        """작업 체크포인트 run ID (재시도/회수 시 이어서 수집)"""
+        return f"job{self.id}_{self.complex_id}_{self.trade_type}"
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "complex_id": self.complex_id,
+            "trade_type": self.trade_type,
+            "page_start": self.page_start,
+            "page_end": self.page_end,
+            "options": self.options,
+            "state": self.state,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "lease_owner": self.lease_owner,
+            "lease_expires": self.lease_expires,
+            "last_error": self.last_error,
+            "result": self.result,
+        }
+
+
+class JobQueue(ABC):
+    """작업 큐 인터페이스 (임대/heartbeat/완료/실패)"""
+
+    @abstractmethod
+    def enqueue(self, jobs: List[Job], max_attempts: int = 3) -> int:
+        """작업 등록 (같은 키가 이미 있으면 건너뜀), 새로 등록한 수 반환"""
+
+    @abstractmethod
+    def claim(self, worker_id: str, lease_sec: float) -> Optional[Job]:
+        """실행 가능한 작업 1건 임대 (없으면 None)"""
+
+    @abstractmethod
+    def heartbeat(self, job_id: int, worker_id: str, lease_sec: float) -> bool:
+        """임대 연장 (임대를 잃었으면 False → 작업 중단)"""
+
+    @abstractmethod
+    def complete(self, job_id: int, worker_id: str, result: Optional[Dict] = None) -> bool:
+        """완료 처리 (임대를 잃었으면 False)"""
+
+    @abstractmethod
+    def fail(self, job_id: int, worker_id: str, error: str) -> str:
+        """실패 처리 (재시도 대기 또는 dead), 바뀐 상태 반환"""
+
+    @abstractmethod
+    def release(self, job_id: int, worker_id: str) -> bool:
+        """작업자 종료로 임대 반납 (시도 횟수에 포함하지 않음)"""
+
+    @abstractmethod
+    def requeue_dead(self) -> int:
+        """dead 작업을 시도 횟수 초기화 후 다시 대기 상태로"""
+
+    @abstractmethod
+    def counts(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+
+    @abstractmethod
+    def jobs(self, state: Optional[str] = None) -> List[Job]:
+        """작업 목록"""
+
+    def has_unfinished(self) -> bool:
+        """대기/임대 중인 작업 존재 여부"""
+        counts = self.counts()
+        return bool(counts.get(PENDING) or counts.get(LEASED))
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_key TEXT NOT NULL UNIQUE,
+    complex_id TEXT NOT NULL,
+    trade_type TEXT NOT NULL,
+    page_start INTEGER NOT NULL,
+    page_end INTEGER,
+    options TEXT NOT NULL DEFAULT '{}',
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    last_error TEXT,
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (state, available_at);
+"""
+
+
+class SqliteJobQueue(JobQueue):
+    """
+    SQLite 작업 큐
+
+    임대는 BEGIN IMMEDIATE 트랜잭션 안에서 선택+갱신하므로 여러 프로세스가 같은 작업을 가져가지 않음
+    (네트워크 파일시스템은 WAL 공유 메모리를 지원하지 않으므로 wal=False 사용)
+    """
+
+    def __init__(self, path: str = "./jobs/queue.db", wal: bool = True,
+                 retry_base: float = 30.0, retry_cap: float = 1800.0):
+        """
+        Args:
+            path: DB 파일 경로
+            wal: WAL 저널 사용 (같은 호스트 다중 프로세스에 유리, 공유 파일시스템에서는 False)
+            retry_base: 실패 재시도 기본 대기 (초, 시도마다 2배)
+            retry_cap: 재시도 대기 상한 (초)
+        """
+        self.path = path
+        self.retry_base = retry_base
+        self.retry_cap = retry_cap
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 트랜잭션은 직접 관리 (isolation_level=None), 작업자 heartbeat 스레드와 연결 공유
+        self._conn = sqlite3.connect(path, timeout=30.0, isolation_level=None, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA busy_timeout = 30000")
+        self._conn.execute(f"PRAGMA journal_mode = {'WAL' if wal else 'DELETE'}")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def _transaction(self):
+        return _Transaction(self._conn, self._lock)
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Job:
+        job = Job(row["id"], row["complex_id"], row["trade_type"], row["page_start"], row["page_end"],
+                  json.loads(row["options"] or "{}"))
+        job.state = row["state"]
+        job.attempts = row["attempts"]
+        job.max_attempts = row["max_attempts"]
+        job.lease_owner = row["lease_owner"]
+        job.lease_expires = row["lease_expires"]
+        job.last_error = row["last_error"]
+        job.result = json.loads(row["result"]) if row["result"] else None
+        return job
+
+    def enqueue(self, jobs: List[Job], max_attempts: int = 3) -> int:
+        now = time.time()
+        added = 0
+        with self._transaction() as conn:
+            for job in jobs:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO jobs (job_key, complex_id, trade_type, page_start, page_end, "
+                    "options, state, max_attempts, available_at, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (job.key, job.complex_id, job.trade_type, job.page_start, job.page_end,
+                     json.dumps(job.options, ensure_ascii=False), PENDING, max_attempts, now, now, now),
+                )
+                added += cursor.rowcount
+        return added
+
+    def _reap_expired(self, conn: sqlite3.Connection, now: float):
+        """임대 만료 작업 회수 (작업자 비정상 종료, 시도 한도 초과 시 dead)"""
+        conn.execute(
+            "UPDATE jobs SET state = CASE WHEN attempts >= max_attempts THEN ? ELSE ? END, "
+            "lease_owner = NULL, lease_expires = NULL, available_at = ?, "
+            "last_error = '임대 만료 (작업자 응답 없음)', updated_at = ? "
+            "WHERE state = ? AND lease_expires < ?",
+            (DEAD, PENDING, now, now, LEASED, now),
+        )
+
+    def claim(self, worker_id: str, lease_sec: float) -> Optional[Job]:
+        now = time.time()
+        with self._transaction() as conn:
+            self._reap_expired(conn, now)
+            row = conn.execute(
+                "SELECT id FROM jobs WHERE state = ? AND available_at <= ? ORDER BY available_at, id LIMIT 1",
+                (PENDING, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET state = ?, lease_owner = ?, lease_expires = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE id = ?",
+                (LEASED, worker_id, now + lease_sec, now, row["id"]),
+            )
+            return self._row_to_job(conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone())
+
+    def heartbeat(self, job_id: int, worker_id: str, lease_sec: float) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ?, updated_at = ? "
+                "WHERE id = ? AND state = ? AND lease_owner = ?",
+                (now + lease_sec, now, job_id, LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str, result: Optional[Dict] = None) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET state = ?, lease_owner = NULL, lease_expires = NULL, last_error = NULL, "
+                "result = ?, updated_at = ? WHERE id = ? AND state = ? AND lease_owner = ?",
+                (DONE, json.dumps(result, ensure_ascii=False) if result is not None else None,
+                 now, job_id, LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> str:
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts, max_attempts FROM jobs WHERE id = ? AND state = ? AND lease_owner = ?",
+                (job_id, LEASED, worker_id),
+            ).fetchone()
+            if row is None:
+                # 임대를 이미 잃음 (만료 후 회수됨)
+                return ""
+            if row["attempts"] >= row["max_attempts"]:
+                state, available_at = DEAD, now
+            else:
+                delay = min(self.retry_cap, self.retry_base * 2 ** (row["attempts"] - 1))
+                state, available_at = PENDING, now + delay
+            conn.execute(
+                "UPDATE jobs SET state = ?, lease_owner = NULL, lease_expires = NULL, available_at = ?, "
+                "last_error = ?, updated_at = ? WHERE id = ?",
+                (state, available_at, error[:500], now, job_id),
+            )
+            return state
+
+    def release(self, job_id: int, worker_id: str) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET state = ?, lease_owner = NULL, lease_expires = NULL, "
+                "attempts = MAX(0, attempts - 1), available_at = ?, updated_at = ? "
+                "WHERE id = ? AND state = ? AND lease_owner = ?",
+                (PENDING, now, now, job_id, LEASED, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def requeue_dead(self) -> int:
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET state = ?, attempts = 0, available_at = ?, updated_at = ? WHERE state = ?",
+                (PENDING, now, now, DEAD),
+            )
+            return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        now = time.time()
+        with self._transaction() as conn:
+            self._reap_expired(conn, now)
+            rows = conn.execute("SELECT state, COUNT(*) AS n FROM jobs GROUP BY state").fetchall()
+        counts = dict.fromkeys(JOB_STATES, 0)
+        counts.update({row["state"]: row["n"] for row in rows})
+        return counts
+
+    def jobs(self, state: Optional[str] = None) -> List[Job]:
+        with self._lock:
+            if state:
+                rows = self._conn.execute("SELECT * FROM jobs WHERE state = ? ORDER BY id", (state,)).fetchall()
+            else:
+                rows = self._conn.execute("SELECT * FROM jobs ORDER BY id").fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ~ COMMIT/ROLLBACK (쓰기 잠금을 먼저 잡아 선택-갱신 경쟁 방지)"""
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.Lock):
+        self.conn = conn
+        self.lock = lock
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.lock.acquire()
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self.lock.release()
+            raise
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            self.conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        finally:
+            self.lock.release()
+        return False
+
+
+def split_pages(page_start: int, page_end: Optional[int], chunk: int) -> List[tuple]:
+    """페이지 범위를 chunk 단위 범위 목록으로 분할 (끝이 없으면 분할하지 않음)"""
+    if page_end is None or chunk <= 0:
+        return [(page_start, page_end)]
+    return [(start, min(page_end, start + chunk - 1)) for start in range(page_start, page_end + 1, chunk)]
@@ -0,0 +1,127 @@
+"""
+list 응답 캡처 보관
+페이지 이벤트로 캡처한 list 응답은 도착 즉시 필드 값 튜플(ListPage)로 변환하고 원본 JSON은 버림
+(보관 경로를 지정하면 원본 본문을 gzip JSONL로 추가 저장)
+변환된 페이지는 (거래유형, 페이지) 키로 메모리 상한까지만 보관하고 사용 즉시 해제
+"""
+
+import gzip
+import os
+import sys
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from crawler.field_resolver import FieldResolver
+
+# 캡처 페이지 보관 메모리 상한 기본값 (MB)
+DEFAULT_MEMORY_MB = 8.0
+
+ListKey = Tuple[Optional[str], int]
+
+
+class ListPage(NamedTuple):
+    """list 응답 1페이지 (FieldResolver 필드 값 튜플 목록 + 다음 페이지 여부)"""
+    rows: List[Tuple]
+    has_more: Optional[bool]
+
+
+def parse_list_page(resolver: FieldResolver, data: Dict) -> ListPage:
+    """list 응답 JSON → ListPage"""
+    items, has_more = resolver.list_page(data)
+    return ListPage(resolver.resolve_items(items), has_more)
+
+
+def estimate_size(page: ListPage) -> int:
+    """ListPage 메모리 사용량 근사치 (바이트)"""
+    size = sys.getsizeof(page) + sys.getsizeof(page.rows)
+    for row in page.rows:
+        size += sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row)
+    return size
+
+
+class ListCapture:
+    """캡처한 list 페이지 보관소 (메모리 상한 초과 시 오래된 페이지부터 해제)"""
+
+    def __init__(self, resolver: FieldResolver, memory_mb: float = DEFAULT_MEMORY_MB,
+                 archive_path: Optional[str] = None):
+        """
+        Args:
+            resolver: list 응답 해석기 (크롤러와 공유)
+            memory_mb: 변환된 페이지 보관 메모리 상한 (MB)
+            archive_path: 원본 본문 gzip JSONL 보관 경로 (None이면 원본은 버림)
+        """
+        self._resolver = resolver
+        self.max_bytes = int(max(0.0, memory_mb) * 1024 * 1024)
+        self.archive_path = archive_path
+        self._archive = None
+        self._pages: "OrderedDict[ListKey, Tuple[ListPage, int]]" = OrderedDict()
+        self.bytes = 0
+        self.peak_bytes = 0
+        self.captured = 0
+        self.evicted = 0
+        self.archived_bytes = 0
+        self.archive_error: Optional[str] = None
+
+    def __contains__(self, key: ListKey) -> bool:
+        return key in self._pages
+
+    def add(self, key: Optional[ListKey], data: Dict, body: Optional[bytes] = None) -> ListPage:
+        """
+        캡처한 응답 변환 + 보관 (같은 키가 이미 있으면 기존 페이지 유지)
+
+        Args:
+            key: (거래유형, 페이지) - None이면 보관하지 않음
+            data: 파싱된 응답 JSON (변환 후 호출 측에서 버림)
+            body: 원본 본문 (보관 경로 지정 시 압축 저장)
+        """
+        page = parse_list_page(self._resolver, data)
+        self.captured += 1
+        if body and self.archive_path:
+            try:
+                self._write_archive(body)
+            except OSError as e:
+                # 보관 실패는 수집에 영향 없이 보관만 중단
+                self.archive_error = str(e)
+                self.archive_path = None
+        if key is None or key in self._pages:
+            return page
+        size = estimate_size(page)
+        self._pages[key] = (page, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes and self._pages:
+            _, (_, evicted_size) = self._pages.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evicted += 1
+        self.peak_bytes = max(self.peak_bytes, self.bytes)
+        return page
+
+    def pop(self, key: ListKey) -> Optional[ListPage]:
+        """보관 페이지 꺼내기 (꺼낸 페이지는 해제)"""
+        entry = self._pages.pop(key, None)
+        if entry is None:
+            return None
+        self.bytes -= entry[1]
+        return entry[0]
+
+    def _write_archive(self, body: bytes):
+        """원본 본문 1줄 추가 (JSON 바깥 줄바꿈은 공백으로)"""
+        if self._archive is None:
+            directory = os.path.dirname(self.archive_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._archive = gzip.open(self.archive_path, "ab", compresslevel=6)
+        line = b" ".join(body.splitlines()) + b"\n"
+        self._archive.write(line)
+        self.archived_bytes += len(line)
+
+    def clear(self):
+        """보관 페이지 모두 해제"""
+        self._pages.clear()
+        self.bytes = 0
+
+    def close(self):
+        """보관 파일 닫기 + 페이지 해제"""
+        self.clear()
+        archive, self._archive = self._archive, None
+        if archive is not None:
+            archive.close()
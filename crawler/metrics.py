@@ -0,0 +1,216 @@
+"""
+요청 단위 지표 레지스트리
+엔드포인트별 지연 히스토그램, 상태 코드/재시도/쿨다운/수신 바이트/캐시 적중 집계
+GUI 패널에서 실시간 조회, 실행 종료 시 Prometheus 텍스트 형식으로 저장
+"""
+
+import os
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from utils.har_stream import classify_endpoint
+
+# 지연 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_METRIC_HELP = {
+    "estate_http_request_duration_seconds": ("histogram", "API 요청 지연 시간"),
+    "estate_http_responses_total": ("counter", "엔드포인트/상태 코드별 응답 수"),
+    "estate_http_response_bytes_total": ("counter", "수신 본문 바이트"),
+    "estate_http_retries_total": ("counter", "재시도 횟수"),
+    "estate_cooldowns_total": ("counter", "429/재시도 한도 초과로 인한 대기 횟수"),
+    "estate_cooldown_seconds_total": ("counter", "대기에 사용한 시간(초)"),
+    "estate_cache_hits_total": ("counter", "네트워크 요청 없이 재사용한 응답 수"),
+    "estate_http_coalesced_total": ("counter", "진행 중인 동일 요청 결과를 공유해 생략한 요청 수"),
+    "estate_failovers_total": ("counter", "page/context 종료 시 대기 항목으로 교체한 횟수"),
+    "estate_failover_duration_seconds": ("histogram", "대기 항목 교체 소요 시간"),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """현재 프로세스 최대 RSS (바이트, Windows는 psutil 설치 시에만, 확인 불가면 None)"""
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 바이트, Linux는 KB 단위
+        return peak if sys.platform == "darwin" else peak * 1024
+    try:
+        import psutil
+    except ImportError:
+        return None
+    info = psutil.Process().memory_info()
+    # Windows: 최대 작업 집합
+    return getattr(info, "peak_wset", None) or info.rss
+
+
+def endpoint_label(url: str) -> str:
+    """URL → 지표 엔드포인트 라벨 (list/detail/other)"""
+    return classify_endpoint(url) or "other"
+
+
+class _Histogram:
+    """누적 버킷 히스토그램"""
+
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.total += value
+        self.count += 1
+        for idx, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                self.counts[idx] += 1
+                break
+
+    def quantile(self, q: float) -> Optional[float]:
+        """버킷 상한 기준 근사 분위수"""
+        if not self.count:
+            return None
+        target = q * self.count
+        seen = 0
+        for idx, bound in enumerate(LATENCY_BUCKETS):
+            seen += self.counts[idx]
+            if seen >= target:
+                return bound
+        return float("inf")
+
+
+class MetricsRegistry:
+    """스레드 안전 지표 레지스트리 (크롤러 스레드 기록, GUI 스레드 조회)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+
+    @staticmethod
+    def _key(labels: Optional[Dict[str, str]]) -> LabelKey:
+        return tuple(sorted((labels or {}).items()))
+
+    def inc(self, name: str, labels: Optional[Dict[str, str]] = None, value: float = 1.0):
+        """카운터 증가"""
+        key = self._key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
+        """히스토그램 관측값 추가"""
+        key = self._key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            hist = series.get(key)
+            if hist is None:
+                hist = series[key] = _Histogram()
+            hist.observe(value)
+
+    def observe_request(self, url: str, status: Optional[int], latency: float, nbytes: int):
+        """요청 1건 결과 기록"""
+        endpoint = endpoint_label(url)
+        self.observe("estate_http_request_duration_seconds", latency, {"endpoint": endpoint})
+        self.inc("estate_http_responses_total",
+                 {"endpoint": endpoint, "status": str(status) if status else "error"})
+        if nbytes:
+            self.inc("estate_http_response_bytes_total", {"endpoint": endpoint}, nbytes)
+
+    def record_retry(self, url: str):
+        self.inc("estate_http_retries_total", {"endpoint": endpoint_label(url)})
+
+    def record_cooldown(self, seconds: float):
+        self.inc("estate_cooldowns_total")
+        self.inc("estate_cooldown_seconds_total", value=seconds)
+
+    def record_cache_hit(self, endpoint: str):
+        self.inc("estate_cache_hits_total", {"endpoint": endpoint})
+
+    def record_coalesced(self, url: str):
+        self.inc("estate_http_coalesced_total", {"endpoint": endpoint_label(url)})
+
+    def record_failover(self, kind: str, seconds: float):
+        self.inc("estate_failovers_total", {"kind": kind})
+        self.observe("estate_failover_duration_seconds", seconds, {"kind": kind})
+
+    def _sum(self, name: str, **match: str) -> float:
+        total = 0.0
+        for key, value in self._counters.get(name, {}).items():
+            labels = dict(key)
+            if all(labels.get(k) == v for k, v in match.items()):
+                total += value
+        return total
+
+    def snapshot(self) -> Dict:
+        """GUI/요약용 집계값"""
+        with self._lock:
+            statuses: Dict[str, int] = {}
+            for key, value in self._counters.get("estate_http_responses_total", {}).items():
+                status = dict(key).get("status", "")
+                statuses[status] = statuses.get(status, 0) + int(value)
+            latency = {}
+            for key, hist in self._histograms.get("estate_http_request_duration_seconds", {}).items():
+                latency[dict(key).get("endpoint", "")] = {
+                    "count": hist.count,
+                    "avg_ms": round(hist.total / hist.count * 1000, 1) if hist.count else 0.0,
+                    "p50_le_s": hist.quantile(0.5),
+                    "p95_le_s": hist.quantile(0.95),
+                }
+            return {
+                "requests": sum(statuses.values()),
+                "statuses": statuses,
+                "latency": latency,
+                "retries": int(self._sum("estate_http_retries_total")),
+                "cooldowns": int(self._sum("estate_cooldowns_total")),
+                "cooldown_sec": round(self._sum("estate_cooldown_seconds_total"), 1),
+                "bytes": int(self._sum("estate_http_response_bytes_total")),
+                "cache_hits": int(self._sum("estate_cache_hits_total")),
+                "coalesced": int(self._sum("estate_http_coalesced_total")),
+                "failovers": int(self._sum("estate_failovers_total")),
+            }
+
+    @staticmethod
+    def _format_labels(key: LabelKey, extra: Optional[List[Tuple[str, str]]] = None) -> str:
+        pairs = list(key) + (extra or [])
+        if not pairs:
+            return ""
+        body = ",".join(f'{k}="{str(v)}"' for k, v in pairs)
+        return "{" + body + "}"
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(set(self._counters) | set(self._histograms)):
+                kind, help_text = _METRIC_HELP.get(name, ("counter", name))
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for key, value in sorted(self._counters.get(name, {}).items()):
+                    number = int(value) if float(value).is_integer() else round(value, 6)
+                    lines.append(f"{name}{self._format_labels(key)} {number}")
+                for key, hist in sorted(self._histograms.get(name, {}).items()):
+                    cumulative = 0
+                    for bound, count in zip(LATENCY_BUCKETS, hist.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{self._format_labels(key, [('le', str(bound))])} {cumulative}")
+                    lines.append(f"{name}_bucket{self._format_labels(key, [('le', '+Inf')])} {hist.count}")
+                    lines.append(f"{name}_sum{self._format_labels(key)} {round(hist.total, 6)}")
+                    lines.append(f"{name}_count{self._format_labels(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str):
+        """Prometheus 텍스트 파일 저장 (node_exporter textfile collector 호환)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
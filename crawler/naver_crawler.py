@@ -5,14 +5,38 @@ Playwright 정상 플로우 + 동일 컨텍스트 JSON API 수집
 
 import asyncio
 import json
+import os
 import random
 import re
+import time
 import traceback
 from typing import List, Dict, Optional, Callable, Tuple
-from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
+from urllib.parse import urlparse, parse_qs, urlencode, urljoin, urlunparse
 
 from playwright.async_api import async_playwright, Page, Request, Response
 
+from crawler.building_index import BuildingIndex
+from crawler.checkpoint import CheckpointJournal
+from crawler.context_pool import ContextPool
+from crawler.field_resolver import FieldResolver
+from crawler.har_replay import HarReplay
+from crawler.list_capture import DEFAULT_MEMORY_MB, ListCapture, ListKey, ListPage, parse_list_page
+from crawler.metrics import MetricsRegistry, peak_rss_bytes
+from crawler.page_pool import PagePool
+from crawler.tracing import Tracer
+from utils import fastjson
+
+# 거래유형 코드 → 표시 이름
+TRADE_TYPE_LABELS = {"A1": "매매", "B1": "전세", "B2": "월세"}
+# list 요청 본문/쿼리에서 거래유형을 나타내는 키
+_TRADE_TYPE_KEYS = ("tradeTypes", "articleTradeTypes", "tradeType")
+# 공유 요청을 시작한 호출자가 취소됨 (기다리던 호출자는 다시 요청)
+_REISSUE = object()
+# 마감 모드: 남은 시간이 이 비율 미만이면 상세 보정을 건너뛰고 list 수집 우선
+DEADLINE_RESERVE_RATIO = 0.2
+# 마감 후 진행 중인 요청을 기다리는 시간 (초과 시 작업 취소)
+DEADLINE_GRACE_SEC = 5.0
+
 
 class NaverEstateCrawler:
     """네이버 부동산 크롤러 클래스"""
@@ -23,7 +47,31 @@ class NaverEstateCrawler:
                  property_found_callback: Optional[Callable] = None,
                  min_wait: float = 1.0,
                  max_wait: float = 3.0,
-                 headless: bool = False):
+                 headless: bool = False,
+                 run_id: Optional[str] = None,
+                 resume: bool = False,
+                 checkpoint_dir: str = "./checkpoints",
+                 mode: str = "dom",
+                 concurrency: int = 4,
+                 user_data_dir: str = "./playwright_data",
+                 land_base_url: str = "https://new.land.naver.com",
+                 fin_base_url: str = "https://fin.land.naver.com",
+                 browser_channel: Optional[str] = "chrome",
+                 replay_har: Optional[str] = None,
+                 trace: bool = False,
+                 trace_path: Optional[str] = None,
+                 metrics: Optional[MetricsRegistry] = None,
+                 metrics_path: Optional[str] = None,
+                 debug: bool = False,
+                 trade_types: Optional[List[str]] = None,
+                 list_filters: Optional[Dict] = None,
+                 deadline: Optional[float] = None,
+                 transport: str = "browser",
+                 page_range: Optional[Tuple[int, Optional[int]]] = None,
+                 building_index_dir: Optional[str] = "./building_index",
+                 standby: str = "page",
+                 list_memory_mb: float = DEFAULT_MEMORY_MB,
+                 list_archive_dir: Optional[str] = None):
         # 콜백은 가장 먼저 설정 (초기 로그 호출 시 AttributeError 방지)
         self.progress_callback = progress_callback
         self.log_callback = log_callback
@@ -31,34 +79,124 @@ class NaverEstateCrawler:
         self.min_wait = min_wait
         self.max_wait = max_wait
         self.headless = headless
+        # 디버그 로그 (API 응답 본문 미리보기 등)
+        self.debug = debug
+        # dom: 카드 클릭 기반 수집, api: list JSON 페이지 + 저/중/고 상세 JSON 보정
+        self.mode = mode
+        self.concurrency = max(1, concurrency)
+        self.user_data_dir = user_data_dir
+        self.browser_channel = browser_channel
+        # 수집할 거래유형 (api 모드는 한 세션에서 거래유형별 병렬 수집, dom 모드는 첫 번째만)
+        self.trade_types = list(dict.fromkeys(trade_types or ["A1"]))
+        # list 요청에 추가할 필터 (예: {"areaMin": 60})
+        self.list_filters = dict(list_filters or {})
+        # 수집할 list 페이지 범위 (시작, 끝; 끝이 None이면 마지막 페이지까지, api 모드 작업 분할용)
+        self.page_range = page_range
+        # 단지별 동/층 색인 경로 (None이면 사용 안 함, 확인된 층수 재사용으로 상세 요청 절감)
+        self.building_index_dir = building_index_dir
+        self._buildings: Optional[BuildingIndex] = None
+        self._floor_indexed = 0
+        self._floor_details = 0
+        # JSON API 전송: browser(컨텍스트 요청) 또는 http(쿠키 공유 httpx 직접 요청, api 모드)
+        self.transport = transport
+        self._http = None
         self.is_cancelled = False
+        self.is_paused = False
+        self.finished = False
         self.results: List[Dict[str, str]] = []
+
+        # 중지/일시정지/마감 제어 (이벤트는 crawl() 실행 루프에서 생성)
+        self.deadline = deadline if deadline and deadline > 0 else None
+        self.deadline_reached = False
+        self._deadline_at: Optional[float] = None
+        self._floor_skipped = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_task: Optional[asyncio.Task] = None
+        self._grace_handle: Optional[asyncio.TimerHandle] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._resume_event: Optional[asyncio.Event] = None
         
         # URL에서 쿼리 파라미터 제거 (단지 메인 URL만 사용)
         self.base_url = self._clean_url(url)
+        self.complex_id = self._extract_complex_id(self.base_url) or "117804"
         
         # Playwright 컨텍스트/페이지
         self._playwright = None
         self._context = None
         self._page = None
-
-        self._warmup_url = "https://new.land.naver.com"
+        # 대기 페이지/컨텍스트 (off: 사용 안 함, page: 같은 컨텍스트 대기 탭, context: + 별도 브라우저 대기 컨텍스트)
+        self.standby = standby
+        self._pool: Optional[ContextPool] = None
+        self._standby_browser = None
+        self._lost_target: Optional[str] = None
+        # dom 모드 상세 조회 탭 (탭 수 = 상세 요청 동시 실행 한도)
+        self._tabs: Optional[PagePool] = None
+
+        # 기본 URL은 로컬 픽스처 서버 등으로 재지정 가능
+        self._warmup_url = land_base_url.rstrip("/")
+        self._fin_origin = fin_base_url.rstrip("/")
         self._fin_entry_url = (
-            "https://fin.land.naver.com/complexes/117804"
-            "?tab=article&articleTradeTypes=A1&tradeType=A1"
+            f"{self._fin_origin}/complexes/{self.complex_id}"
+            f"?tab=article&articleTradeTypes={self.trade_types[0]}&tradeType={self.trade_types[0]}"
         )
-        self._fin_api_url = "https://fin.land.naver.com/front-api/v1/complex/article/list"
+        self._fin_api_url = f"{self._fin_origin}/front-api/v1/complex/article/list"
         self._default_user_agent = (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
             "AppleWebKit/537.36 (KHTML, like Gecko) "
             "Chrome/120.0.0.0 Safari/537.36"
         )
+        self._fin_referer = self._fin_entry_url
+        self._fin_user_agent = self._default_user_agent
+        self.api_headers: Dict[str, str] = {
+            "Accept": "application/json",
+            "Referer": f"{self._warmup_url}/complexes/{self.complex_id}",
+            "User-Agent": self._default_user_agent,
+        }
+        self._cookie_logged = False
         self._max_nav_retries = 3
 
-        # list 응답 캡처 (현재 미사용)
-        self._list_responses: List[Dict] = []
+        # list 응답 형태별 필드 접근자 캐시
+        self._fields = FieldResolver()
+        # list 응답 캡처 (api 모드: 페이지 재사용 + 요청 템플릿, 원본 JSON은 변환 즉시 폐기/압축 보관)
+        self.list_memory_mb = list_memory_mb
+        self.list_archive_dir = list_archive_dir
+        self._captured = ListCapture(self._fields, list_memory_mb)
+        # 실행 종료 시 프로세스 최대 RSS (바이트, 확인 불가면 None)
+        self.peak_rss: Optional[int] = None
+        self._list_request: Optional[Dict] = None
         self._seen_article_ids = set()
+        # 진행 중인 요청 (method, url, payload) → 결과 Future (동일 요청 single-flight)
+        self._inflight: Dict[Tuple[str, str, str], asyncio.Future] = {}
         self._stop_on_429 = False
+
+        # 체크포인트 저널 (중단 시 재개)
+        self.resume = resume
+        self.checkpoint_dir = checkpoint_dir
+        self.run_id = run_id
+        self._journal: Optional[CheckpointJournal] = None
+        self._resume_position = -1
+        self._completed_pages = set()
+        self._completed_trade_pages: Dict[str, set] = {}
+        self._context_lost = False
+        self._max_recoveries = 3
+        self._recoveries = 0
+        # 컨텍스트 복구 세대 (거래유형 작업 간 중복 복구 방지)
+        self._session_generation = 0
+        self._recovery_lock: Optional[asyncio.Lock] = None
+        self._next_position = 0
+        self._pages_done = 0
+
+        # HAR 재생 모드 (네트워크 대신 녹화 응답 사용, 대기 없음)
+        self.replay_har = replay_har
+        self._har_replay: Optional[HarReplay] = None
+
+        # 단계별 타이밍 스팬 (비활성 시 no-op)
+        self.trace_path = trace_path
+        self._tracer = Tracer(enabled=trace or bool(trace_path))
+
+        # 요청 지표 (GUI 실시간 조회, 종료 시 Prometheus 텍스트 저장)
+        self.metrics = metrics or MetricsRegistry()
+        self.metrics_path = metrics_path
         
     def _clean_url(self, url: str) -> str:
         """URL에서 쿼리 파라미터 제거하여 단지 메인 URL만 반환"""
@@ -90,6 +228,35 @@ class NaverEstateCrawler:
         if self.progress_callback:
             self.progress_callback(current, total, message)
     
+    async def _sleep(self, seconds: float):
+        """대기 (중지/마감 시 즉시 반환, 일시정지 중이면 재개까지 대기, HAR 재생 모드에서는 생략)"""
+        if self._har_replay is not None or self._stop_event.is_set():
+            await asyncio.sleep(0)
+        else:
+            with self._tracer.span("sleep", args={"sec": round(seconds, 2)}):
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+                except asyncio.TimeoutError:
+                    pass
+        await self._wait_if_paused()
+
+    async def _wait_if_paused(self):
+        """일시정지 상태면 재개/중지까지 대기"""
+        if self._resume_event.is_set():
+            return
+        with self._tracer.span("paused"):
+            await self._resume_event.wait()
+
+    def _should_stop(self) -> bool:
+        """중지 요청 또는 마감 도달 여부"""
+        return self.is_cancelled or self.deadline_reached
+
+    def _deadline_near(self) -> bool:
+        """마감 임박 여부 (남은 시간이 전체의 DEADLINE_RESERVE_RATIO 미만)"""
+        if self._deadline_at is None:
+            return False
+        return self._deadline_at - time.monotonic() < self.deadline * DEADLINE_RESERVE_RATIO
+
     async def _setup_playwright_session(self):
         """Playwright로 세션 워밍업 및 검색 기반 단지 이동"""
         self._log("=" * 50)
@@ -97,26 +264,10 @@ class NaverEstateCrawler:
         self._log("=" * 50)
 
         try:
-            # launch_persistent_context 사용 (세션/쿠키 재사용)
-            context = await self._playwright.chromium.launch_persistent_context(
-                user_data_dir="./playwright_data",
-                headless=self.headless,
-                channel="chrome",  # 실제 크롬 사용
-                locale="ko-KR",
-                timezone_id="Asia/Seoul",
-                viewport={'width': 1920, 'height': 1080},
-                user_agent=self._default_user_agent
-            )
-
+            await self._launch_context()
             self._log("✓ Playwright 컨텍스트 생성 완료")
-            context.on("close", lambda: self._log("⚠ context closed 이벤트 감지"))
-
-            page = await context.new_page()
-            self._context = context
-            self._page = page
             self._log("✓ Playwright 페이지 생성 완료")
-            page.on("close", lambda: self._log("⚠ page closed 이벤트 감지"))
-            page.on("response", self._log_redirects)
+            page = self._page
 
             # 1) 워밍업: new.land 메인 접속
             self._log(f"워밍업 접속: {self._warmup_url}")
@@ -126,18 +277,18 @@ class NaverEstateCrawler:
 
             if response and response.status == 404:
                 self._log("⚠ 경고: 404 응답 받음. 잠시 대기 후 재시도...")
-                await asyncio.sleep(3)
+                await self._sleep(3)
                 response = await page.goto(self._warmup_url, wait_until='networkidle', timeout=30000)
 
             if response and response.status != 200:
                 self._log(f"⚠ 경고: HTTP {response.status} 응답")
 
-            await asyncio.sleep(2)
+            await self._sleep(2)
 
             # 2) fin.land 단지 페이지 이동
             self._log(f"단지 페이지 이동: {self._fin_entry_url}")
             response = await self._safe_goto(page, self._fin_entry_url)
-            await asyncio.sleep(1.5)
+            await self._sleep(1.5)
             self._log(f"최종 page.url: {page.url}")
             if await self._is_404_page(page):
                 self._log("✗ 404 감지. fin.land 단지 페이지 진입 실패")
@@ -151,12 +302,14 @@ class NaverEstateCrawler:
 
             # 5) list 응답 1회 캡처 (30초)
             try:
-                list_resp = await page.wait_for_response(
-                    lambda r: r.url == self._fin_api_url and r.status == 200,
-                    timeout=30000
-                )
-                data = await list_resp.json()
-                self._list_responses.append(data)
+                with self._tracer.span("list_wait", "list_fetch"):
+                    list_resp = await page.wait_for_response(
+                        lambda r: r.url == self._fin_api_url and r.status == 200,
+                        timeout=30000
+                    )
+                    body = await list_resp.body()
+                self._capture_list_request(list_resp)
+                self._store_list_response(list_resp, body)
                 self._log("list 200 captured")
             except Exception:
                 self._log("list 응답 30초 내 미발견. 수집 중단")
@@ -185,13 +338,121 @@ class NaverEstateCrawler:
                 elem = await page.query_selector(selector)
                 if elem:
                     await elem.click()
-                    await asyncio.sleep(1)
+                    await self._sleep(1)
                     self._log("✓ 매물 탭/필터 클릭 성공")
                     return
             except Exception:
                 continue
         self._log("매물 탭/필터 클릭은 생략됨")
 
+    async def _launch_context(self):
+        """영구 컨텍스트/페이지 생성 및 종료 이벤트 연결"""
+        # launch_persistent_context 사용 (세션/쿠키 재사용)
+        with self._tracer.span("launch"):
+            context = await self._playwright.chromium.launch_persistent_context(
+                user_data_dir=self.user_data_dir,
+                headless=self.headless,
+                channel=self.browser_channel,  # 기본: 실제 크롬 사용
+                locale="ko-KR",
+                timezone_id="Asia/Seoul",
+                viewport={'width': 1920, 'height': 1080},
+                user_agent=self._default_user_agent
+            )
+        await self._wire_context(context)
+        page = await context.new_page()
+        self._wire_page(page)
+        self._context = context
+        self._page = page
+        self._context_lost = False
+        self._lost_target = None
+
+    async def _wire_context(self, context):
+        """컨텍스트 종료 이벤트 + HAR 재생 라우팅 연결"""
+        context.on("close", lambda *_: self._on_target_closed("context", context))
+        if self._har_replay is not None:
+            await context.route("**/*", self._har_replay.handle_route)
+
+    def _wire_page(self, page: Page):
+        """페이지 종료/리다이렉트 이벤트 연결"""
+        page.on("close", lambda *_: self._on_target_closed("page", page))
+        page.on("response", self._log_redirects)
+
+    def _on_target_closed(self, target: str, source=None):
+        """context/page 종료 이벤트: 복구 대상으로 표시 (대기/교체된 이전 항목은 무시)"""
+        if source is not None and source is not self._page and source is not self._context:
+            return
+        self._log(f"⚠ {target} closed 이벤트 감지")
+        self._context_lost = True
+        if self._lost_target != "context":
+            self._lost_target = target
+
+    def _start_standby(self):
+        """대기 페이지/컨텍스트 보충 (백그라운드)"""
+        if self.standby not in ("page", "context") or self._context is None:
+            return
+        if self._pool is None:
+            self._pool = ContextPool(
+                self._prepare_standby,
+                self._new_standby_context if self.standby == "context" else None,
+                log=self._log,
+            )
+        self._pool.refill(self._context)
+
+    async def _prepare_standby(self, page: Page) -> bool:
+        """대기 페이지를 단지 페이지까지 진입 (dom 모드는 매물 탭까지)"""
+        self._wire_page(page)
+        await self._safe_goto(page, self._fin_entry_url)
+        if await self._is_404_page(page):
+            return False
+        if self.mode != "api":
+            await self._try_trigger_article_api(page)
+        return True
+
+    async def _new_standby_context(self, primary):
+        """주 컨텍스트 쿠키/스토리지를 복사한 대기 컨텍스트 (영구 프로필은 1개 컨텍스트만 가능하므로 별도 브라우저)"""
+        if self._standby_browser is None:
+            self._standby_browser = await self._playwright.chromium.launch(
+                headless=self.headless, channel=self.browser_channel
+            )
+        context = await self._standby_browser.new_context(
+            storage_state=await primary.storage_state(),
+            locale="ko-KR",
+            timezone_id="Asia/Seoul",
+            viewport={'width': 1920, 'height': 1080},
+            user_agent=self._default_user_agent
+        )
+        await self._wire_context(context)
+        return context
+
+    async def _take_standby(self) -> bool:
+        """대기 페이지/컨텍스트로 즉시 교체 후 보충 시작 (대기 항목이 없으면 False)"""
+        if self._pool is None:
+            return False
+        started = time.perf_counter()
+        standby = self._pool.take(context_lost=self._lost_target == "context")
+        if standby is None:
+            return False
+        old_page, old_context = self._page, self._context
+        self._context, self._page = standby.context, standby.page
+        self._context_lost = False
+        self._lost_target = None
+        self._attach_list_response_listener(self._page)
+        if self._http is not None:
+            # 갱신 쿠키를 되돌려 줄 컨텍스트 교체 (쿠키는 주 컨텍스트에서 복사됨)
+            self._http.context = self._context
+        elapsed = time.perf_counter() - started
+        self.metrics.record_failover(standby.kind, elapsed)
+        self._log(f"✓ 대기 {standby.kind}로 전환 ({elapsed * 1000:.1f}ms)")
+        self._pool.refill(self._context)
+        # 이전 page/context 정리 (이미 닫혔으면 즉시 반환)
+        stale = old_context if old_context is not self._context else old_page
+        if stale is not None:
+            try:
+                await stale.close()
+            except Exception:
+                pass
+        return True
+
     async def _recreate_context(self):
         """컨텍스트 재생성 (UA 변경 없음)"""
         if self._page:
@@ -204,34 +465,48 @@ class NaverEstateCrawler:
                 await self._context.close()
             except Exception:
                 pass
-        context = await self._playwright.chromium.launch_persistent_context(
-            user_data_dir="./playwright_data",
-            headless=self.headless,
-            channel="chrome",
-            locale="ko-KR",
-            timezone_id="Asia/Seoul",
-            viewport={'width': 1920, 'height': 1080},
-            user_agent=self._default_user_agent
-        )
-        self._context = context
-        page = await context.new_page()
-        self._page = page
+        await self._launch_context()
         self._log("✓ 컨텍스트 재생성 완료")
-        page.on("response", self._log_redirects)
+
+    async def _recover_session(self) -> bool:
+        """컨텍스트 재생성 후 단지 페이지 재진입 (체크포인트 위치부터 이어서 수집)"""
+        if await self._take_standby():
+            return True
+        self._log("컨텍스트 복구 시작...")
+        try:
+            await self._recreate_context()
+            await self._safe_goto(self._page, self._fin_entry_url)
+            if await self._is_404_page(self._page):
+                self._log("✗ 복구 중 404 감지")
+                return False
+            self._attach_list_response_listener(self._page)
+            await self._try_trigger_article_api(self._page)
+            await self._sleep(2)
+            if self._http is not None:
+                # 새 컨텍스트 쿠키로 직접 전송 갱신
+                self._http.context = self._context
+                await self._http.import_cookies()
+            self._log("✓ 컨텍스트 복구 완료")
+            self._start_standby()
+            return True
+        except Exception as e:
+            self._log(f"✗ 컨텍스트 복구 실패: {e}")
+            return False
 
     async def _safe_goto(self, page: Page, url: str):
         """안전한 페이지 이동 (간단 재시도)"""
         last_response = None
         for attempt in range(1, self._max_nav_retries + 1):
             try:
-                last_response = await page.goto(
-                    url, wait_until="domcontentloaded", timeout=30000
-                )
-                await asyncio.sleep(1.0 + attempt * 0.3)
+                with self._tracer.span("goto", "navigation", {"url": url, "attempt": attempt}):
+                    last_response = await page.goto(
+                        url, wait_until="domcontentloaded", timeout=30000
+                    )
+                await self._sleep(1.0 + attempt * 0.3)
                 if not await self._is_404_page(page):
                     return last_response
             except Exception:
-                await asyncio.sleep(1.0 + attempt * 0.5)
+                await self._sleep(1.0 + attempt * 0.5)
         return last_response
 
     async def _is_404_page(self, page: Page) -> bool:
@@ -299,6 +574,34 @@ class NaverEstateCrawler:
         except Exception:
             return
 
+    @staticmethod
+    def _request_info(response: Response) -> Optional[Dict]:
+        """응답의 원 요청 method/url/payload"""
+        try:
+            request = response.request
+            payload = None
+            if request.method.upper() == "POST":
+                payload = request.post_data_json
+            return {
+                "method": request.method.upper(),
+                "url": request.url,
+                "payload": payload if isinstance(payload, dict) else None,
+            }
+        except Exception:
+            return None
+
+    def _capture_list_request(self, response: Response):
+        """list 응답의 원 요청(method/body)을 api 모드 페이지 요청 템플릿으로 저장"""
+        self._list_request = self._request_info(response)
+
+    def _store_list_response(self, response: Response, body: bytes):
+        """캡처한 list 응답 → (거래유형, 페이지) 키로 변환 보관 (원본 JSON은 여기서 버림)"""
+        request = self._request_info(response)
+        key = self._list_key(request) if request else None
+        if key is not None and key in self._captured:
+            return
+        self._captured.add(key, fastjson.loads(body), body)
+
     def _attach_list_response_listener(self, page: Page):
         """list API 응답 캡처 리스너 등록"""
         async def handle_response(response: Response):
@@ -312,8 +615,7 @@ class NaverEstateCrawler:
                         return
                     if status != 200:
                         return
-                    data = await response.json()
-                    self._list_responses.append(data)
+                    self._store_list_response(response, await response.body())
             except Exception:
                 return
 
@@ -321,6 +623,10 @@ class NaverEstateCrawler:
     
     def _parse_property_data(self, item: Dict) -> Optional[Dict[str, str]]:
         """JSON 데이터에서 매물 정보 추출"""
+        return self._format_property(self._fields.resolve_item(item))
+
+    def _format_property(self, values: Tuple) -> Optional[Dict[str, str]]:
+        """FieldResolver 필드 값 튜플 → 매물 정보"""
         try:
             property_info = {
                 '동': '',
@@ -328,14 +634,13 @@ class NaverEstateCrawler:
                 '면적': '',
                 '층수': ''
             }
+            _article_id, dong, price, area, floor, total_floor = values
             
             # 동 정보 추출
-            dong = item.get('dongName') or item.get('dong') or item.get('buildingName') or ''
             if dong:
                 property_info['동'] = str(dong).strip()
             
             # 가격 정보 추출
-            price = item.get('dealOrWarrantPrc') or item.get('price') or item.get('dealPrice') or ''
             if price:
                 # 숫자 형식인 경우 포맷팅
                 try:
@@ -353,7 +658,6 @@ class NaverEstateCrawler:
                     property_info['가격'] = str(price).strip()
             
             # 면적 정보 추출
-            area = item.get('area1') or item.get('area') or item.get('exclusiveArea') or ''
             if area:
                 try:
                     area_num = float(area)
@@ -362,16 +666,16 @@ class NaverEstateCrawler:
                     property_info['면적'] = str(area).strip()
             
             # 층수 정보 추출
-            floor = item.get('floor') or item.get('floorInfo') or ''
-            total_floor = item.get('totalFloor') or item.get('maxFloor') or ''
-            
             if floor and total_floor:
                 try:
                     floor_num = int(floor)
                     total_num = int(total_floor)
                     property_info['층수'] = f"{floor_num}/{total_num}층"
                 except:
-                    property_info['층수'] = str(floor).strip()
+                    # 저/중/고 등 층이 숫자가 아니어도 전체 층수는 유지
+                    total_text = str(total_floor).strip()
+                    property_info['층수'] = (f"{str(floor).strip()}/{total_text}층" if total_text.isdigit()
+                                           else str(floor).strip())
             elif floor:
                 property_info['층수'] = str(floor).strip()
             
@@ -381,10 +685,13 @@ class NaverEstateCrawler:
             self._log(f"매물 데이터 파싱 오류: {e}")
             return None
     
-    def _build_api_url(self, base_url: str, page: int, page_size: int) -> str:
-        """API URL에 페이지 파라미터를 안전하게 구성"""
+    def _build_api_url(self, base_url: str, page: int, page_size: int,
+                       params: Optional[Dict] = None) -> str:
+        """API URL에 페이지/필터 파라미터를 안전하게 구성"""
         parsed = urlparse(base_url)
         query = parse_qs(parsed.query)
+        for key, value in (params or {}).items():
+            query[key] = [str(v) for v in value] if isinstance(value, list) else [str(value)]
         query["page"] = [str(page)]
         query["pageSize"] = [str(page_size)]
         new_query = urlencode(query, doseq=True)
@@ -411,7 +718,7 @@ class NaverEstateCrawler:
     def _is_context_alive(self) -> bool:
         """page/context 생존 여부"""
         try:
-            if not self._context or not self._page:
+            if self._context_lost or not self._context or not self._page:
                 return False
             if self._page.is_closed():
                 return False
@@ -427,36 +734,6 @@ class NaverEstateCrawler:
             f"context_alive={alive}"
         )
 
-    def _find_key_paths(self, data: object, key: str, path: Optional[List[str]] = None):
-        """JSON에서 특정 키의 경로와 값을 탐색"""
-        if path is None:
-            path = []
-        results = []
-        if isinstance(data, dict):
-            for k, v in data.items():
-                new_path = path + [k]
-                if k == key:
-                    results.append((new_path, v))
-                results.extend(self._find_key_paths(v, key, new_path))
-        elif isinstance(data, list):
-            for idx, item in enumerate(data):
-                new_path = path + [f"[{idx}]"]
-                results.extend(self._find_key_paths(item, key, new_path))
-        return results
-
-    def _pick_value_by_key(self, data: Dict, key: str):
-        """JSON에서 특정 키 값과 경로 선택"""
-        candidates = self._find_key_paths(data, key)
-        if not candidates:
-            return None, None
-        # 우선 비어있지 않은 값 선택
-        for path, value in candidates:
-            if value not in (None, "", [], {}):
-                return value, ".".join(path)
-        # 모두 비어있다면 첫 번째
-        value, path = candidates[0]
-        return value, ".".join(path)
-
     async def _fetch_json_via_context(
         self,
         url: str,
@@ -464,26 +741,43 @@ class NaverEstateCrawler:
         method: str = "GET",
         payload: Optional[Dict] = None
     ) -> Tuple[Optional[Dict], Optional[int], Dict[str, str], str]:
-        """Playwright 컨텍스트 요청으로 JSON 가져오기"""
+        """Playwright 컨텍스트 요청(직접 HTTP 전송 사용 시 httpx)으로 JSON 가져오기 (본문은 1회만 읽고 1회만 파싱)
+
+        반환 텍스트는 비정상 응답에서만 채움 (200은 파싱 결과를 그대로 전달)
+        """
+        await self._wait_if_paused()
+        started = time.perf_counter()
+        if self._har_replay is not None:
+            replayed = self._har_replay.lookup(method, url, payload)
+            if replayed is None:
+                self.metrics.observe_request(url, None, time.perf_counter() - started, 0)
+                return None, None, {}, ""
+            return self._decode_json_response(url, replayed.status, dict(replayed.headers),
+                                              replayed.body, started)
         try:
             if url.startswith(self._fin_api_url):
                 merged_headers = self._force_headers(headers)
             else:
                 merged_headers = dict(headers or {})
-            if method.upper() == "POST":
-                body = json.dumps(payload or {}, ensure_ascii=False)
+            request_body = json.dumps(payload or {}, ensure_ascii=False) if method.upper() == "POST" else None
+            if self._http is not None:
+                fetched = await self._fetch_via_http(method, url, merged_headers, request_body, started)
+                if fetched is not None:
+                    status, resp_headers, body = fetched
+                    return self._decode_json_response(url, status, resp_headers, body, started)
+                started = time.perf_counter()
+            if request_body is not None:
                 response = await self._context.request.post(
-                    url, headers=merged_headers, data=body, timeout=30000
+                    url, headers=merged_headers, data=request_body, timeout=30000
                 )
             else:
                 response = await self._context.request.get(url, headers=merged_headers, timeout=30000)
             status = response.status
             resp_headers = response.headers or {}
-            text = ""
             try:
-                text = await response.text()
+                body = await response.body()
             except Exception:
-                text = ""
+                body = b""
 
             if not self._cookie_logged:
                 try:
@@ -494,19 +788,79 @@ class NaverEstateCrawler:
                     await self._log_cookie_presence()
                 self._cookie_logged = True
 
-            try:
-                text_preview = text[:300]
-                self._log(f"API 응답 status={status}, body_preview={text_preview}")
-            except Exception:
-                self._log(f"API 응답 status={status}, body_preview=unavailable")
-            if status == 200:
-                data = await response.json()
-                return data, status, resp_headers, text
-            return None, status, resp_headers, text
+            return self._decode_json_response(url, status, resp_headers, body, started)
         except Exception as e:
             self._log(f"✗ 컨텍스트 요청 오류: {e}")
+            self.metrics.observe_request(url, None, time.perf_counter() - started, 0)
             return None, None, {}, ""
 
+    async def _open_http_transport(self):
+        """워밍업된 컨텍스트 쿠키로 직접 HTTP 전송 준비 (httpx 미설치 시 브라우저 전송 유지)"""
+        if self.transport != "http" or self._har_replay is not None:
+            return
+        from crawler import http_transport
+        if not http_transport.is_available():
+            self._log("⚠ httpx 미설치: 브라우저 전송으로 수집합니다 (pip install \"httpx[http2]\")")
+            return
+        transport = http_transport.HttpTransport(self._context, self._fin_user_agent, self.concurrency)
+        try:
+            cookie_count = await transport.import_cookies()
+        except Exception as e:
+            self._log(f"⚠ 직접 HTTP 전송 준비 실패, 브라우저 전송 사용: {e}")
+            await transport.close()
+            return
+        self._http = transport
+        self._log(f"✓ 직접 HTTP 전송 사용 (HTTP/2: {transport.http2}, 쿠키 {cookie_count}개)")
+
+    async def _close_http_transport(self):
+        """직접 HTTP 전송 종료"""
+        transport, self._http = self._http, None
+        if transport is not None:
+            self._log(f"직접 HTTP 전송 종료 (쿠키 동기화 {transport.cookie_syncs}회)")
+            try:
+                await transport.close()
+            except Exception:
+                pass
+
+    async def _fetch_via_http(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        request_body: Optional[str],
+        started: float
+    ) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """직접 HTTP 요청 (401이면 브라우저 전송으로 전환하고 None 반환)"""
+        transport = self._http
+        status, resp_headers, body = await transport.fetch(method, url, headers, request_body)
+        if status != 401:
+            return status, resp_headers, body
+        self.metrics.observe_request(url, status, time.perf_counter() - started, len(body))
+        if self._http is transport:
+            self._log("⚠ 직접 HTTP 전송 401: 이후 요청은 브라우저 전송으로 전환")
+            await self._close_http_transport()
+        return None
+
+    def _decode_json_response(
+        self,
+        url: str,
+        status: int,
+        resp_headers: Dict[str, str],
+        body: bytes,
+        started: float
+    ) -> Tuple[Optional[Dict], Optional[int], Dict[str, str], str]:
+        """응답 본문(bytes) → JSON (미리보기는 디버그 모드에서만 생성)"""
+        if self.debug:
+            preview = body[:300].decode("utf-8", errors="replace")
+            self._log(f"API 응답 status={status}, body_preview={preview}")
+        self.metrics.observe_request(url, status, time.perf_counter() - started, len(body))
+        if status == 200:
+            try:
+                return fastjson.loads(body), status, resp_headers, ""
+            except ValueError:
+                self._log(f"⚠ JSON 파싱 실패: {url}")
+        return None, status, resp_headers, body.decode("utf-8", errors="replace")
+
     async def _request_with_retry(
         self,
         url: str,
@@ -514,13 +868,56 @@ class NaverEstateCrawler:
         method: str = "GET",
         payload: Optional[Dict] = None,
         max_retries: int = 5
+    ) -> Optional[Dict]:
+        """재시도 요청 (같은 method/url/payload 요청이 진행 중이면 그 결과를 함께 기다림)"""
+        key = (
+            method.upper(), url,
+            json.dumps(payload, sort_keys=True, ensure_ascii=False) if payload is not None else "",
+        )
+        shared = self._inflight.get(key)
+        if shared is not None:
+            self.metrics.record_coalesced(url)
+        while shared is not None:
+            # 대기 중인 호출자가 취소되어도 공유 요청은 계속 진행
+            data = await asyncio.shield(shared)
+            if data is not _REISSUE:
+                return data
+            # 시작한 호출자만 취소된 것이므로 진행 중인 다른 요청을 기다리거나 직접 요청
+            shared = self._inflight.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            data = await self._request_with_retry_uncoalesced(url, headers, method, payload, max_retries)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.set_result(_REISSUE)
+            else:
+                future.set_exception(e)
+                # 대기자가 없으면 "exception never retrieved" 경고 방지
+                future.exception()
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            del self._inflight[key]
+
+    async def _request_with_retry_uncoalesced(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        method: str = "GET",
+        payload: Optional[Dict] = None,
+        max_retries: int = 5
     ) -> Optional[Dict]:
         """401/404/429 대응 포함 Playwright 컨텍스트 요청 재시도 로직"""
         attempt = 0
         cooldown_min = 120
         cooldown_max = 300
 
-        while not self.is_cancelled:
+        while not self._should_stop():
+            generation = self._session_generation
             data, status, resp_headers, _text = await self._fetch_json_via_context(
                 url, headers, method=method, payload=payload
             )
@@ -529,11 +926,20 @@ class NaverEstateCrawler:
                 return data
 
             self._log_http_issue(url, status, resp_headers)
+            if self._har_replay is not None:
+                # 재생은 결정적이므로 재시도 무의미
+                return None
+            if status is None and not self._is_context_alive():
+                # 컨텍스트 종료: 복구(대기 컨텍스트 전환) 후 같은 요청 재전송
+                if self._recovery_lock is not None and await self._recover_shared(generation):
+                    continue
+                return None
+            self.metrics.record_retry(url)
 
             if status == 401:
-                await asyncio.sleep(2)
+                await self._sleep(2)
             elif status == 404:
-                await asyncio.sleep(2)
+                await self._sleep(2)
             elif status == 429:
                 retry_after = resp_headers.get("retry-after")
                 if retry_after:
@@ -542,19 +948,22 @@ class NaverEstateCrawler:
                     except Exception:
                         wait_sec = 10
                     self._log(f"⚠ 429 발생. Retry-After={wait_sec}s 대기 후 재시도...")
-                    await asyncio.sleep(wait_sec)
+                    self.metrics.record_cooldown(wait_sec)
+                    await self._sleep(wait_sec)
                 else:
                     backoff = min(2 ** attempt, 60) + random.uniform(0.5, 2.0)
                     self._log(f"⚠ 429 발생. 백오프 {backoff:.1f}s 대기...")
-                    await asyncio.sleep(backoff)
+                    self.metrics.record_cooldown(backoff)
+                    await self._sleep(backoff)
             else:
-                await asyncio.sleep(2)
+                await self._sleep(2)
 
             attempt += 1
             if attempt > max_retries:
                 cooldown = random.uniform(cooldown_min, cooldown_max)
                 self._log(f"⚠ 재시도 한도 초과. 쿨다운 {int(cooldown)}s 후 재시도...")
-                await asyncio.sleep(cooldown)
+                self.metrics.record_cooldown(cooldown)
+                await self._sleep(cooldown)
                 attempt = 0
 
         return None
@@ -569,7 +978,7 @@ class NaverEstateCrawler:
     ) -> Tuple[Optional[Dict], Optional[int], Dict[str, str], str]:
         """메타 정보 포함 재시도 요청"""
         attempt = 0
-        while not self.is_cancelled:
+        while not self._should_stop():
             data, status, resp_headers, text = await self._fetch_json_via_context(
                 url, headers, method=method, payload=payload
             )
@@ -577,7 +986,10 @@ class NaverEstateCrawler:
                 return data, status, resp_headers, text
 
             self._log_http_issue(url, status, resp_headers)
-            await asyncio.sleep(2)
+            if self._har_replay is not None:
+                return data, status, resp_headers, text
+            self.metrics.record_retry(url)
+            await self._sleep(2)
             attempt += 1
             if attempt > max_retries:
                 return data, status, resp_headers, text
@@ -610,132 +1022,699 @@ class NaverEstateCrawler:
 
     async def _fetch_article_detail(self, article_no: str) -> Optional[Dict]:
         """상세 JSON API 호출"""
-        detail_url = f"https://new.land.naver.com/api/articles/{article_no}"
-        return await self._request_with_retry(detail_url, self.api_headers, method="GET")
-    
+        detail_url = f"{self._warmup_url}/api/articles/{article_no}"
+        with self._tracer.span("detail", "detail_fetch", {"article": article_no}):
+            return await self._request_with_retry(detail_url, self.api_headers, method="GET")
+
+    @staticmethod
+    def _request_params(request: Dict) -> Dict:
+        """list 요청 파라미터 (POST 본문 또는 GET 쿼리)"""
+        if request.get("method") == "POST":
+            return request.get("payload") or {}
+        return {k: v[0] for k, v in parse_qs(urlparse(request.get("url") or "").query).items()}
+
+    def _list_key(self, request: Dict) -> ListKey:
+        """list 요청 → 캡처 보관 키 (거래유형, 페이지)"""
+        params = self._request_params(request)
+        try:
+            page_no = int(params.get("page") or 1)
+        except (TypeError, ValueError):
+            page_no = 1
+        return self._request_trade_type(request), page_no
+
+    def _template_trade_type(self) -> Optional[str]:
+        """워밍업 중 캡처한 list 요청의 거래유형 (단일 거래유형일 때만)"""
+        return self._request_trade_type(self._list_request or {})
+
+    def _request_trade_type(self, request: Dict) -> Optional[str]:
+        """list 요청의 거래유형 (단일 거래유형일 때만)"""
+        payload = self._request_params(request)
+        for key in _TRADE_TYPE_KEYS:
+            value = payload.get(key)
+            if isinstance(value, list):
+                return value[0] if len(value) == 1 else None
+            if isinstance(value, str) and value:
+                return value if "," not in value and ":" not in value else None
+        # 거래유형이 요청에 드러나지 않으면 진입 URL의 거래유형으로 간주
+        return self.trade_types[0]
+
+    def _list_params(self, base: Optional[Dict], trade_type: str) -> Dict:
+        """캡처한 요청 파라미터에 거래유형/필터 적용"""
+        params = dict(base or {})
+        applied = False
+        for key in _TRADE_TYPE_KEYS:
+            if key in params:
+                params[key] = [trade_type] if isinstance(params[key], list) else trade_type
+                applied = True
+        if not applied:
+            params["tradeTypes"] = [trade_type]
+        params.update(self.list_filters)
+        return params
+
+    async def _fetch_list_page(self, page_no: int, page_size: int = 20,
+                               trade_type: Optional[str] = None) -> Optional[ListPage]:
+        """list API 페이지 요청 (세션 워밍업 시 캡처한 요청 형태 재사용, 응답은 필드 값 튜플로 변환)"""
+        trade_type = trade_type or self.trade_types[0]
+        if not self.list_filters:
+            # 페이지에서 캡처한 같은 거래유형/페이지 응답 재사용
+            captured = self._captured.pop((trade_type, page_no))
+            if captured is not None:
+                self.metrics.record_cache_hit("list")
+                return captured
+        template = self._list_request or {"method": "GET", "url": self._fin_api_url, "payload": None}
+        with self._tracer.span("list_page", "list_fetch", {"page": page_no, "trade_type": trade_type}):
+            if template["method"] == "POST":
+                payload = self._list_params(template["payload"], trade_type)
+                payload["page"] = page_no
+                payload.setdefault("size", page_size)
+                data = await self._request_with_retry(self._fin_api_url, {}, method="POST", payload=payload)
+            else:
+                query = {k: v[0] for k, v in parse_qs(urlparse(template["url"]).query).items()}
+                url = self._build_api_url(template["url"], page_no, page_size,
+                                          self._list_params(query, trade_type))
+                data = await self._request_with_retry(url, {}, method="GET")
+        return None if data is None else parse_list_page(self._fields, data)
+
+    def _needs_floor_detail(self, floor: str) -> bool:
+        """층수가 저/중/고 또는 미기재라 상세 조회가 필요한지 여부"""
+        return not re.match(r"^B?\d+/\d+", floor or "")
+
+    def _apply_building_index(self, article_no: Optional[str], property_info: Dict[str, str]) -> bool:
+        """
+        동/층 색인으로 층수 보정 (상세 조회가 더 필요 없으면 True)
+
+        확인된 층수는 색인에 학습, 이전에 확인한 매물은 저장된 층수 재사용,
+        전체 층수가 빠진 표기는 동 전체 층수로 채움
+        """
+        floor = property_info.get("층수", "")
+        index = self._buildings
+        if index is None:
+            return not self._needs_floor_detail(floor)
+        dong = property_info.get("동", "")
+        if not self._needs_floor_detail(floor):
+            index.learn(dong, floor, article_no)
+            return True
+        cached = index.lookup(article_no)
+        if cached:
+            property_info["층수"] = cached
+            self._floor_indexed += 1
+            self.metrics.record_cache_hit("floor_index")
+            return True
+        filled = index.fill(dong, floor)
+        if filled != floor:
+            property_info["층수"] = filled
+            if not self._needs_floor_detail(filled):
+                # "15" + 동 전체 층수 → "15/30층"
+                self._floor_indexed += 1
+                self.metrics.record_cache_hit("floor_index")
+                return True
+        return False
+
+    def _learn_floor(self, article_no: Optional[str], property_info: Dict[str, str]):
+        """상세 조회로 확인한 층수를 색인에 반영"""
+        if self._buildings is not None:
+            self._buildings.learn(property_info.get("동", ""), property_info.get("층수", ""), article_no)
+
+    def _save_building_index(self):
+        """동/층 색인 저장 + 상세 요청 절감 요약"""
+        if self._buildings is None:
+            return
+        if self._floor_indexed or self._floor_details:
+            self._log(f"층수 보정: 색인 {self._floor_indexed}건, 상세 조회 {self._floor_details}건")
+        try:
+            self._buildings.save()
+        except OSError as e:
+            self._log(f"⚠ 동/층 색인 저장 실패: {e}")
+
+    async def _resolve_floor(self, article_no: Optional[str], property_info: Dict[str, str],
+                             semaphore: asyncio.Semaphore):
+        """저/중/고 매물만 상세 JSON으로 층수 보정 (동/층 색인으로 확인되면 생략)"""
+        if self._apply_building_index(article_no, property_info) or not article_no:
+            return
+        if self._deadline_near():
+            # 마감 임박: 남은 시간은 새 list 페이지 수집에 사용
+            self._floor_skipped += 1
+            return
+        async with semaphore:
+            if self._should_stop():
+                return
+            self._floor_details += 1
+            detail = await self._fetch_article_detail(article_no)
+            detail_floor = self._extract_floor_from_detail_json(detail)
+            if detail_floor:
+                property_info["층수"] = detail_floor
+                self._learn_floor(article_no, property_info)
+
+    def _open_checkpoint(self):
+        """체크포인트 저널 열기 (resume 시 저널 재생 후 상태 복원)"""
+        if self.resume and not self.run_id:
+            self.run_id = CheckpointJournal.latest_unfinished_run(self.checkpoint_dir, url=self.base_url)
+            if not self.run_id:
+                self._log("재개할 체크포인트가 없습니다. 처음부터 수집합니다.")
+        if not self.run_id:
+            self.run_id = CheckpointJournal.new_run_id()
+
+        self._journal = CheckpointJournal(self.run_id, self.checkpoint_dir)
+        if self.resume:
+            state = self._journal.replay()
+            self.results = list(state.records)
+            self._seen_article_ids.update(state.article_ids)
+            self._resume_position = state.last_position
+            self._completed_pages = set(state.completed_pages)
+            self._completed_trade_pages = {k: set(v) for k, v in state.completed_trade_pages.items()}
+            self._log(
+                f"체크포인트 재개: run_id={self.run_id}, 복원 {len(self.results)}건, "
+                f"마지막 위치 {self._resume_position + 1}"
+            )
+            if self.property_found_callback:
+                for record in self.results:
+                    self.property_found_callback(record)
+        else:
+            self._log(f"체크포인트 run_id={self.run_id}")
+
+        self._journal.open()
+        self._journal.record_start({
+            "url": self.base_url, "mode": self.mode, "resume": self.resume,
+            "trade_types": self.trade_types,
+        })
+
+    def _close_checkpoint(self, finished: bool = False):
+        """체크포인트 저널 닫기 (정상 완료 시 done 기록)"""
+        if not self._journal:
+            return
+        try:
+            if finished:
+                self._journal.record_done(len(self.results))
+            self._journal.close()
+        except Exception as e:
+            self._log(f"⚠ 체크포인트 저장 실패: {e}")
+        self._journal = None
+
+    def _is_checkpointed(self, position: int, article_id: Optional[str]) -> bool:
+        """이미 커밋된 매물인지 여부"""
+        if article_id:
+            return article_id in self._seen_article_ids
+        return position <= self._resume_position
+
+    def _commit_record(self, position: int, article_id: Optional[str], property_info: Dict[str, str]):
+        """매물 1건 결과 반영 + 저널 기록 + 콜백"""
+        if article_id:
+            # 스냅샷 비교(매물번호 조인)용
+            property_info.setdefault('매물번호', article_id)
+        self.results.append(property_info)
+        if article_id:
+            self._seen_article_ids.add(article_id)
+        if self._journal:
+            self._journal.record_article(position, article_id, property_info)
+        if self.property_found_callback:
+            with self._tracer.span("property_found", "callback"):
+                self.property_found_callback(property_info)
+
+    async def _extract_article_id(self, item) -> Optional[str]:
+        """리스트 아이템 링크에서 매물 ID 추출"""
+        try:
+            href = await item.get_attribute("href") or ""
+        except Exception:
+            return None
+        match = re.search(r"/articles/(\d+)", href)
+        if match:
+            return match.group(1)
+        return None
+
+    async def _collect_dom_item(self, item, article_id: Optional[str] = None) -> Dict[str, str]:
+        """리스트 아이템 텍스트 + 상세 패널에서 매물 정보 수집 (층수가 확인된 카드는 클릭 생략)"""
+        try:
+            text = await item.inner_text()
+        except Exception:
+            text = ""
+
+        dong = ""
+        price = ""
+        area = ""
+        floor = ""
+
+        dong_match = re.search(r"\d+동", text)
+        if dong_match:
+            dong = dong_match.group(0)
+
+        area_match = re.search(r"\d+(\.\d+)?㎡", text)
+        if area_match:
+            area = area_match.group(0)
+
+        price_match = re.search(r"\d+억\s?\d*,?\d*만원|\d+억|\d+만원", text)
+        if price_match:
+            price = price_match.group(0)
+
+        floor_match = re.search(r"\d+/\d+층|저|중|고", text)
+        if floor_match:
+            floor = floor_match.group(0)
+
+        property_info = {"동": dong, "가격": price, "면적": area, "층수": floor}
+        if self._apply_building_index(article_id, property_info):
+            return property_info
+        floor = property_info["층수"]
+
+        # 상세 패널에서 층수/해당층 파싱 (마감 임박 시 생략)
+        if self._deadline_near():
+            self._floor_skipped += 1
+            return property_info
+        try:
+            self._floor_details += 1
+            with self._tracer.span("detail_panel", "detail_fetch"):
+                detail_floor = await self._fetch_detail_floor(item)
+            if detail_floor:
+                floor = detail_floor
+        except Exception:
+            self._log("상세 패널 파싱 실패, 리스트 값 사용")
+
+        property_info["층수"] = floor
+        self._learn_floor(article_id, property_info)
+        return property_info
+
+    async def _fetch_detail_floor(self, item) -> str:
+        """상세 탭에서 카드 링크(매물 상세 URL)를 열어 층수 추출 (탭이 없거나 링크가 없으면 카드 클릭 상세 패널)"""
+        href = await item.get_attribute("href") if self._tabs is not None else None
+        if href:
+            url = urljoin(self._page.url, href)
+            async with self._tabs.page() as tab:
+                await tab.goto(url, wait_until="domcontentloaded", timeout=30000)
+                await tab.wait_for_load_state("networkidle")
+                return await self._extract_floor_from_detail_table(tab)
+        await item.click()
+        await self._page.wait_for_load_state("networkidle")
+        await self._sleep(0.8)
+        return await self._extract_floor_from_detail_table(self._page)
+
+    async def _reset_tabs(self):
+        """현재 컨텍스트의 상세 조회 탭 풀 준비 (컨텍스트가 바뀌었으면 이전 탭 정리)"""
+        if self._tabs is not None and self._tabs.context is self._context:
+            return
+        stale, self._tabs = self._tabs, PagePool(
+            self._context, self.concurrency, setup=lambda page: page.on("response", self._log_redirects)
+        )
+        if stale is not None:
+            await stale.close()
+
     async def crawl(self):
-        """크롤링 메인 함수"""
+        """크롤링 메인 함수 (cancel/pause/resume은 다른 스레드에서 호출 가능)"""
         self.is_cancelled = False
+        self.is_paused = False
+        self.deadline_reached = False
+        self.finished = False
         self.results = []
+        self._floor_skipped = 0
+        self._floor_indexed = 0
+        self._floor_details = 0
+        if self.building_index_dir:
+            self._buildings = BuildingIndex(self.complex_id, self.building_index_dir).load()
+            if len(self._buildings):
+                self._log(f"동/층 색인: 동 {len(self._buildings.dongs)}개, 확인된 매물 층수 {len(self._buildings)}건")
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._resume_event = asyncio.Event()
+        self._resume_event.set()
+        if self.replay_har and self._har_replay is None:
+            self._log(f"HAR 재생 모드: {self.replay_har}")
+            self._har_replay = HarReplay(self.replay_har)
+        self._open_checkpoint()
+        archive = (os.path.join(self.list_archive_dir, f"{self.run_id}.list.jsonl.gz")
+                   if self.list_archive_dir else None)
+        self._captured = ListCapture(self._fields, self.list_memory_mb, archive)
+
+        deadline_handle = None
+        if self.deadline:
+            self._deadline_at = time.monotonic() + self.deadline
+            deadline_handle = self._loop.call_later(self.deadline, self._on_deadline)
+            self._log(f"마감 모드: {self.deadline:.0f}s 후 부분 결과로 종료")
+        self._session_task = asyncio.ensure_future(self._crawl_session())
+        try:
+            self.finished = await self._session_task
+        except asyncio.CancelledError:
+            # 중지/마감 유예 초과로 진행 중인 대기를 끊은 경우만 정상 종료 처리
+            if not self._should_stop():
+                raise
+            self.finished = False
+            self._log_stopped()
+            await self._close_context("interrupted")
+        finally:
+            for handle in (deadline_handle, self._grace_handle):
+                if handle is not None:
+                    handle.cancel()
+            self._grace_handle = None
+            self._deadline_at = None
+            self._session_task = None
+            self._loop = None
+            self._close_checkpoint(self.finished)
+            if self._har_replay is not None:
+                for line in self._har_replay.report():
+                    self._log(line)
+            self._save_building_index()
+            self._captured.close()
+            self._report_trace()
+            self._report_metrics()
+            self._report_memory()
+
+    def _report_metrics(self):
+        """요청 지표 요약 로그 + Prometheus 텍스트 파일 저장"""
+        snapshot = self.metrics.snapshot()
+        self._log(
+            f"요청 지표: 요청 {snapshot['requests']}건, 상태 {snapshot['statuses']}, "
+            f"재시도 {snapshot['retries']}, 쿨다운 {snapshot['cooldowns']}회/{snapshot['cooldown_sec']}s, "
+            f"수신 {snapshot['bytes']:,}B, 캐시 적중 {snapshot['cache_hits']}, "
+            f"중복 요청 공유 {snapshot['coalesced']}, 대기 컨텍스트 전환 {snapshot['failovers']}"
+        )
+        path = self.metrics_path or f"./metrics/{self.run_id}.prom"
+        try:
+            self.metrics.write_prometheus(path)
+            self._log(f"Prometheus 지표 저장: {path}")
+        except Exception as e:
+            self._log(f"⚠ 지표 저장 실패: {e}")
+
+    def _report_memory(self):
+        """list 캡처 보관량 + 프로세스 최대 RSS 로그"""
+        captured = self._captured
+        parts = [
+            f"list 캡처 {captured.captured}건 (보관 최대 {captured.peak_bytes / 1024:,.0f}KB"
+            f"/상한 {captured.max_bytes / 1024:,.0f}KB, 상한 초과 해제 {captured.evicted}건)"
+        ]
+        if captured.archive_error:
+            parts.append(f"원본 보관 실패: {captured.archive_error}")
+        elif captured.archived_bytes:
+            parts.append(f"원본 보관 {captured.archive_path}")
+        self.peak_rss = peak_rss_bytes()
+        if self.peak_rss is None:
+            parts.append("최대 RSS 확인 불가 (Windows는 psutil 필요)")
+        else:
+            parts.append(f"최대 RSS {self.peak_rss / 1024 / 1024:,.1f}MB")
+        self._log("메모리: " + ", ".join(parts))
+
+    def _report_trace(self):
+        """스팬 요약 표 로그 + Chrome trace 파일 저장"""
+        if not self._tracer.enabled:
+            return
+        self._log("=" * 50)
+        self._log("단계별 소요 시간")
+        for line in self._tracer.format_summary():
+            self._log(line)
+        path = self.trace_path or f"./traces/{self.run_id}.trace.json"
+        try:
+            self._tracer.export_chrome_trace(path)
+            self._log(f"Chrome trace 저장: {path}")
+        except Exception as e:
+            self._log(f"⚠ trace 저장 실패: {e}")
 
+    async def _crawl_session(self) -> bool:
+        """세션 확보 후 모드별 수집"""
         # Playwright 시작 (스레드 내부에서 생성/유지)
         self._log("Playwright 시작 중...")
         self._playwright = await async_playwright().start()
         
         # 1단계: Playwright로 세션 확보
         self._progress(0, 100, "Playwright 세션 확보 중...")
-        session_success = await self._setup_playwright_session()
+        with self._tracer.span("session", "warmup"):
+            session_success = await self._setup_playwright_session()
         
         if not session_success:
             self._log("✗ 세션 확보 실패. 크롤링을 중단합니다.")
             self._progress(0, 0, "세션 확보 실패")
-            return
-        
-        if self.is_cancelled:
-            return
+            return False
         
-        # 2단계: DOM 리스트/상세 기반 수집
+        if self._should_stop():
+            return False
+
+        self._start_standby()
+        if self.mode == "api":
+            await self._open_http_transport()
+            finished = await self._crawl_api()
+        else:
+            finished = await self._crawl_dom()
+        if finished is None:
+            return False
+
+        if finished:
+            self._progress(100, 100, "크롤링 완료")
+            self._log("=" * 50)
+            self._log(f"총 {len(self.results)}개의 매물 정보를 수집했습니다.")
+            self._log("=" * 50)
+        else:
+            self._log_stopped()
+
+        # 컨텍스트 정리 (정상 종료 또는 중지 시점에만)
+        await self._close_context("crawl_end")
+        return finished
+
+    async def _crawl_api(self) -> bool:
+        """list JSON 페이지 순회 수집 (거래유형별 병렬, 저/중/고만 상세 JSON 병렬 보정)"""
+        self._log("=" * 50)
+        self._log("2단계: list API 기반 매물 수집 시작")
+        self._log(f"거래유형: {', '.join(TRADE_TYPE_LABELS.get(t, t) for t in self.trade_types)}")
+        self._log("=" * 50)
+        self._progress(10, 100, "매물 데이터 수집 중...")
+
+        # 상세 요청 동시 실행 한도는 모든 거래유형 작업이 공유
+        semaphore = asyncio.Semaphore(self.concurrency)
+        self._recovery_lock = asyncio.Lock()
+        self._next_position = len(self.results)
+        self._pages_done = 0
+        if len(self.trade_types) == 1 and self._completed_pages:
+            # 거래유형 구분 없이 기록된 이전 체크포인트
+            self._completed_trade_pages.setdefault(self.trade_types[0], set()).update(self._completed_pages)
+        results = await asyncio.gather(*(
+            self._crawl_trade_type(trade_type, semaphore) for trade_type in self.trade_types
+        ))
+        return all(results) and not self._should_stop()
+
+    async def _recover_shared(self, generation: int) -> bool:
+        """거래유형 작업 공용 컨텍스트 복구 (다른 작업이 이미 복구했으면 재요청만)"""
+        async with self._recovery_lock:
+            if self._session_generation != generation:
+                return True
+            if self._is_context_alive() or self._recoveries >= self._max_recoveries:
+                return False
+            self._recoveries += 1
+            if not await self._recover_session():
+                return False
+            self._session_generation += 1
+            return True
+
+    async def _crawl_trade_type(self, trade_type: str, semaphore: asyncio.Semaphore) -> bool:
+        """거래유형 1개의 list 페이지 순회 (레코드에 거래유형 표시)"""
+        label = TRADE_TYPE_LABELS.get(trade_type, trade_type)
+        completed = self._completed_trade_pages.setdefault(trade_type, set())
+        first_page, last_page = self.page_range or (1, None)
+        page_no = max(max(completed, default=0) + 1, first_page)
+        while not self._should_stop():
+            if last_page is not None and page_no > last_page:
+                break
+            generation = self._session_generation
+            list_page = await self._fetch_list_page(page_no, trade_type=trade_type)
+            if list_page is None:
+                # 컨텍스트 종료: 복구 후 같은 페이지 재요청
+                if self._should_stop() or not await self._recover_shared(generation):
+                    return False
+                continue
+            rows, has_more = list_page
+            if not rows:
+                break
+
+            self._log(f"[{label}] list 페이지 {page_no}: {len(rows)}건")
+            batch = []
+            with self._tracer.span("parse_page", "parse", {"page": page_no, "items": len(rows),
+                                                           "trade_type": trade_type}):
+                for values in rows:
+                    article_no = str(values[0]) if values[0] else None
+                    if article_no and article_no in self._seen_article_ids:
+                        continue
+                    property_info = self._format_property(values)
+                    if property_info:
+                        property_info['거래유형'] = label
+                        batch.append((article_no, property_info))
+
+            await asyncio.gather(*(
+                self._resolve_floor(article_no, property_info, semaphore)
+                for article_no, property_info in batch
+            ))
+            # 마감 시에는 이미 받은 페이지까지 커밋 (상세 보정 못 한 매물은 list 층수 유지)
+            if self.is_cancelled:
+                break
+
+            for article_no, property_info in batch:
+                # 다른 거래유형 작업이 먼저 커밋한 매물은 건너뜀
+                if article_no and article_no in self._seen_article_ids:
+                    continue
+                self._commit_record(self._next_position, article_no, property_info)
+                self._next_position += 1
+            completed.add(page_no)
+            if self._journal:
+                self._journal.record_page(page_no, trade_type)
+            self._pages_done += 1
+            self._progress(min(95, 10 + self._pages_done * 5), 100,
+                           f"[{label}] list 페이지 {page_no} 완료 ({len(self.results)}건)")
+
+            if has_more is False:
+                break
+            page_no += 1
+            await self._sleep(random.uniform(self.min_wait, self.max_wait))
+
+        return not self._should_stop()
+
+    async def _crawl_dom(self) -> Optional[bool]:
+        """카드 목록 기반 수집 (상세 탭 수만큼 병렬, 체크포인트 위치부터, 컨텍스트 종료 시 자동 복구)"""
         self._log("=" * 50)
         self._log("2단계: DOM 리스트/상세 기반 매물 수집 시작")
         self._log("=" * 50)
         
         self._progress(10, 100, "매물 데이터 수집 중...")
 
-        await asyncio.sleep(2)
+        await self._sleep(2)
 
         items = await self._extract_list_items(self._page)
         if not items:
             self._log("매물 리스트를 찾지 못했습니다.")
             await self._close_context("no_list")
-            return
+            return None
 
+        await self._reset_tabs()
+        self._log(f"상세 조회 탭 {self._tabs.size}개")
+        trade_label = TRADE_TYPE_LABELS.get(self.trade_types[0], self.trade_types[0])
         total_items = len(items)
-        total_collected = 0
-        for idx, item in enumerate(items, 1):
-            if self.is_cancelled:
+        recoveries = 0
+        idx = 0
+        while idx < total_items:
+            if self._should_stop():
                 break
 
-            self._log(f"매물 {idx}/{total_items} 처리 중...")
+            if not self._is_context_alive():
+                if recoveries >= self._max_recoveries:
+                    self._log("✗ 컨텍스트 복구 한도 초과. 수집을 중단합니다.")
+                    break
+                recoveries += 1
+                if not await self._recover_session():
+                    break
+                await self._reset_tabs()
+                items = await self._extract_list_items(self._page)
+                total_items = len(items)
+                continue
+
+            # 탭 수만큼 묶어 병렬 수집 후 위치 순서대로 커밋
+            batch = []
+            batch_ids = set()
+            position = idx
+            while position < total_items and len(batch) < self._tabs.size:
+                item = items[position]
+                article_id = await self._extract_article_id(item)
+                if not self._is_checkpointed(position, article_id) and article_id not in batch_ids:
+                    batch.append((position, item, article_id))
+                    if article_id:
+                        batch_ids.add(article_id)
+                position += 1
+            if not batch:
+                idx = position
+                continue
+
+            first, last = batch[0][0] + 1, batch[-1][0] + 1
+            label = f"{first}/{total_items}" if first == last else f"{first}~{last}/{total_items}"
+            self._log(f"매물 {label} 처리 중...")
             self._progress(
-                int(10 + (idx / max(1, total_items)) * 85),
+                int(10 + (last / max(1, total_items)) * 85),
                 100,
-                f"매물 {idx}/{total_items} 처리 중..."
+                f"매물 {label} 처리 중..."
             )
 
-            try:
-                text = await item.inner_text()
-            except Exception:
-                text = ""
-
-            dong = ""
-            price = ""
-            area = ""
-            floor = ""
-
-            dong_match = re.search(r"\d+동", text)
-            if dong_match:
-                dong = dong_match.group(0)
-
-            area_match = re.search(r"\d+(\.\d+)?㎡", text)
-            if area_match:
-                area = area_match.group(0)
-
-            price_match = re.search(r"\d+억\s?\d*,?\d*만원|\d+억|\d+만원", text)
-            if price_match:
-                price = price_match.group(0)
+            collected = await asyncio.gather(*(
+                self._collect_dom_item(item, article_id) for _, item, article_id in batch
+            ))
+            if not self._is_context_alive():
+                # 처리 도중 컨텍스트 종료: 커밋하지 않고 복구 후 같은 위치 재시도
+                continue
 
-            floor_match = re.search(r"\d+/\d+층|저|중|고", text)
-            if floor_match:
-                floor = floor_match.group(0)
+            for (item_position, _, article_id), property_info in zip(batch, collected):
+                property_info.setdefault('거래유형', trade_label)
+                self._commit_record(item_position, article_id, property_info)
+                self._log(
+                    f"  ✓ [{len(self.results)}] 동: {property_info['동']}, 가격: {property_info['가격']}, "
+                    f"면적: {property_info['면적']}, 층수: {property_info['층수']}"
+                )
+            idx = position
 
-            # 상세 패널에서 층수/해당층 파싱
-            try:
-                await item.click()
-                await self._page.wait_for_load_state("networkidle")
-                await asyncio.sleep(0.8)
-                detail_floor = await self._extract_floor_from_detail_table(self._page)
-                if detail_floor:
-                    floor = detail_floor
-            except Exception:
-                self._log("상세 패널 파싱 실패, 리스트 값 사용")
+            await self._sleep(random.uniform(self.min_wait, self.max_wait))
 
-            property_info = {
-                "동": dong,
-                "가격": price,
-                "면적": area,
-                "층수": floor,
-            }
-
-            self.results.append(property_info)
-            total_collected += 1
-            self._log(
-                f"  ✓ [{total_collected}] 동: {dong}, 가격: {price}, 면적: {area}, 층수: {floor}"
-            )
-            if self.property_found_callback:
-                self.property_found_callback(property_info)
+        if not self._should_stop() and idx >= total_items:
+            if self._journal:
+                self._journal.record_page(1)
+            return True
+        return False
 
-            await asyncio.sleep(random.uniform(self.min_wait, self.max_wait))
-        
-        if not self.is_cancelled:
-            self._progress(100, 100, "크롤링 완료")
-            self._log("=" * 50)
-            self._log(f"총 {len(self.results)}개의 매물 정보를 수집했습니다.")
-            self._log("=" * 50)
-        else:
-            self._log("크롤링이 중지되었습니다.")
+    def _log_stopped(self):
+        """중지/마감/중단 종료 로그"""
+        if self.is_cancelled:
+            self._log(f"크롤링이 중지되었습니다. (수집 {len(self.results)}건)")
+            return
+        if self.deadline_reached:
+            skipped = f", 상세 보정 생략 {self._floor_skipped}건" if self._floor_skipped else ""
+            self._log(f"마감 시간 도달: 부분 결과 {len(self.results)}건{skipped}")
+        self._log(f"크롤링이 중단되었습니다. resume으로 run_id={self.run_id} 이어서 수집 가능")
+
+    def _call_in_loop(self, callback: Callable):
+        """크롤링 실행 루프에서 콜백 실행 (GUI 등 다른 스레드 호출 대응)"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(callback)
+        except RuntimeError:
+            # 루프 종료 직후 호출
+            pass
+
+    def _interrupt(self, hard: bool):
+        """대기 중인 sleep/일시정지를 깨우고, hard면 진행 중인 작업도 취소"""
+        self._stop_event.set()
+        self._resume_event.set()
+        if hard and self._session_task is not None and not self._session_task.done():
+            self._session_task.cancel()
+
+    def _on_deadline(self):
+        """마감 도달: 새 요청 중단, 유예 시간 후에도 진행 중이면 작업 취소"""
+        self.deadline_reached = True
+        self._log("⏱ 마감 시간 도달. 진행 중인 요청 정리 후 종료합니다.")
+        self._interrupt(hard=False)
+        self._grace_handle = self._loop.call_later(DEADLINE_GRACE_SEC, self._interrupt, True)
 
-        # 컨텍스트 정리 (정상 종료 또는 중지 시점에만)
-        await self._close_context("crawl_end")
-    
     def cancel(self):
-        """크롤링 취소"""
+        """크롤링 취소 (진행 중인 대기/요청을 즉시 중단, 커밋된 결과는 유지)"""
         self.is_cancelled = True
         self._log("크롤링 취소 요청됨...")
+        self._call_in_loop(lambda: self._interrupt(hard=True))
+
+    def pause(self):
+        """일시정지 (진행 중인 요청은 마치고 다음 요청/대기 전에 멈춤)"""
+        if self.is_paused:
+            return
+        self.is_paused = True
+        self._log("크롤링 일시정지")
+        if self._resume_event is not None:
+            self._call_in_loop(self._resume_event.clear)
+
+    def resume_crawl(self):
+        """일시정지 해제"""
+        if not self.is_paused:
+            return
+        self.is_paused = False
+        self._log("크롤링 재개")
+        if self._resume_event is not None:
+            self._call_in_loop(self._resume_event.set)
 
     async def _close_context(self, reason: str):
         """컨텍스트/페이지 종료 (조건부)"""
         self._log(f"컨텍스트 종료 요청: {reason}")
         self._log("".join(traceback.format_stack(limit=6)))
+        await self._close_http_transport()
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        if self._tabs is not None:
+            await self._tabs.close()
+            self._tabs = None
 
         if self._page:
             try:
@@ -751,6 +1730,13 @@ class NaverEstateCrawler:
                 pass
             self._context = None
 
+        if self._standby_browser is not None:
+            try:
+                await self._standby_browser.close()
+            except Exception:
+                pass
+            self._standby_browser = None
+
         if self._playwright:
             try:
                 await self._playwright.stop()
@@ -0,0 +1,56 @@
+"""
+상세 조회용 탭 풀
+같은 컨텍스트 안에서 최대 size개의 탭을 열어 매물 상세 URL을 병렬로 조회하고, 탭은 다음 매물에 재사용
+동시 사용 탭 수가 곧 상세 요청 동시 실행 한도
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Callable, List, Optional
+
+
+class PagePool:
+    """컨텍스트 1개의 상세 조회 탭 (필요할 때 생성, 닫힌 탭은 새로 생성)"""
+
+    def __init__(self, context, size: int, setup: Optional[Callable] = None):
+        """
+        Args:
+            context: 탭을 열 Playwright BrowserContext
+            size: 최대 탭 수
+            setup: 새 탭에 이벤트/라우팅을 연결하는 함수 (선택)
+        """
+        self.context = context
+        self.size = max(1, size)
+        self._setup = setup
+        self._slots = asyncio.Semaphore(self.size)
+        self._idle: List = []
+        self._pages: List = []
+
+    @asynccontextmanager
+    async def page(self):
+        """유휴 탭 1개 대여 (모두 사용 중이면 반납까지 대기)"""
+        async with self._slots:
+            page = None
+            while self._idle and page is None:
+                candidate = self._idle.pop()
+                if not candidate.is_closed():
+                    page = candidate
+            if page is None:
+                page = await self.context.new_page()
+                if self._setup is not None:
+                    self._setup(page)
+                self._pages = [p for p in self._pages if not p.is_closed()] + [page]
+            try:
+                yield page
+            finally:
+                if not page.is_closed():
+                    self._idle.append(page)
+
+    async def close(self):
+        """열린 탭 모두 닫기"""
+        pages, self._pages, self._idle = self._pages, [], []
+        for page in pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
@@ -0,0 +1,496 @@
+"""
+적응형 재방문 스케줄러 (상시 실행)
+단지별 매물 변동률로 재방문 주기를 조정하는 우선순위 큐 + 전역 동시 실행/요청 예산
+스케줄 상태는 JSON 파일로 유지하여 재시작 후 이어서 동작
+
+사용법:
+    python -m crawler.scheduler 117804 118000 --concurrency 2 --hourly-budget 3000
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Set, Tuple
+
+from crawler.cli import normalize_complex
+from crawler.context_pool import STANDBY_MODES
+from crawler.list_capture import DEFAULT_MEMORY_MB
+
+RECORD_KEY_FIELDS = ('거래유형', '동', '가격', '면적', '층수')
+
+
+def record_key(record: Dict) -> str:
+    """변동률 계산용 매물 키 (가격이 바뀌면 다른 매물로 봄)"""
+    return "|".join(str(record.get(field, '')) for field in RECORD_KEY_FIELDS)
+
+
+def churn_rate(previous: Set[str], current: Set[str]) -> float:
+    """이전/현재 매물 집합의 변동률 (대칭차 / 합집합)"""
+    union = previous | current
+    if not union:
+        return 0.0
+    return len(previous ^ current) / len(union)
+
+
+class ScheduleEntry:
+    """단지 1개의 재방문 스케줄 상태"""
+
+    def __init__(self, complex_id: str, url: str, interval: float, next_run: float = 0.0):
+        self.complex_id = complex_id
+        self.url = url
+        self.interval = interval
+        self.next_run = next_run
+        self.last_run: Optional[float] = None
+        self.churn = 0.0
+        self.runs = 0
+        self.failures = 0
+        self.last_requests = 0
+        self.keys: List[str] = []
+
+    def to_dict(self) -> Dict:
+        return {
+            "complex_id": self.complex_id,
+            "url": self.url,
+            "interval": self.interval,
+            "next_run": self.next_run,
+            "last_run": self.last_run,
+            "churn": self.churn,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_requests": self.last_requests,
+            "keys": self.keys,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ScheduleEntry":
+        entry = cls(data["complex_id"], data["url"], data["interval"], data.get("next_run", 0.0))
+        entry.last_run = data.get("last_run")
+        entry.churn = data.get("churn", 0.0)
+        entry.runs = data.get("runs", 0)
+        entry.failures = data.get("failures", 0)
+        entry.last_requests = data.get("last_requests", 0)
+        entry.keys = data.get("keys") or []
+        return entry
+
+
+class RequestBudget:
+    """최근 1시간 요청 수 기준 예산 (실행 종료 시 실제 요청 수 차감)"""
+
+    WINDOW = 3600.0
+
+    def __init__(self, hourly_limit: int):
+        self.hourly_limit = hourly_limit
+        self._spent: Deque[Tuple[float, int]] = deque()
+        self._reserved = 0
+
+    def _trim(self, now: float):
+        while self._spent and now - self._spent[0][0] >= self.WINDOW:
+            self._spent.popleft()
+
+    def used(self, now: Optional[float] = None) -> int:
+        self._trim(now or time.time())
+        return sum(count for _ts, count in self._spent) + self._reserved
+
+    def wait_time(self, estimate: int, now: Optional[float] = None) -> float:
+        """estimate 만큼 요청할 수 있을 때까지 남은 시간 (0이면 즉시 가능)"""
+        if self.hourly_limit <= 0:
+            return 0.0
+        now = now or time.time()
+        used = self.used(now)
+        if used == 0 or used + estimate <= self.hourly_limit:
+            return 0.0
+        # 가장 오래된 기록이 창을 벗어날 때 다시 확인
+        if self._spent:
+            return max(1.0, self.WINDOW - (now - self._spent[0][0]))
+        return 60.0
+
+    def reserve(self, estimate: int):
+        self._reserved += estimate
+
+    def settle(self, estimate: int, actual: int):
+        self._reserved = max(0, self._reserved - estimate)
+        self._spent.append((time.time(), actual))
+
+    def to_list(self) -> List[Tuple[float, int]]:
+        self._trim(time.time())
+        return list(self._spent)
+
+    def load(self, spent: List):
+        self._spent = deque((float(ts), int(count)) for ts, count in spent)
+
+
+class RevisitScheduler:
+    """단지 재방문 스케줄러 (우선순위 큐: 다음 실행 시각 순)"""
+
+    def __init__(self, state_path: str = "./scheduler/state.json",
+                 min_interval: float = 3600.0,
+                 max_interval: float = 86400.0,
+                 hot_churn: float = 0.2,
+                 smoothing: float = 0.5,
+                 jitter: float = 0.1,
+                 concurrency: int = 1,
+                 hourly_budget: int = 0,
+                 crawler_options: Optional[Dict] = None,
+                 snapshot_dir: Optional[str] = "./snapshots",
+                 profile_dir: str = "./playwright_data",
+                 log_callback=None):
+        """
+        Args:
+            state_path: 스케줄 상태 파일
+            min_interval: 변동이 많은 단지의 재방문 주기 (초)
+            max_interval: 변동이 없는 단지의 재방문 주기 (초)
+            hot_churn: 이 변동률 이상이면 최소 주기 적용
+            smoothing: 변동률 지수 평활 계수 (최근 실행 가중치)
+            jitter: 실행 시각 무작위 분산 비율 (주기 대비)
+            concurrency: 동시에 실행할 크롤링 수
+            hourly_budget: 시간당 요청 예산 (0이면 제한 없음)
+            crawler_options: NaverEstateCrawler 추가 인자
+            snapshot_dir: 실행별 매물 스냅샷(JSONL) 저장 경로 (None이면 저장 안 함)
+            profile_dir: Chrome 프로필 경로 (동시 실행 시 작업자별 접미사 추가)
+            log_callback: 로그 콜백
+        """
+        self.state_path = state_path
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.hot_churn = hot_churn
+        self.smoothing = smoothing
+        self.jitter = jitter
+        self.concurrency = max(1, concurrency)
+        self.budget = RequestBudget(hourly_budget)
+        self.crawler_options = dict(crawler_options or {})
+        self.snapshot_dir = snapshot_dir
+        self.profile_dir = profile_dir
+        self.log_callback = log_callback
+        self.entries: Dict[str, ScheduleEntry] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._rng = random.Random()
+        self._stop: Optional[asyncio.Event] = None
+        # 큐 변경/종료 요청 시 대기 중인 루프를 깨움
+        self._changed: Optional[asyncio.Event] = None
+        self._running: Set[str] = set()
+
+    def _log(self, message: str):
+        if self.log_callback:
+            self.log_callback(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+
+    def _push(self, entry: ScheduleEntry):
+        self._seq += 1
+        heapq.heappush(self._heap, (entry.next_run, self._seq, entry.complex_id))
+        if self._changed is not None:
+            self._changed.set()
+
+    def add(self, complex_id: str, url: str):
+        """단지 추가 (이미 있으면 유지, 신규는 분산된 시각에 첫 실행)"""
+        if complex_id in self.entries:
+            return
+        entry = ScheduleEntry(complex_id, url, self.min_interval,
+                              time.time() + self._rng.uniform(0, self.jitter * self.min_interval))
+        self.entries[complex_id] = entry
+        self._push(entry)
+
+    def next_interval(self, churn: float) -> float:
+        """변동률 → 재방문 주기 (최소~최대 주기 사이 로그 보간)"""
+        hotness = min(1.0, churn / self.hot_churn) if self.hot_churn > 0 else 1.0
+        return self.min_interval * (self.max_interval / self.min_interval) ** (1.0 - hotness)
+
+    def _jittered(self, interval: float) -> float:
+        return interval * (1.0 + self._rng.uniform(-self.jitter, self.jitter))
+
+    def load(self):
+        """상태 파일 복원"""
+        if not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            self._log(f"⚠ 스케줄 상태 읽기 실패: {e}")
+            return
+        for data in state.get("entries") or []:
+            entry = ScheduleEntry.from_dict(data)
+            self.entries[entry.complex_id] = entry
+            self._push(entry)
+        self.budget.load(state.get("budget") or [])
+        self._log(f"스케줄 상태 복원: 단지 {len(self.entries)}개")
+
+    def save(self):
+        """상태 파일 저장 (임시 파일 후 교체)"""
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "saved_at": time.time(),
+                "entries": [entry.to_dict() for entry in self.entries.values()],
+                "budget": self.budget.to_list(),
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+    def _estimate(self, entry: ScheduleEntry) -> int:
+        """실행 1회 요청 수 추정 (첫 실행은 평균값, 없으면 20)"""
+        if entry.last_requests:
+            return entry.last_requests
+        known = [e.last_requests for e in self.entries.values() if e.last_requests]
+        return int(sum(known) / len(known)) if known else 20
+
+    def _write_snapshot(self, entry: ScheduleEntry, records: List[Dict], started: float):
+        if not self.snapshot_dir:
+            return
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        stamp = datetime.fromtimestamp(started).strftime("%Y%m%d_%H%M%S")
+        path = os.path.join(self.snapshot_dir, f"{entry.complex_id}_{stamp}.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(dict(record, complex_id=entry.complex_id), ensure_ascii=False) + "\n")
+
+    async def _run_entry(self, entry: ScheduleEntry, slot: int, estimate: int):
+        """단지 1회 크롤링 후 변동률/다음 실행 시각 갱신"""
+        from crawler.naver_crawler import NaverEstateCrawler
+
+        started = time.time()
+        requests = 0
+        try:
+            crawler = NaverEstateCrawler(
+                url=entry.url,
+                user_data_dir=self.profile_dir if self.concurrency == 1 else f"{self.profile_dir}_{slot}",
+                **self.crawler_options,
+            )
+            await crawler.crawl()
+            requests = crawler.metrics.snapshot()["requests"]
+            ok = crawler.finished
+            records = crawler.results
+        except Exception as e:
+            self._log(f"✗ {entry.complex_id} 크롤링 오류: {e}")
+            ok = False
+            records = []
+        finally:
+            self.budget.settle(estimate, requests)
+
+        now = time.time()
+        entry.last_run = started
+        entry.last_requests = requests or entry.last_requests
+        if ok:
+            keys = {record_key(r) for r in records}
+            churn = churn_rate(set(entry.keys), keys) if entry.runs else 1.0
+            entry.churn = churn if not entry.runs else (
+                self.smoothing * churn + (1 - self.smoothing) * entry.churn
+            )
+            entry.keys = sorted(keys)
+            entry.runs += 1
+            entry.failures = 0
+            entry.interval = self.next_interval(entry.churn)
+            self._write_snapshot(entry, records, started)
+            self._log(
+                f"✓ {entry.complex_id}: 매물 {len(records)}건, 변동률 {churn:.2f} (평활 {entry.churn:.2f}), "
+                f"요청 {requests}건, 다음 주기 {entry.interval / 3600:.1f}h"
+            )
+        else:
+            # 실패 시 최소 주기부터 지수 백오프 (최대 주기 한도)
+            entry.failures += 1
+            entry.interval = min(self.max_interval, self.min_interval * 2 ** (entry.failures - 1))
+            self._log(f"⚠ {entry.complex_id} 실패 {entry.failures}회, {entry.interval / 3600:.1f}h 후 재시도")
+        entry.next_run = now + self._jittered(entry.interval)
+        self._push(entry)
+        self.save()
+
+    def stop(self):
+        """스케줄러 종료 요청 (실행 중인 크롤링은 끝까지 진행)"""
+        if self._stop is not None:
+            self._stop.set()
+            self._changed.set()
+
+    async def _wait(self, seconds: float) -> bool:
+        """큐 변경/종료 요청이 오면 즉시 깨어나는 대기 (종료 요청 시 True)"""
+        self._changed.clear()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=max(0.0, seconds))
+        except asyncio.TimeoutError:
+            pass
+        return self._stop.is_set()
+
+    async def run(self):
+        """스케줄 루프: 가장 이른 단지부터 예산/동시 실행 한도 안에서 실행"""
+        self._stop = asyncio.Event()
+        self._changed = asyncio.Event()
+        slots: asyncio.Queue = asyncio.Queue()
+        for slot in range(self.concurrency):
+            slots.put_nowait(slot)
+        tasks: Set[asyncio.Task] = set()
+        self._log(f"스케줄러 시작: 단지 {len(self.entries)}개, 동시 실행 {self.concurrency}")
+        try:
+            while not self._stop.is_set():
+                if not self._heap:
+                    if await self._wait(60):
+                        break
+                    continue
+                next_run, _seq, complex_id = self._heap[0]
+                entry = self.entries.get(complex_id)
+                if entry is None or entry.next_run != next_run or complex_id in self._running:
+                    # 갱신된 항목의 이전 큐 원소 (지연 삭제)
+                    heapq.heappop(self._heap)
+                    continue
+                delay = next_run - time.time()
+                if delay > 0:
+                    if await self._wait(min(delay, 60)):
+                        break
+                    continue
+
+                estimate = self._estimate(entry)
+                budget_wait = self.budget.wait_time(estimate)
+                if budget_wait > 0:
+                    self._log(f"요청 예산 소진 ({self.budget.used()}/{self.budget.hourly_limit}), "
+                              f"{budget_wait / 60:.0f}분 대기")
+                    if await self._wait(min(budget_wait, 60)):
+                        break
+                    continue
+
+                slot = await slots.get()
+                if self._stop.is_set():
+                    break
+                heapq.heappop(self._heap)
+                self.budget.reserve(estimate)
+                self._running.add(complex_id)
+
+                async def launch(entry: ScheduleEntry = entry, slot: int = slot, estimate: int = estimate):
+                    try:
+                        await self._run_entry(entry, slot, estimate)
+                    finally:
+                        self._running.discard(entry.complex_id)
+                        slots.put_nowait(slot)
+
+                task = asyncio.create_task(launch())
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            if tasks:
+                self._log(f"실행 중인 크롤링 {len(tasks)}건 종료 대기...")
+                await asyncio.gather(*tasks, return_exceptions=True)
+            self.save()
+            self._log("스케줄러 종료")
+
+    def status(self) -> List[Dict]:
+        """단지별 다음 실행 시각/주기/변동률 (다음 실행 순)"""
+        rows = []
+        for entry in sorted(self.entries.values(), key=lambda e: e.next_run):
+            rows.append({
+                "complex_id": entry.complex_id,
+                "next_run": datetime.fromtimestamp(entry.next_run).isoformat(timespec="seconds"),
+                "interval_h": round(entry.interval / 3600, 2),
+                "churn": round(entry.churn, 3),
+                "runs": entry.runs,
+                "failures": entry.failures,
+                "last_requests": entry.last_requests,
+            })
+        return rows
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령줄 인자 정의"""
+    parser = argparse.ArgumentParser(
+        prog="python -m crawler.scheduler",
+        description="단지 변동률 기반 적응형 재방문 스케줄러",
+    )
+    parser.add_argument("complexes", nargs="*", metavar="COMPLEX",
+                        help="단지 ID 또는 단지 URL (상태 파일의 단지에 추가)")
+    parser.add_argument("--state", default="./scheduler/state.json", help="스케줄 상태 파일")
+    parser.add_argument("--min-interval", type=float, default=3600.0, help="최소 재방문 주기(초)")
+    parser.add_argument("--max-interval", type=float, default=86400.0, help="최대 재방문 주기(초)")
+    parser.add_argument("--hot-churn", type=float, default=0.2, help="최소 주기를 적용할 변동률")
+    parser.add_argument("--jitter", type=float, default=0.1, help="실행 시각 분산 비율")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시에 실행할 크롤링 수")
+    parser.add_argument("--hourly-budget", type=int, default=0, help="시간당 요청 예산 (0이면 제한 없음)")
+    parser.add_argument("--snapshot-dir", default="./snapshots", help="실행별 매물 스냅샷 저장 경로")
+    parser.add_argument("--mode", choices=["dom", "api"], default="api")
+    parser.add_argument("--trade-types", nargs="+", default=["A1"])
+    parser.add_argument("--transport", choices=["browser", "http"], default="browser")
+    parser.add_argument("--profile-dir", default="./playwright_data")
+    parser.add_argument("--checkpoint-dir", default="./checkpoints")
+    parser.add_argument("--building-index", default="./building_index", help="단지별 동/층 색인 경로")
+    parser.add_argument("--standby", choices=list(STANDBY_MODES), default="page",
+                        help="page/context 종료 시 교체할 대기 항목")
+    parser.add_argument("--list-memory-mb", type=float, default=DEFAULT_MEMORY_MB,
+                        help="캡처한 list 응답 보관 메모리 상한 (MB)")
+    parser.add_argument("--list-archive", default=None, help="캡처한 list 응답 원본 gzip JSONL 보관 경로")
+    parser.add_argument("--land-base-url", default="https://new.land.naver.com")
+    parser.add_argument("--fin-base-url", default="https://fin.land.naver.com")
+    parser.add_argument("--channel", default="chrome")
+    parser.add_argument("--min-wait", type=float, default=1.0)
+    parser.add_argument("--max-wait", type=float, default=3.0)
+    parser.add_argument("--status", action="store_true", help="스케줄 상태만 출력하고 종료")
+    parser.add_argument("-v", "--verbose", action="store_true", help="크롤러 로그도 stderr로 출력")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    def log(message: str):
+        sys.stderr.write(message + "\n")
+
+    def crawler_log(message: str):
+        if args.verbose:
+            sys.stderr.write(message + "\n")
+
+    scheduler = RevisitScheduler(
+        state_path=args.state,
+        min_interval=args.min_interval,
+        max_interval=args.max_interval,
+        hot_churn=args.hot_churn,
+        jitter=args.jitter,
+        concurrency=args.concurrency,
+        hourly_budget=args.hourly_budget,
+        snapshot_dir=args.snapshot_dir or None,
+        profile_dir=args.profile_dir,
+        log_callback=log,
+        crawler_options={
+            "log_callback": crawler_log,
+            "min_wait": args.min_wait,
+            "max_wait": args.max_wait,
+            "headless": True,
+            "checkpoint_dir": args.checkpoint_dir,
+            "mode": args.mode,
+            "land_base_url": args.land_base_url,
+            "fin_base_url": args.fin_base_url,
+            "browser_channel": args.channel or None,
+            "trade_types": args.trade_types,
+            "transport": args.transport,
+            "building_index_dir": args.building_index or None,
+            "standby": args.standby,
+            "list_memory_mb": args.list_memory_mb,
+            "list_archive_dir": args.list_archive,
+        },
+    )
+    scheduler.load()
+    for value in args.complexes:
+        url = normalize_complex(value, args.land_base_url)
+        complex_id = url.rstrip("/").rsplit("/", 1)[-1]
+        scheduler.add(complex_id, url)
+
+    if args.status:
+        for row in scheduler.status():
+            sys.stdout.write(json.dumps(row, ensure_ascii=False) + "\n")
+        return 0
+    if not scheduler.entries:
+        sys.stderr.write("스케줄할 단지가 없습니다\n")
+        return 2
+
+    scheduler.save()
+    try:
+        asyncio.run(scheduler.run())
+    except KeyboardInterrupt:
+        scheduler.save()
+        return 130
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+크롤링 단계별 타이밍 스팬
+Chrome trace-event JSON(chrome://tracing, Perfetto) 내보내기 + 실행별 요약 표
+"""
+
+import asyncio
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class _NullSpan:
+    """비활성 상태용 no-op 스팬 (할당 없음)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """활성 스팬: 종료 시 Tracer에 기록"""
+
+    __slots__ = ("_tracer", "_name", "_cat", "_args", "_start")
+
+    def __init__(self, tracer: "Tracer", name: str, cat: str, args: Optional[Dict]):
+        self._tracer = tracer
+        self._name = name
+        self._cat = cat
+        self._args = args
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        args = self._args
+        if exc_type is not None:
+            args = dict(args or {}, error=exc_type.__name__)
+        self._tracer._add(self._name, self._cat, self._start, end - self._start, args)
+        return False
+
+
+class Tracer:
+    """단계별 스팬 수집기 (enabled=False면 거의 비용 없음)"""
+
+    # 단계 분류: launch, warmup, navigation, list_fetch, detail_fetch, parse, callback, sleep
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._origin = time.perf_counter()
+        self._events: List[Tuple[str, str, float, float, int, Optional[Dict]]] = []
+        self._task_ids: Dict[int, int] = {}
+
+    def span(self, name: str, cat: Optional[str] = None, args: Optional[Dict] = None):
+        """with 블록 구간 측정"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, cat or name, args)
+
+    def _tid(self) -> int:
+        """asyncio 태스크별 트랙 번호 (동시 실행 구간 구분용)"""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = id(task) if task is not None else 0
+        tid = self._task_ids.get(key)
+        if tid is None:
+            tid = len(self._task_ids) + 1
+            self._task_ids[key] = tid
+        return tid
+
+    def _add(self, name: str, cat: str, start: float, duration: float, args: Optional[Dict]):
+        self._events.append((name, cat, start - self._origin, duration, self._tid(), args))
+
+    def summary(self) -> List[Dict]:
+        """단계별 건수/합계/평균/최대 (합계 내림차순)"""
+        groups: Dict[str, List[float]] = {}
+        for _name, cat, _start, duration, _tid, _args in self._events:
+            groups.setdefault(cat, []).append(duration)
+        rows = []
+        for cat, durations in groups.items():
+            total = sum(durations)
+            rows.append({
+                "phase": cat,
+                "count": len(durations),
+                "total_sec": round(total, 3),
+                "avg_ms": round(total / len(durations) * 1000, 1),
+                "max_ms": round(max(durations) * 1000, 1),
+            })
+        rows.sort(key=lambda r: r["total_sec"], reverse=True)
+        return rows
+
+    def format_summary(self) -> List[str]:
+        """요약 표 문자열 (로그 출력용)"""
+        wall = time.perf_counter() - self._origin
+        lines = [f"{'단계':<14}{'건수':>8}{'합계(s)':>10}{'평균(ms)':>11}{'최대(ms)':>11}{'비율':>8}"]
+        for row in self.summary():
+            share = row["total_sec"] / wall * 100 if wall > 0 else 0.0
+            lines.append(
+                f"{row['phase']:<14}{row['count']:>8}{row['total_sec']:>10.2f}"
+                f"{row['avg_ms']:>11.1f}{row['max_ms']:>11.1f}{share:>7.1f}%"
+            )
+        lines.append(f"전체 경과 {wall:.2f}s (동시 구간은 비율 합이 100%를 넘을 수 있음)")
+        return lines
+
+    def export_chrome_trace(self, path: str):
+        """Chrome trace-event JSON 저장"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        events = []
+        for name, cat, start, duration, tid, args in self._events:
+            event = {
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": round(start * 1e6, 1),
+                "dur": round(duration * 1e6, 1),
+                "pid": os.getpid(),
+                "tid": tid,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
@@ -0,0 +1,332 @@
+"""
+작업 큐 작업자 (다중 프로세스/다중 호스트)
+큐에서 작업(단지, 거래유형, 페이지 범위)을 임대하여 NaverEstateCrawler로 수집하고 결과를 JSONL로 저장
+작업자 비정상 종료 시 임대 만료 후 다른 작업자가 체크포인트부터 이어서 수집
+
+사용법:
+    python -m crawler.worker enqueue 117804 118000 --trade-types A1 B1 --pages 1-20 --chunk 5
+    python -m crawler.worker work --processes 4
+    python -m crawler.worker status
+    python -m crawler.worker requeue-dead
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from crawler.cli import TRADE_TYPES, normalize_complex, parse_filters
+from crawler.context_pool import STANDBY_MODES
+from crawler.list_capture import DEFAULT_MEMORY_MB
+from crawler.job_queue import (
+    DEAD, Job, SqliteJobQueue, default_worker_id, split_pages,
+)
+
+
+def parse_page_range(value: str) -> Tuple[int, Optional[int]]:
+    """"1-20" / "5-" / "3" → (시작, 끝)"""
+    start, sep, end = value.partition("-")
+    try:
+        first = int(start)
+        last = int(end) if end else (None if sep else first)
+    except ValueError:
+        raise ValueError(f"페이지 범위 형식 오류: {value} (예: 1-20, 5-)")
+    if first < 1 or (last is not None and last < first):
+        raise ValueError(f"페이지 범위 오류: {value}")
+    return first, last
+
+
+class QueueWorker:
+    """작업 큐 작업자 1개 (작업 1건씩 임대 → 수집 → 완료/실패 보고)"""
+
+    def __init__(self, queue: SqliteJobQueue,
+                 crawler_options: Optional[Dict] = None,
+                 worker_id: Optional[str] = None,
+                 output_dir: str = "./jobs/output",
+                 lease_sec: float = 300.0,
+                 poll_sec: float = 5.0,
+                 wait: bool = False,
+                 land_base_url: str = "https://new.land.naver.com",
+                 log_callback: Optional[Callable] = None):
+        """
+        Args:
+            queue: 작업 큐
+            crawler_options: NaverEstateCrawler 공통 인자
+            worker_id: 작업자 ID (기본: 호스트명:PID)
+            output_dir: 작업별 결과 JSONL 저장 경로
+            lease_sec: 임대 시간 (heartbeat는 1/3 주기)
+            poll_sec: 대기 작업이 없을 때 확인 주기
+            wait: 큐가 비어도 종료하지 않고 새 작업 대기
+            land_base_url: 단지 URL 기본 주소
+            log_callback: 로그 콜백
+        """
+        self.queue = queue
+        self.crawler_options = dict(crawler_options or {})
+        self.worker_id = worker_id or default_worker_id()
+        self.output_dir = output_dir
+        self.lease_sec = lease_sec
+        self.heartbeat_sec = max(1.0, lease_sec / 3)
+        self.poll_sec = poll_sec
+        self.wait = wait
+        self.land_base_url = land_base_url
+        self.log_callback = log_callback
+        self.completed = 0
+        self.failed = 0
+
+    def _log(self, message: str):
+        if self.log_callback:
+            self.log_callback(f"[{self.worker_id}] {message}")
+
+    def _write_output(self, job: Job, records: List[Dict]) -> str:
+        """작업 결과 JSONL 저장 (임시 파일 후 교체)"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"{job.run_id}.jsonl")
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(dict(record, complex_id=job.complex_id), ensure_ascii=False) + "\n")
+        os.replace(tmp_path, path)
+        return path
+
+    async def _heartbeat(self, job: Job, crawler) -> None:
+        """임대 연장 (임대를 잃으면 다른 작업자가 가져간 것이므로 수집 중단)"""
+        while True:
+            await asyncio.sleep(self.heartbeat_sec)
+            alive = await asyncio.to_thread(self.queue.heartbeat, job.id, self.worker_id, self.lease_sec)
+            if not alive:
+                self._log(f"⚠ 작업 {job.id} 임대 상실, 수집 중단")
+                crawler.cancel()
+                return
+
+    async def run_job(self, job: Job) -> bool:
+        """작업 1건 실행 후 큐에 결과 보고"""
+        from crawler.naver_crawler import NaverEstateCrawler
+
+        self._log(
+            f"작업 {job.id} 시작: {job.complex_id} {job.trade_type} "
+            f"페이지 {job.page_start}-{job.page_end or ''} (시도 {job.attempts}/{job.max_attempts})"
+        )
+        started = time.monotonic()
+        options = dict(self.crawler_options)
+        if job.options.get("list_filters"):
+            options["list_filters"] = job.options["list_filters"]
+        crawler = NaverEstateCrawler(
+            url=normalize_complex(job.complex_id, self.land_base_url),
+            trade_types=[job.trade_type],
+            page_range=(job.page_start, job.page_end),
+            run_id=job.run_id,
+            # 작업별 run_id 저널에서 항상 재개 (첫 실행이면 빈 저널, 반납/재등록 작업은 이전 진행분부터)
+            resume=True,
+            **options,
+        )
+        heartbeat = asyncio.create_task(self._heartbeat(job, crawler))
+        error = None
+        try:
+            await crawler.crawl()
+        except asyncio.CancelledError:
+            # 작업자 종료: 시도 횟수를 쓰지 않고 반납
+            heartbeat.cancel()
+            await asyncio.to_thread(self.queue.release, job.id, self.worker_id)
+            self._log(f"작업 {job.id} 반납 (작업자 종료)")
+            raise
+        except Exception as e:
+            error = str(e)
+        finally:
+            heartbeat.cancel()
+
+        if crawler.finished and error is None:
+            path = self._write_output(job, crawler.results)
+            result = {
+                "records": len(crawler.results),
+                "output": path,
+                "worker": self.worker_id,
+                "elapsed_sec": round(time.monotonic() - started, 3),
+                "requests": crawler.metrics.snapshot()["requests"],
+            }
+            if await asyncio.to_thread(self.queue.complete, job.id, self.worker_id, result):
+                self.completed += 1
+                self._log(f"✓ 작업 {job.id} 완료: {len(crawler.results)}건 → {path}")
+                return True
+            self._log(f"⚠ 작업 {job.id} 완료 보고 실패 (임대 상실)")
+            return False
+
+        reason = error or ("임대 상실" if crawler.is_cancelled else "수집 미완료")
+        state = await asyncio.to_thread(self.queue.fail, job.id, self.worker_id, reason)
+        self.failed += 1
+        if state == DEAD:
+            self._log(f"✗ 작업 {job.id} 시도 한도 초과 → dead ({reason})")
+        else:
+            self._log(f"⚠ 작업 {job.id} 실패 ({reason}), {state or '임대 상실'}")
+        return False
+
+    async def run(self) -> int:
+        """큐가 빌 때까지(wait면 계속) 작업 처리, 완료한 작업 수 반환"""
+        self._log("작업자 시작")
+        while True:
+            job = await asyncio.to_thread(self.queue.claim, self.worker_id, self.lease_sec)
+            if job is None:
+                if not self.wait and not await asyncio.to_thread(self.queue.has_unfinished):
+                    break
+                # 재시도 대기 중이거나 다른 작업자가 임대 중인 작업이 있으면 잠시 후 다시 확인
+                await asyncio.sleep(self.poll_sec)
+                continue
+            await self.run_job(job)
+        self._log(f"작업자 종료: 완료 {self.completed}, 실패 {self.failed}")
+        return self.completed
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령줄 인자 정의"""
+    parser = argparse.ArgumentParser(
+        prog="python -m crawler.worker",
+        description="영속 작업 큐 기반 다중 프로세스/다중 호스트 크롤링",
+    )
+    parser.add_argument("--queue", default="./jobs/queue.db", help="작업 큐 SQLite 파일")
+    parser.add_argument("--no-wal", action="store_true",
+                        help="WAL 미사용 (여러 호스트가 네트워크 파일시스템의 큐를 공유할 때)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = commands.add_parser("enqueue", help="작업 등록")
+    enqueue.add_argument("complexes", nargs="+", metavar="COMPLEX", help="단지 ID 또는 URL")
+    enqueue.add_argument("--trade-types", nargs="+", choices=TRADE_TYPES, default=["A1"])
+    enqueue.add_argument("--pages", default="1-", help="list 페이지 범위 (예: 1-20, 기본: 끝까지)")
+    enqueue.add_argument("--chunk", type=int, default=0, help="작업 1건당 페이지 수 (0이면 분할 안 함)")
+    enqueue.add_argument("--filter", dest="filters", action="append", default=[], metavar="KEY=VALUE")
+    enqueue.add_argument("--max-attempts", type=int, default=3)
+
+    work = commands.add_parser("work", help="작업자 실행")
+    work.add_argument("--processes", type=int, default=1, help="작업자 프로세스 수")
+    work.add_argument("--lease", type=float, default=300.0, help="임대 시간(초)")
+    work.add_argument("--wait", action="store_true", help="큐가 비어도 새 작업 대기")
+    work.add_argument("--output-dir", default="./jobs/output")
+    work.add_argument("--checkpoint-dir", default="./checkpoints")
+    work.add_argument("--building-index", default="./building_index", help="단지별 동/층 색인 경로 (작업자 간 공유)")
+    work.add_argument("--standby", choices=list(STANDBY_MODES), default="page",
+                      help="page/context 종료 시 교체할 대기 항목")
+    work.add_argument("--list-memory-mb", type=float, default=DEFAULT_MEMORY_MB,
+                      help="캡처한 list 응답 보관 메모리 상한 (MB)")
+    work.add_argument("--list-archive", default=None, help="캡처한 list 응답 원본 gzip JSONL 보관 경로")
+    work.add_argument("--profile-dir", default="./playwright_data",
+                      help="Chrome 프로필 경로 (작업자별 접미사 추가)")
+    work.add_argument("--land-base-url", default="https://new.land.naver.com")
+    work.add_argument("--fin-base-url", default="https://fin.land.naver.com")
+    work.add_argument("--channel", default="chrome")
+    work.add_argument("--transport", choices=["browser", "http"], default="browser")
+    work.add_argument("--detail-concurrency", type=int, default=4)
+    work.add_argument("--min-wait", type=float, default=1.0)
+    work.add_argument("--max-wait", type=float, default=3.0)
+    work.add_argument("-v", "--verbose", action="store_true", help="크롤러 로그도 stderr로 출력")
+
+    commands.add_parser("status", help="상태별 작업 수와 dead 작업 출력")
+    commands.add_parser("requeue-dead", help="dead 작업 재등록")
+    return parser
+
+
+def _worker_process(args: argparse.Namespace, index: int) -> int:
+    """작업자 프로세스 진입점 (spawn 방식, Windows 호환)"""
+    def log(message: str):
+        sys.stderr.write(message + "\n")
+
+    def crawler_log(message: str):
+        if args.verbose:
+            sys.stderr.write(message + "\n")
+
+    queue = SqliteJobQueue(args.queue, wal=not args.no_wal)
+    worker = QueueWorker(
+        queue,
+        crawler_options={
+            "log_callback": crawler_log,
+            "min_wait": args.min_wait,
+            "max_wait": args.max_wait,
+            "headless": True,
+            "checkpoint_dir": args.checkpoint_dir,
+            "mode": "api",
+            "concurrency": args.detail_concurrency,
+            # 같은 프로필은 한 브라우저만 사용할 수 있으므로 호스트/작업자별 분리
+            "user_data_dir": f"{args.profile_dir}_{socket.gethostname()}_{index}",
+            "land_base_url": args.land_base_url,
+            "fin_base_url": args.fin_base_url,
+            "browser_channel": args.channel or None,
+            "transport": args.transport,
+            "building_index_dir": args.building_index or None,
+            "standby": args.standby,
+            "list_memory_mb": args.list_memory_mb,
+            "list_archive_dir": args.list_archive,
+        },
+        output_dir=args.output_dir,
+        lease_sec=args.lease,
+        wait=args.wait,
+        land_base_url=args.land_base_url,
+        log_callback=log,
+    )
+    try:
+        asyncio.run(worker.run())
+    except KeyboardInterrupt:
+        return 130
+    finally:
+        queue.close()
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI 메인 함수 (종료 코드 반환)"""
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return 2 if e.code else 0
+
+    if args.command == "work":
+        processes = max(1, args.processes)
+        if processes == 1:
+            return _worker_process(args, 0)
+        context = multiprocessing.get_context("spawn")
+        workers = [context.Process(target=_worker_process, args=(args, index)) for index in range(processes)]
+        for process in workers:
+            process.start()
+        try:
+            for process in workers:
+                process.join()
+        except KeyboardInterrupt:
+            # 작업자도 같은 콘솔 인터럽트를 받아 진행 중인 작업을 반납하고 종료
+            for process in workers:
+                process.join()
+            return 130
+        return 0 if all(p.exitcode == 0 for p in workers) else 1
+
+    queue = SqliteJobQueue(args.queue, wal=not args.no_wal)
+    try:
+        if args.command == "enqueue":
+            try:
+                first, last = parse_page_range(args.pages)
+                filters = parse_filters(args.filters)
+            except ValueError as e:
+                sys.stderr.write(f"{e}\n")
+                return 2
+            jobs = []
+            for value in args.complexes:
+                complex_id = normalize_complex(value).rstrip("/").rsplit("/", 1)[-1]
+                for trade_type in args.trade_types:
+                    for start, end in split_pages(first, last, args.chunk):
+                        options = {"list_filters": filters} if filters else {}
+                        jobs.append(Job(0, complex_id, trade_type, start, end, options))
+            added = queue.enqueue(jobs, max_attempts=args.max_attempts)
+            sys.stderr.write(f"작업 {added}건 등록 (중복 {len(jobs) - added}건 제외)\n")
+        elif args.command == "status":
+            sys.stdout.write(json.dumps(queue.counts(), ensure_ascii=False) + "\n")
+            for job in queue.jobs(DEAD):
+                sys.stdout.write(json.dumps(job.to_dict(), ensure_ascii=False) + "\n")
+        elif args.command == "requeue-dead":
+            sys.stderr.write(f"dead 작업 {queue.requeue_dead()}건 재등록\n")
+    finally:
+        queue.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
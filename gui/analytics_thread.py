@@ -0,0 +1,29 @@
+"""
+시세 요약 스레드 클래스
+크롤링 완료 후 통계 표시줄의 가격 요약을 GUI 스레드와 분리하여 계산
+"""
+
+from PySide6.QtCore import QThread, Signal
+from typing import List, Dict
+
+from utils.analytics import MarketAnalytics
+
+
+class AnalyticsThread(QThread):
+    """거래유형별 중위가 요약 계산 스레드"""
+
+    # 시그널 정의
+    finished = Signal(str)  # 요약 문자열
+    error_occurred = Signal(str)  # error message
+
+    def __init__(self, records: List[Dict]):
+        super().__init__()
+        # 결과는 GUI 스레드에서 복사 (계산 중 목록이 바뀌어도 영향 없음)
+        self.records = list(records)
+
+    def run(self):
+        """스레드 실행"""
+        try:
+            self.finished.emit(MarketAnalytics(self.records).summary_text())
+        except Exception as e:
+            self.error_occurred.emit(str(e))
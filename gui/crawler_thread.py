@@ -4,8 +4,9 @@ GUI 스레드와 분리하여 크롤링 작업 수행
 """
 
 from PySide6.QtCore import QThread, Signal
-from crawler.naver_crawler import NaverEstateCrawler
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+from crawler.metrics import MetricsRegistry
 
 
 class CrawlerThread(QThread):
@@ -18,17 +19,28 @@ class CrawlerThread(QThread):
     finished = Signal(list)  # results
     error_occurred = Signal(str)  # error message
     
-    def __init__(self, url: str, min_wait: float = 1.0, max_wait: float = 3.0, headless: bool = False):
+    def __init__(self, url: str, min_wait: float = 1.0, max_wait: float = 3.0, headless: bool = False,
+                 resume: bool = False, trade_types: Optional[List[str]] = None,
+                 deadline: Optional[float] = None):
         super().__init__()
         self.url = url
         self.min_wait = min_wait
         self.max_wait = max_wait
         self.headless = headless
+        self.resume = resume
+        self.trade_types = trade_types
+        # 시간 제한 (초, None이면 제한 없음)
+        self.deadline = deadline
         self.crawler = None
+        # GUI 지표 패널이 크롤러 생성 전부터 조회할 수 있도록 스레드가 소유
+        self.metrics = MetricsRegistry()
         
     def run(self):
         """스레드 실행"""
         try:
+            # Playwright는 크롤링 시작 시점에만 로드 (GUI 시작 속도)
+            from crawler.naver_crawler import NaverEstateCrawler
+
             # 크롤러 생성
             self.crawler = NaverEstateCrawler(
                 url=self.url,
@@ -37,7 +49,11 @@ class CrawlerThread(QThread):
                 property_found_callback=self._on_property_found,
                 min_wait=self.min_wait,
                 max_wait=self.max_wait,
-                headless=self.headless
+                headless=self.headless,
+                resume=self.resume,
+                metrics=self.metrics,
+                trade_types=self.trade_types,
+                deadline=self.deadline
             )
             
             # 비동기 크롤링 실행
@@ -68,3 +84,13 @@ class CrawlerThread(QThread):
         """크롤링 취소"""
         if self.crawler:
             self.crawler.cancel()
+
+    def pause(self):
+        """크롤링 일시정지"""
+        if self.crawler:
+            self.crawler.pause()
+
+    def resume_crawl(self):
+        """크롤링 재개"""
+        if self.crawler:
+            self.crawler.resume_crawl()
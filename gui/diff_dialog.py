@@ -0,0 +1,94 @@
+"""
+변경사항 대화상자
+이전 스냅샷과 현재 결과(또는 다른 스냅샷)를 비교해 신규/삭제/가격 변동/층수 확인 매물 표시
+"""
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTabWidget,
+    QTableWidget, QTableWidgetItem, QHeaderView, QFileDialog, QMessageBox
+)
+from PySide6.QtCore import QThread, Signal
+from typing import List, Dict, Union
+
+from utils.snapshot_diff import diff_snapshots
+
+# 탭별 최대 표시 행 수 (전체 결과는 엑셀 저장)
+MAX_DISPLAY_ROWS = 5000
+
+
+class DiffThread(QThread):
+    """스냅샷 비교 스레드"""
+
+    # 시그널 정의
+    finished = Signal(object)  # SnapshotDiff
+    error_occurred = Signal(str)  # error message
+
+    def __init__(self, old: str, new: Union[str, List[Dict]]):
+        super().__init__()
+        self.old = old
+        # 현재 결과는 GUI 스레드에서 복사 (비교 중 행이 추가되어도 영향 없음)
+        self.new = new if isinstance(new, str) else list(new)
+
+    def run(self):
+        """스레드 실행"""
+        try:
+            self.finished.emit(diff_snapshots(self.old, self.new))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+
+class DiffDialog(QDialog):
+    """스냅샷 비교 결과 대화상자"""
+
+    def __init__(self, result, old_label: str, new_label: str, parent=None):
+        super().__init__(parent)
+        self.result = result
+        self.setWindowTitle("변경사항")
+        self.resize(1000, 600)
+
+        layout = QVBoxLayout(self)
+        summary = ", ".join(f"{label} {count:,}건" for label, count in result.summary().items())
+        layout.addWidget(QLabel(f"{old_label} → {new_label} ({result.join} 기준)\n{summary}"))
+
+        tabs = QTabWidget()
+        for label, frame in result.sections():
+            tabs.addTab(self._create_table(frame), f"{label} ({len(frame):,})")
+        layout.addWidget(tabs)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        save_button = QPushButton("엑셀 저장")
+        save_button.clicked.connect(self.save_to_excel)
+        button_layout.addWidget(save_button)
+        close_button = QPushButton("닫기")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+
+    @staticmethod
+    def _create_table(frame) -> QTableWidget:
+        """DataFrame → 테이블 (최대 표시 행 수까지)"""
+        shown = frame.head(MAX_DISPLAY_ROWS)
+        table = QTableWidget(len(shown), len(shown.columns))
+        table.setHorizontalHeaderLabels([str(c) for c in shown.columns])
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        for row, values in enumerate(shown.itertuples(index=False)):
+            for column, value in enumerate(values):
+                table.setItem(row, column, QTableWidgetItem(str(value)))
+        table.setSortingEnabled(True)
+        if len(frame) > MAX_DISPLAY_ROWS:
+            table.setToolTip(f"상위 {MAX_DISPLAY_ROWS:,}건만 표시합니다. 전체 결과는 엑셀로 저장하세요.")
+        return table
+
+    def save_to_excel(self):
+        """비교 결과를 구분별 시트로 저장"""
+        filename, _ = QFileDialog.getSaveFileName(
+            self, "변경사항 저장", "변경사항.xlsx", "Excel Files (*.xlsx);;All Files (*)"
+        )
+        if not filename:
+            return
+        try:
+            self.result.to_excel(filename)
+            QMessageBox.information(self, "완료", f"파일이 저장되었습니다:\n{filename}")
+        except Exception as e:
+            QMessageBox.critical(self, "오류", f"파일 저장 중 오류가 발생했습니다:\n{e}")
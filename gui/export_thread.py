@@ -0,0 +1,42 @@
+"""
+내보내기 스레드 클래스
+엑셀/CSV 저장을 GUI 스레드와 분리하여 수행
+"""
+
+from PySide6.QtCore import QThread, Signal
+from typing import List, Dict
+
+from utils.export_jobs import ExportCancelled, ExportJob
+
+
+class ExportThread(QThread):
+    """매물 스냅샷을 여러 형식으로 저장하는 스레드"""
+
+    # 시그널 정의
+    progress_updated = Signal(int, int, str)  # written, total, path
+    finished = Signal(list)  # 파일별 결과
+    cancelled = Signal()
+    error_occurred = Signal(str)  # error message
+
+    def __init__(self, records: List[Dict], paths: List[str]):
+        super().__init__()
+        # 스냅샷은 GUI 스레드에서 생성 (이후 테이블에 행이 추가되어도 영향 없음)
+        self.job = ExportJob(records, paths, progress_callback=self._on_progress)
+
+    def run(self):
+        """스레드 실행"""
+        try:
+            results = self.job.run()
+            self.finished.emit(results)
+        except ExportCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def _on_progress(self, written: int, total: int, path: str):
+        """진행 상황 콜백"""
+        self.progress_updated.emit(written, total, path)
+
+    def cancel(self):
+        """내보내기 취소"""
+        self.job.cancel()
@@ -2,21 +2,26 @@
 메인 윈도우 GUI
 """
 
+import os
 import sys
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QLineEdit, QProgressBar, QTextEdit, QTableWidget,
-    QTableWidgetItem, QMessageBox, QFileDialog, QGroupBox, QHeaderView
+    QTableWidgetItem, QMessageBox, QFileDialog, QGroupBox, QHeaderView, QCheckBox, QSpinBox
 )
-from PySide6.QtCore import Qt, QThread
+from PySide6.QtCore import Qt, QThread, QTimer
 from PySide6.QtGui import QFont
 
+from gui.analytics_thread import AnalyticsThread
 from gui.crawler_thread import CrawlerThread
-from utils.excel_exporter import save_to_excel, generate_default_filename
+from gui.diff_dialog import DiffDialog, DiffThread
+from gui.export_thread import ExportThread
+from utils.excel_exporter import generate_default_filename
 from utils.data_processor import calculate_statistics, filter_data
+from utils.dedup import GROUP_FIELD, DuplicateGrouper, collapse_groups, group_records
 
 
 class MainWindow(QMainWindow):
@@ -25,7 +30,14 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.crawler_thread = None
+        self.export_thread = None
+        self._exporting = False
+        self.diff_thread = None
+        self.analytics_thread = None
         self.property_data: List[Dict[str, str]] = []
+        # 중복 매물 그룹 (묶어보기 화면에서 그룹별 등록 수 셀 갱신)
+        self.grouper = DuplicateGrouper()
+        self._group_count_items: Dict[int, QTableWidgetItem] = {}
         self.init_ui()
         
     def init_ui(self):
@@ -74,8 +86,22 @@ class MainWindow(QMainWindow):
         self.stop_button = QPushButton("중지")
         self.stop_button.clicked.connect(self.stop_crawling)
         self.stop_button.setEnabled(False)
+        self.pause_button = QPushButton("일시정지")
+        self.pause_button.setCheckable(True)
+        self.pause_button.toggled.connect(self.toggle_pause)
+        self.pause_button.setEnabled(False)
+        self.deadline_spin = QSpinBox()
+        self.deadline_spin.setRange(0, 600)
+        self.deadline_spin.setSuffix("분")
+        self.deadline_spin.setSpecialValueText("시간 제한 없음")
+        self.deadline_spin.setToolTip("제한 시간이 지나면 수집한 매물까지만 저장하고 종료합니다.")
+        self.resume_checkbox = QCheckBox("이전 작업 이어서")
+        self.resume_checkbox.setToolTip("중단된 크롤링을 체크포인트 위치부터 재개합니다.")
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.stop_button)
+        button_layout.addWidget(self.pause_button)
+        button_layout.addWidget(self.deadline_spin)
+        button_layout.addWidget(self.resume_checkbox)
         info_layout.addLayout(button_layout)
         
         info_group.setLayout(info_layout)
@@ -101,10 +127,28 @@ class MainWindow(QMainWindow):
         progress_group.setLayout(progress_layout)
         main_layout.addWidget(progress_group)
         
+        # 요청 지표 패널 (1초마다 갱신)
+        metrics_group = QGroupBox("요청 지표")
+        metrics_layout = QVBoxLayout()
+        self.metrics_label = QLabel("요청 0건")
+        self.metrics_label.setWordWrap(True)
+        metrics_layout.addWidget(self.metrics_label)
+        metrics_group.setLayout(metrics_layout)
+        main_layout.addWidget(metrics_group)
+        
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.setInterval(1000)
+        self.metrics_timer.timeout.connect(self.update_metrics)
+        
         # 매물 정보 테이블
         table_group = QGroupBox("매물 정보")
         table_layout = QVBoxLayout()
         
+        self.collapse_checkbox = QCheckBox("중복 매물 묶어보기")
+        self.collapse_checkbox.setToolTip("같은 동/층/면적/거래유형에 가격이 1% 이내인 매물을 한 줄로 표시합니다.")
+        self.collapse_checkbox.toggled.connect(self.refresh_table)
+        table_layout.addWidget(self.collapse_checkbox)
+        
         self.table = QTableWidget()
         self.table.setColumnCount(4)
         self.table.setHorizontalHeaderLabels(["동", "가격", "면적", "층수"])
@@ -123,6 +167,11 @@ class MainWindow(QMainWindow):
         
         bottom_layout.addStretch()
         
+        self.diff_button = QPushButton("변경사항")
+        self.diff_button.setToolTip("이전 스냅샷(JSONL/CSV/엑셀)과 현재 결과를 비교합니다.")
+        self.diff_button.clicked.connect(self.show_changes)
+        bottom_layout.addWidget(self.diff_button)
+        
         self.excel_button = QPushButton("엑셀 저장")
         self.excel_button.clicked.connect(self.save_to_excel)
         self.excel_button.setEnabled(False)
@@ -133,6 +182,16 @@ class MainWindow(QMainWindow):
         self.csv_button.setEnabled(False)
         bottom_layout.addWidget(self.csv_button)
         
+        self.export_all_button = QPushButton("엑셀+CSV 저장")
+        self.export_all_button.clicked.connect(self.save_to_all)
+        self.export_all_button.setEnabled(False)
+        bottom_layout.addWidget(self.export_all_button)
+        
+        self.export_cancel_button = QPushButton("저장 취소")
+        self.export_cancel_button.clicked.connect(self.cancel_export)
+        self.export_cancel_button.setEnabled(False)
+        bottom_layout.addWidget(self.export_cancel_button)
+        
         main_layout.addLayout(bottom_layout)
         
         # 초기 로그 메시지
@@ -148,6 +207,24 @@ class MainWindow(QMainWindow):
         scrollbar = self.log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
+    def update_metrics(self):
+        """요청 지표 패널 갱신"""
+        if not self.crawler_thread:
+            return
+        snapshot = self.crawler_thread.metrics.snapshot()
+        statuses = snapshot['statuses']
+        text = (
+            f"요청 {snapshot['requests']}건 | "
+            f"200: {statuses.get('200', 0)}, 401: {statuses.get('401', 0)}, "
+            f"404: {statuses.get('404', 0)}, 429: {statuses.get('429', 0)}, 오류: {statuses.get('error', 0)} | "
+            f"재시도 {snapshot['retries']} | 쿨다운 {snapshot['cooldowns']}회 ({snapshot['cooldown_sec']}s) | "
+            f"수신 {snapshot['bytes'] / 1024:,.0f}KB | 캐시 적중 {snapshot['cache_hits']} | "
+            f"중복 요청 공유 {snapshot['coalesced']}"
+        )
+        for endpoint, latency in snapshot['latency'].items():
+            text += f"\n{endpoint}: {latency['count']}건, 평균 {latency['avg_ms']}ms, p95 ≤ {latency['p95_le_s']}s"
+        self.metrics_label.setText(text)
+    
     def update_progress(self, current: int, total: int, message: str):
         """진행 상황 업데이트"""
         if total > 0:
@@ -176,20 +253,27 @@ class MainWindow(QMainWindow):
         # UI 상태 변경
         self.start_button.setEnabled(False)
         self.stop_button.setEnabled(True)
-        self.excel_button.setEnabled(False)
-        self.csv_button.setEnabled(False)
+        self.pause_button.setEnabled(True)
+        self._set_export_buttons_enabled(False)
         self.property_data = []
+        self.grouper = DuplicateGrouper()
+        self._group_count_items = {}
         self.table.setRowCount(0)
         self.stats_label.setText("전체 매물: 0개")
         
         # 크롤링 스레드 시작
-        self.crawler_thread = CrawlerThread(url, min_wait=1.0, max_wait=3.0, headless=False)
+        self.crawler_thread = CrawlerThread(
+            url, min_wait=1.0, max_wait=3.0, headless=False,
+            resume=self.resume_checkbox.isChecked(),
+            deadline=self.deadline_spin.value() * 60 or None
+        )
         self.crawler_thread.progress_updated.connect(self.update_progress)
         self.crawler_thread.log_message.connect(self.add_log)
         self.crawler_thread.property_found.connect(self.add_property_to_table)
         self.crawler_thread.finished.connect(self.on_crawling_finished)
         self.crawler_thread.error_occurred.connect(self.on_crawling_error)
         self.crawler_thread.start()
+        self.metrics_timer.start()
         
         self.add_log("크롤링을 시작합니다...")
     
@@ -199,11 +283,48 @@ class MainWindow(QMainWindow):
             self.crawler_thread.cancel()
             self.add_log("크롤링 중지 요청됨...")
             self.stop_button.setEnabled(False)
+            self._reset_pause_button()
+
+    def toggle_pause(self, paused: bool):
+        """크롤링 일시정지/재개"""
+        if not self.crawler_thread or not self.crawler_thread.isRunning():
+            return
+        if paused:
+            self.crawler_thread.pause()
+            self.pause_button.setText("재개")
+            self.status_label.setText("일시정지됨")
+        else:
+            self.crawler_thread.resume_crawl()
+            self.pause_button.setText("일시정지")
+
+    def _reset_pause_button(self):
+        """일시정지 버튼 초기 상태로 복원 (시그널 없이)"""
+        self.pause_button.blockSignals(True)
+        self.pause_button.setChecked(False)
+        self.pause_button.blockSignals(False)
+        self.pause_button.setText("일시정지")
+        self.pause_button.setEnabled(False)
     
     def add_property_to_table(self, property_info: Dict[str, str]):
         """테이블에 매물 정보 추가"""
+        group_id = self.grouper.add(property_info)
+        property_info[GROUP_FIELD] = group_id
         self.property_data.append(property_info)
         
+        if not self.collapse_checkbox.isChecked():
+            self._append_row(property_info)
+        elif group_id in self._group_count_items:
+            self._group_count_items[group_id].setText(str(self.grouper.size_of(group_id)))
+        else:
+            self._group_count_items[group_id] = self._append_row(property_info, 1)
+        
+        # 통계 업데이트
+        self.stats_label.setText(
+            f"전체 매물: {len(self.property_data)}개 (중복 제외 {self.grouper.group_count}개)"
+        )
+    
+    def _append_row(self, property_info: Dict[str, str], count: Optional[int] = None) -> Optional[QTableWidgetItem]:
+        """테이블 행 추가 (묶어보기 화면이면 등록 수 셀 반환)"""
         row = self.table.rowCount()
         self.table.insertRow(row)
         
@@ -211,86 +332,222 @@ class MainWindow(QMainWindow):
         self.table.setItem(row, 1, QTableWidgetItem(property_info.get('가격', '')))
         self.table.setItem(row, 2, QTableWidgetItem(property_info.get('면적', '')))
         self.table.setItem(row, 3, QTableWidgetItem(property_info.get('층수', '')))
-        
-        # 통계 업데이트
-        stats = calculate_statistics(self.property_data)
-        self.stats_label.setText(f"전체 매물: {stats['total']}개")
+        if count is None:
+            return None
+        count_item = QTableWidgetItem(str(count))
+        self.table.setItem(row, 4, count_item)
+        return count_item
+    
+    def refresh_table(self):
+        """현재 보기 방식(전체/중복 묶어보기)으로 테이블 다시 채우기"""
+        collapsed = self.collapse_checkbox.isChecked()
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(0)
+        self._group_count_items = {}
+        if collapsed:
+            self.table.setColumnCount(5)
+            self.table.setHorizontalHeaderLabels(["동", "가격", "면적", "층수", "등록 수"])
+            for record, count in collapse_groups(self.property_data):
+                item = self._append_row(record, count)
+                group_id = record.get(GROUP_FIELD)
+                if group_id is not None:
+                    self._group_count_items[group_id] = item
+        else:
+            self.table.setColumnCount(4)
+            self.table.setHorizontalHeaderLabels(["동", "가격", "면적", "층수"])
+            for record in self.property_data:
+                self._append_row(record)
+        self.table.setSortingEnabled(True)
     
     def on_crawling_finished(self, results: List[Dict[str, str]]):
         """크롤링 완료 처리"""
         self.property_data = results
+        # 스레드 간 전달된 결과는 복사본이므로 그룹 ID 다시 부여
+        self.grouper = group_records(self.property_data)
+        if self.collapse_checkbox.isChecked():
+            self.refresh_table()
+        self.metrics_timer.stop()
+        self.update_metrics()
         
         # UI 상태 복원
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
-        self.excel_button.setEnabled(True)
-        self.csv_button.setEnabled(True)
+        self._reset_pause_button()
+        self._set_export_buttons_enabled(True)
         
         # 통계 업데이트
         stats = calculate_statistics(self.property_data)
-        stats_text = f"전체 매물: {stats['total']}개"
+        stats_text = f"전체 매물: {stats['total']}개 (중복 제외 {stats['unique_total']}개)"
         if stats['dong_count']:
             dong_info = ", ".join([f"{k}: {v}개" for k, v in stats['dong_count'].items()])
             stats_text += f" | 동별: {dong_info}"
         self.stats_label.setText(stats_text)
+        if self.property_data:
+            # 가격 요약은 매물 수에 비례해 오래 걸리므로 별도 스레드에서 계산 후 덧붙임
+            self.analytics_thread = AnalyticsThread(self.property_data)
+            self.analytics_thread.finished.connect(
+                lambda summary: self.on_analytics_finished(results, stats_text, summary)
+            )
+            self.analytics_thread.error_occurred.connect(
+                lambda message: self.add_log(f"시세 요약 오류: {message}")
+            )
+            self.analytics_thread.start()
         
         self.add_log(f"크롤링이 완료되었습니다. 총 {len(results)}개의 매물 정보를 수집했습니다.")
         QMessageBox.information(self, "완료", f"크롤링이 완료되었습니다.\n총 {len(results)}개의 매물 정보를 수집했습니다.")
     
+    def on_analytics_finished(self, results: List[Dict[str, str]], stats_text: str, summary: str):
+        """시세 요약 완료 처리 (그 사이 새 크롤링이 시작됐으면 무시)"""
+        if summary and results is self.property_data:
+            self.stats_label.setText(f"{stats_text} | {summary}")
+
     def on_crawling_error(self, error_message: str):
         """크롤링 오류 처리"""
         self.add_log(f"오류 발생: {error_message}")
+        self.metrics_timer.stop()
+        self.update_metrics()
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
+        self._reset_pause_button()
         QMessageBox.critical(self, "오류", f"크롤링 중 오류가 발생했습니다:\n{error_message}")
     
-    def save_to_excel(self):
-        """엑셀 파일로 저장"""
+    def _set_export_buttons_enabled(self, enabled: bool):
+        """저장 버튼 활성화 (저장 작업 중에는 비활성)"""
+        if self._exporting:
+            enabled = False
+        for button in (self.excel_button, self.csv_button, self.export_all_button):
+            button.setEnabled(enabled)
+
+    def _ask_save_path(self, title: str, default_filename: str, file_filter: str) -> str:
+        """파일 저장 대화상자 (데이터가 없으면 경고 후 빈 문자열)"""
         if not self.property_data:
             QMessageBox.warning(self, "경고", "저장할 데이터가 없습니다.")
-            return
-        
-        # 파일 저장 대화상자
-        default_filename = generate_default_filename()
-        filename, _ = QFileDialog.getSaveFileName(
-            self,
-            "엑셀 파일 저장",
-            default_filename,
-            "Excel Files (*.xlsx);;All Files (*)"
+            return ""
+        filename, _ = QFileDialog.getSaveFileName(self, title, default_filename, file_filter)
+        return filename
+
+    def save_to_excel(self):
+        """엑셀 파일로 저장"""
+        filename = self._ask_save_path(
+            "엑셀 파일 저장", generate_default_filename(), "Excel Files (*.xlsx);;All Files (*)"
         )
-        
         if filename:
-            if save_to_excel(self.property_data, filename):
-                self.add_log(f"엑셀 파일이 저장되었습니다: {filename}")
-                QMessageBox.information(self, "완료", f"엑셀 파일이 저장되었습니다:\n{filename}")
-            else:
-                QMessageBox.critical(self, "오류", "엑셀 파일 저장에 실패했습니다.")
+            self.start_export([filename])
     
     def save_to_csv(self):
         """CSV 파일로 저장"""
-        if not self.property_data:
-            QMessageBox.warning(self, "경고", "저장할 데이터가 없습니다.")
-            return
-        
-        # 파일 저장 대화상자
         default_filename = f"센트럴파크_매물정보_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        filename, _ = QFileDialog.getSaveFileName(
-            self,
-            "CSV 파일 저장",
-            default_filename,
-            "CSV Files (*.csv);;All Files (*)"
+        filename = self._ask_save_path("CSV 파일 저장", default_filename, "CSV Files (*.csv);;All Files (*)")
+        if filename:
+            self.start_export([filename])
+
+    def save_to_all(self):
+        """엑셀/CSV 파일을 같은 이름으로 함께 저장"""
+        filename = self._ask_save_path(
+            "엑셀+CSV 파일 저장", generate_default_filename(), "Excel Files (*.xlsx);;All Files (*)"
         )
-        
         if filename:
-            try:
-                import csv
-                with open(filename, 'w', newline='', encoding='utf-8-sig') as f:
-                    fieldnames = ['동', '가격', '면적', '층수']
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(self.property_data)
-                
-                self.add_log(f"CSV 파일이 저장되었습니다: {filename}")
-                QMessageBox.information(self, "완료", f"CSV 파일이 저장되었습니다:\n{filename}")
-            except Exception as e:
-                QMessageBox.critical(self, "오류", f"CSV 파일 저장에 실패했습니다:\n{str(e)}")
+            base = os.path.splitext(filename)[0]
+            self.start_export([f"{base}.xlsx", f"{base}.csv"])
+
+    def start_export(self, paths: List[str]):
+        """백그라운드 저장 시작 (현재 매물 목록 스냅샷 기준)"""
+        try:
+            self.export_thread = ExportThread(self.property_data, paths)
+        except ValueError as e:
+            QMessageBox.warning(self, "경고", str(e))
+            return
+        self.export_thread.progress_updated.connect(self.update_export_progress)
+        self.export_thread.finished.connect(self.on_export_finished)
+        self.export_thread.cancelled.connect(self.on_export_cancelled)
+        self.export_thread.error_occurred.connect(self.on_export_error)
+        self._exporting = True
+        self._set_export_buttons_enabled(False)
+        self.export_cancel_button.setEnabled(True)
+        self.export_thread.start()
+        self.add_log(f"저장 시작: {', '.join(paths)} ({len(self.property_data):,}건)")
+
+    def cancel_export(self):
+        """저장 취소"""
+        if self._exporting:
+            self.export_thread.cancel()
+            self.export_cancel_button.setEnabled(False)
+            self.add_log("저장 취소 요청됨...")
+
+    def update_export_progress(self, written: int, total: int, path: str):
+        """저장 진행 상황 업데이트"""
+        if total > 0:
+            percentage = int(written / total * 100)
+            self.progress_bar.setValue(percentage)
+            self.status_label.setText(
+                f"저장 중: {os.path.basename(path)} ({written:,}/{total:,}행, {percentage}%)"
+            )
+
+    def _end_export(self):
+        # 스레드 객체는 다음 저장 시작 시 교체 (종료 직전 스레드 파괴 방지)
+        self._exporting = False
+        self.export_cancel_button.setEnabled(False)
+        crawling = self.crawler_thread is not None and self.crawler_thread.isRunning()
+        self._set_export_buttons_enabled(not crawling and bool(self.property_data))
+
+    def on_export_finished(self, results: List[Dict]):
+        """저장 완료 처리"""
+        self._end_export()
+        saved = [r["path"] for r in results if r["ok"]]
+        failed = [f"{r['path']}: {r['error']}" for r in results if not r["ok"]]
+        for path in saved:
+            self.add_log(f"파일이 저장되었습니다: {path}")
+        self.status_label.setText("저장 완료")
+        if failed:
+            QMessageBox.critical(self, "오류", "파일 저장에 실패했습니다:\n" + "\n".join(failed))
+        else:
+            QMessageBox.information(self, "완료", "파일이 저장되었습니다:\n" + "\n".join(saved))
+
+    def on_export_cancelled(self):
+        """저장 취소 처리 (미완성 파일은 삭제됨)"""
+        self._end_export()
+        self.status_label.setText("저장 취소됨")
+        self.add_log("저장이 취소되었습니다.")
+
+    def on_export_error(self, error_message: str):
+        """저장 오류 처리"""
+        self._end_export()
+        self.add_log(f"저장 오류: {error_message}")
+        QMessageBox.critical(self, "오류", f"파일 저장 중 오류가 발생했습니다:\n{error_message}")
+
+    def show_changes(self):
+        """이전 스냅샷과 현재 결과(없으면 다른 스냅샷) 비교"""
+        snapshot_filter = "Snapshots (*.jsonl *.csv *.xlsx);;All Files (*)"
+        old_path, _ = QFileDialog.getOpenFileName(self, "이전 스냅샷 선택", "", snapshot_filter)
+        if not old_path:
+            return
+        if self.property_data:
+            new, new_label = self.property_data, "현재 결과"
+        else:
+            new, _ = QFileDialog.getOpenFileName(self, "비교할 스냅샷 선택", "", snapshot_filter)
+            if not new:
+                return
+            new_label = os.path.basename(new)
+        old_label = os.path.basename(old_path)
+
+        self.diff_thread = DiffThread(old_path, new)
+        self.diff_thread.finished.connect(
+            lambda result: self.on_diff_finished(result, old_label, new_label)
+        )
+        self.diff_thread.error_occurred.connect(self.on_diff_error)
+        self.diff_button.setEnabled(False)
+        self.diff_thread.start()
+        self.add_log(f"변경사항 비교 시작: {old_label} → {new_label}")
+
+    def on_diff_finished(self, result, old_label: str, new_label: str):
+        """비교 완료 처리"""
+        self.diff_button.setEnabled(True)
+        summary = ", ".join(f"{label} {count:,}건" for label, count in result.summary().items())
+        self.add_log(f"변경사항: {summary}")
+        DiffDialog(result, old_label, new_label, self).exec()
+
+    def on_diff_error(self, error_message: str):
+        """비교 오류 처리"""
+        self.diff_button.setEnabled(True)
+        self.add_log(f"비교 오류: {error_message}")
+        QMessageBox.critical(self, "오류", f"스냅샷 비교 중 오류가 발생했습니다:\n{error_message}")
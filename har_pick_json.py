@@ -1,37 +1,49 @@
-import json
-import re
+import argparse
+
+from utils.har_stream import HarFilter, analyze_har, iter_har_entries
 
 HAR_FILE = "network.har"
 
-def is_json(mime: str) -> bool:
-    mime = (mime or "").lower()
-    return "application/json" in mime or mime.endswith("+json")
 
 def main():
-    with open(HAR_FILE, "r", encoding="utf-8") as f:
-        har = json.load(f)
-
-    entries = har.get("log", {}).get("entries", [])
-    hits = []
-
-    for e in entries:
-        req = e.get("request", {})
-        res = e.get("response", {})
-        url = req.get("url", "")
-        status = res.get("status", 0)
-
-        mime = ""
-        content = (res.get("content") or {})
-        mime = content.get("mimeType", "")
-
-        if status == 200 and is_json(mime):
-            hits.append(url)
-
-    print("=== 200 JSON candidates ===")
-    for u in hits[:50]:
-        print(u)
+    parser = argparse.ArgumentParser(description="HAR 스트리밍 분석 (200 JSON 후보 / 엔드포인트 요약 / JSON 추출)")
+    parser.add_argument("har", nargs="?", default=HAR_FILE)
+    parser.add_argument("--status", type=int, action="append",
+                        help="상태 코드 필터 (반복 지정 가능, 기본: 200)")
+    parser.add_argument("--mime", default="json", help="MIME 필터 (json 또는 부분 문자열, 빈 값이면 전체)")
+    parser.add_argument("--url", default=None, help="URL 정규식 필터")
+    parser.add_argument("--limit", type=int, default=0, help="출력할 URL 수 (0이면 전체)")
+    parser.add_argument("--summary", action="store_true", help="엔드포인트별 건수/크기/소요시간 요약")
+    parser.add_argument("--extract", default=None, help="list/상세 응답 JSON을 JSONL로 저장")
+    parser.add_argument("--workers", type=int, default=0, help="본문 디코딩 프로세스 수")
+    args = parser.parse_args()
+
+    har_filter = HarFilter(statuses=set(args.status or [200]), mime=args.mime or None, url_pattern=args.url)
+
+    if args.summary or args.extract:
+        result = analyze_har(args.har, har_filter, extract_path=args.extract, workers=args.workers)
+        print(f"=== 엔드포인트 요약 (전체 {result['entries']}, 필터 통과 {result['matched']}) ===")
+        for key, stat in result["endpoints"].items():
+            print(f"{stat['count']:>6}건 {stat['bytes']:>12,}B avg={stat['avg_ms']}ms "
+                  f"p95={stat['p95_ms']}ms max={stat['max_ms']}ms  {key}")
+        if args.extract:
+            print(f"\n추출 {result['extracted']}건 -> {args.extract}")
+        return
+
+    # 출력 라벨은 현재 필터 기준 (예: "200 JSON", "200/304 image", 빈 MIME 필터는 "200 all")
+    mime_label = 'JSON' if args.mime == 'json' else args.mime or 'all'
+    label = f"{'/'.join(map(str, sorted(har_filter.statuses)))} {mime_label}"
+    print(f"=== {label} candidates ===")
+    total = 0
+    for entry in iter_har_entries(args.har):
+        if not har_filter.match(entry):
+            continue
+        total += 1
+        if not args.limit or total <= args.limit:
+            print(entry.get("request", {}).get("url", ""))
+
+    print(f"\nTotal {label}: {total}")
 
-    print(f"\nTotal 200 JSON: {len(hits)}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,270 @@
+"""
+시세 분석
+가격/면적/층수 문자열을 한 번에 숫자 컬럼으로 변환한 뒤 평당가·㎡당 가격, 평형 구간, 층 구분을 계산하고
+거래유형별 전체/동별/평형별/층별 매물 수와 가격 백분위를 그룹 단위 벡터 연산으로 집계
+(같은 문자열은 고유값만 파싱, 백분위는 그룹·값 정렬 1회로 계산)
+"""
+
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from utils.dedup import parse_area, parse_price
+
+# 1평 = 3.305785㎡
+PYEONG_M2 = 3.305785
+# 평형 구간 경계 (평)
+PYEONG_BINS = (10, 20, 30, 40, 50, 60)
+# 집계 백분위
+PERCENTILES = (0.25, 0.5, 0.75)
+# 층 구분 (층/전체층 비율 기준)
+FLOOR_BANDS = ('저층', '중층', '고층')
+
+# 그룹 키 없는 거래유형/동 값
+_UNKNOWN = '미지정'
+_FLOOR_TEXT_RE = re.compile(r"^\s*([^\s/]+)\s*/\s*(\d+)")
+
+Table = Tuple[List[str], List[Tuple]]
+
+
+def _pandas():
+    # GUI 시작 속도를 위해 집계 시점에 import
+    import pandas as pd
+    return pd
+
+
+def pyeong_class(pyeong: float) -> str:
+    """평 → 평형 구간 이름 ("10평 미만", "30평대", "60평 이상")"""
+    if pyeong < PYEONG_BINS[0]:
+        return f"{PYEONG_BINS[0]}평 미만"
+    if pyeong >= PYEONG_BINS[-1]:
+        return f"{PYEONG_BINS[-1]}평 이상"
+    return f"{int(pyeong // 10 * 10)}평대"
+
+
+def floor_band(text: str) -> str:
+    """층수 문자열 → 층 구분 ("저/15" → 저층, "12/15" → 고층, 지하/해석 불가는 '기타')"""
+    match = _FLOOR_TEXT_RE.match(str(text or ''))
+    if not match:
+        return '기타'
+    floor, total = match.group(1).rstrip('층'), int(match.group(2))
+    if floor in ('저', '중', '고'):
+        return f"{floor}층"
+    if not floor.isdigit() or total <= 0:
+        return '기타'
+    ratio = int(floor) / total
+    return FLOOR_BANDS[0] if ratio <= 1 / 3 else FLOOR_BANDS[1] if ratio <= 2 / 3 else FLOOR_BANDS[2]
+
+
+class MarketAnalytics:
+    """매물 목록의 숫자 컬럼과 그룹 집계"""
+
+    def __init__(self, records: Sequence[Dict]):
+        """
+        Args:
+            records: 매물 데이터 리스트 (여러 단지면 complex_id로 동을 구분)
+        """
+        import numpy as np
+        self.count = len(records)
+        # 같은 문자열이 반복되므로 고유값만 변환 후 코드로 펼침
+        price_codes, price_uniques = self._factorize(records, '가격')
+        area_codes, area_uniques = self._factorize(records, '면적')
+        self.price = self._expand(price_codes, [parse_price(v) for v in price_uniques])
+        area = self._expand(area_codes, [parse_area(v) for v in area_uniques])
+        area[area <= 0] = np.nan
+        self.area = area
+        self.pyeong = area / PYEONG_M2
+        self.price_per_pyeong = self.price / self.pyeong
+        self.price_per_m2 = self.price / area
+        self._orders: Dict[str, object] = {}
+
+        # 그룹 차원: 이름 → (행별 코드, 코드별 라벨)
+        self.dimensions: Dict[str, Tuple[object, List[str]]] = {}
+        self.dimensions['trade_type'] = self._categories(records, '거래유형')
+        dong = self._categories(records, '동')
+        if any(record.get('complex_id') for record in records[:1000]):
+            dong = self._join_categories(self._categories(records, 'complex_id'), dong)
+        self.dimensions['dong'] = dong
+
+        size_labels = [pyeong_class(0)] + [pyeong_class(b) for b in PYEONG_BINS] + ['기타']
+        size_codes = np.digitize(self.pyeong, PYEONG_BINS)
+        size_codes[np.isnan(self.pyeong)] = len(size_labels) - 1
+        self.dimensions['size_class'] = (size_codes, size_labels)
+
+        floor_labels = list(FLOOR_BANDS) + ['기타']
+        floor_codes, floor_uniques = self._factorize(records, '층수')
+        band_codes = np.array([floor_labels.index(floor_band(v)) for v in floor_uniques]
+                              + [len(floor_labels) - 1], dtype=np.int64)
+        self.dimensions['floor_band'] = (band_codes[floor_codes], floor_labels)
+
+    @staticmethod
+    def _factorize(records: Sequence[Dict], field: str):
+        import numpy as np
+        pd = _pandas()
+        # 결측 코드(-1)는 호출 측에서 고유값 목록 끝에 붙인 항목으로 매핑
+        return pd.factorize(np.array([record.get(field) for record in records], dtype=object))
+
+    @staticmethod
+    def _expand(codes, parsed: List[Optional[float]]):
+        import numpy as np
+        values = np.array([np.nan if v is None else v for v in parsed] + [np.nan], dtype=float)
+        return values[codes]
+
+    @classmethod
+    def _categories(cls, records: Sequence[Dict], field: str) -> Tuple[object, List[str]]:
+        """필드 → (행별 코드, 정렬된 라벨), 빈 값은 '미지정'"""
+        import numpy as np
+        codes, uniques = cls._factorize(records, field)
+        labels = [str(u) if u not in ('', None) else _UNKNOWN for u in uniques] + [_UNKNOWN]
+        # 라벨 이름순 코드로 재배열 (같은 라벨은 하나의 코드로)
+        ordered = sorted(set(labels))
+        remap = np.array([ordered.index(label) for label in labels], dtype=np.int64)
+        return remap[codes], ordered
+
+    @staticmethod
+    def _join_categories(prefix: Tuple[object, List[str]],
+                         category: Tuple[object, List[str]]) -> Tuple[object, List[str]]:
+        """두 차원 → 조합 차원 (예: 단지 + 동)"""
+        prefix_codes, prefix_labels = prefix
+        codes, labels = category
+        combined = [f"{p} {label}" for p in prefix_labels for label in labels]
+        return prefix_codes * len(labels) + codes, combined
+
+    def group_stats(self, by: Optional[str] = None, title: str = '구분') -> Table:
+        """
+        거래유형(+ by 차원)별 매물 수와 가격/평당가 백분위
+
+        Args:
+            by: 'dong', 'size_class', 'floor_band' 또는 None(거래유형 전체)
+            title: 그룹 컬럼 이름
+
+        Returns:
+            (컬럼 목록, 행 튜플 목록) - 거래유형, 그룹 순 정렬 (매물 없는 그룹 제외)
+        """
+        import numpy as np
+        trade_codes, trade_labels = self.dimensions['trade_type']
+        if by:
+            by_codes, by_labels = self.dimensions[by]
+        else:
+            by_codes, by_labels = np.zeros(self.count, dtype=np.int64), ['']
+        group_codes = trade_codes * len(by_labels) + by_codes
+        group_count = len(trade_labels) * len(by_labels)
+
+        counts = np.bincount(group_codes, minlength=group_count)
+        price = self._percentiles(group_codes, group_count, ('price',))
+        # 평당가와 ㎡당 가격은 같은 순서(면적 단위만 다름)라 그룹 정렬 1회로 함께 계산
+        per_area = self._percentiles(group_codes, group_count,
+                                     ('price_per_pyeong', 'price_per_m2'), (0.5,))
+
+        columns = ['거래유형'] + ([title] if by else []) + [
+            '매물 수', '최저가(만원)', '25%(만원)', '중위가(만원)', '75%(만원)', '최고가(만원)',
+            '평당가 중위(만원)', '㎡당 가격 중위(만원)',
+        ]
+        groups = np.flatnonzero(counts)
+        values = _rounded(np.hstack((price[groups], per_area[groups])))
+        trade_index, by_index = np.divmod(groups, len(by_labels))
+        labels = [(trade_labels[t],) + ((by_labels[b],) if by else ())
+                  for t, b in zip(trade_index.tolist(), by_index.tolist())]
+        rows = [label + (count,) + tuple(row)
+                for label, count, row in zip(labels, counts[groups].tolist(), values)]
+        return columns, rows
+
+    def _value_order(self, name: str):
+        """값 컬럼의 (유효 행, 값 오름차순 정렬 순서) - 그룹 방식과 무관하므로 1회만 정렬"""
+        import numpy as np
+        cached = self._orders.get(name)
+        if cached is None:
+            values = getattr(self, name)
+            valid = np.flatnonzero(~np.isnan(values))
+            cached = valid[np.argsort(values[valid], kind='stable')]
+            self._orders[name] = cached
+        return cached
+
+    def _percentiles(self, group_codes, group_count: int, names: Tuple[str, ...],
+                     quantiles: Tuple[float, ...] = (0.0,) + PERCENTILES + (1.0,)):
+        """
+        그룹별 백분위 (값 정렬 순서를 그룹 코드로 안정 정렬, 값 없는 그룹은 NaN)
+
+        names의 컬럼은 첫 컬럼과 정렬 순서가 같아야 함 (그룹 정렬 1회를 공유)
+        결과는 (그룹, 컬럼 × 백분위) 배열
+        """
+        import numpy as np
+        rows = self._value_order(names[0])
+        codes = group_codes[rows]
+        if group_count < 2 ** 15:
+            # 작은 정수는 기수 정렬 (O(n))
+            codes = codes.astype(np.int16)
+        rows = rows[np.argsort(codes, kind='stable')]
+        counts = np.bincount(codes, minlength=group_count)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        result = np.full((group_count, len(names) * len(quantiles)), np.nan)
+        has_values = counts > 0
+        base = starts[has_values]
+        for index, quantile in enumerate(quantiles):
+            # 선형 보간 백분위 (numpy 기본 방식과 동일)
+            position = quantile * (counts[has_values] - 1)
+            lower = np.floor(position).astype(np.int64)
+            upper = np.ceil(position).astype(np.int64)
+            weight = position - lower
+            low_rows = rows[base + lower]
+            high_rows = rows[base + upper]
+            for offset, name in enumerate(names):
+                values = getattr(self, name)
+                low_values = values[low_rows]
+                high_values = values[high_rows]
+                result[has_values, offset * len(quantiles) + index] = (
+                    low_values + (high_values - low_values) * weight)
+        return result
+
+    def sheets(self) -> List[Tuple[str, List[str], List[Tuple]]]:
+        """엑셀 추가 시트 목록 (시트 이름, 컬럼, 행)"""
+        return [
+            ('시세 요약', *self.group_stats()),
+            ('동별 시세', *self.group_stats('dong', '동')),
+            ('평형별 시세', *self.group_stats('size_class', '평형')),
+            ('층별 시세', *self.group_stats('floor_band', '층 구분')),
+        ]
+
+    def summary_text(self) -> str:
+        """거래유형별 중위가/평당가 한 줄 요약 (GUI 통계 표시용)"""
+        _, rows = self.group_stats()
+        parts = []
+        for row in rows:
+            trade_type, median, per_pyeong = row[0], row[4], row[7]
+            if median == '':
+                continue
+            label = '' if trade_type == _UNKNOWN else f"{trade_type} "
+            text = f"{label}중위 {format_price(median)}"
+            if per_pyeong != '':
+                text += f" (평당 {per_pyeong:,}만원)"
+            parts.append(text)
+        return ", ".join(parts)
+
+
+def _rounded(values) -> List[List]:
+    """만원 단위 정수 행 목록 (값 없음은 빈 칸)"""
+    import numpy as np
+    missing = np.isnan(values)
+    cells = np.rint(np.where(missing, 0, values)).astype(np.int64).astype(object)
+    cells[missing] = ''
+    return cells.tolist()
+
+
+def format_price(man: int) -> str:
+    """만원 단위 금액 → "12억 5,000만원" 표기"""
+    eok, rest = divmod(int(man), 10000)
+    if eok and rest:
+        return f"{eok}억 {rest:,}만원"
+    if eok:
+        return f"{eok}억원"
+    return f"{rest:,}만원"
+
+
+def analytics_sheets(records: Sequence[Dict]) -> List[Tuple[str, List[str], List[Tuple]]]:
+    """매물 목록 → 엑셀 추가 시트 (매물이 없거나 가격을 해석할 수 없으면 빈 목록)"""
+    import numpy as np
+    if not records:
+        return []
+    analytics = MarketAnalytics(records)
+    if np.isnan(analytics.price).all():
+        return []
+    return analytics.sheets()
@@ -4,6 +4,8 @@
 
 from typing import List, Dict
 
+from utils.dedup import GROUP_FIELD, parse_price
+
 
 def calculate_statistics(data: List[Dict[str, str]]) -> Dict[str, any]:
     """
@@ -17,6 +19,7 @@ def calculate_statistics(data: List[Dict[str, str]]) -> Dict[str, any]:
     """
     stats = {
         'total': len(data),
+        'unique_total': len(data),
         'min_price': '',
         'max_price': '',
         'avg_price': '',
@@ -26,21 +29,27 @@ def calculate_statistics(data: List[Dict[str, str]]) -> Dict[str, any]:
     if not data:
         return stats
     
+    # 중복 매물 그룹이 부여된 경우 그룹 수 기준 매물 수
+    groups = {item.get(GROUP_FIELD) for item in data if item.get(GROUP_FIELD) is not None}
+    if groups:
+        stats['unique_total'] = len(groups) + sum(1 for item in data if item.get(GROUP_FIELD) is None)
+    
     # 동별 매물 수 계산
     for item in data:
         dong = item.get('동', '미지정')
         stats['dong_count'][dong] = stats['dong_count'].get(dong, 0) + 1
     
-    # 가격 정보 추출 (간단한 파싱)
+    # 가격 정보 추출 (만원 단위 금액 기준 비교, 표시는 원래 문자열)
     prices = []
     for item in data:
         price_str = item.get('가격', '')
-        if price_str:
-            prices.append(price_str)
+        amount = parse_price(price_str)
+        if amount is not None:
+            prices.append((amount, price_str))
     
     if prices:
-        stats['min_price'] = min(prices, key=lambda x: len(x))
-        stats['max_price'] = max(prices, key=lambda x: len(x))
+        stats['min_price'] = min(prices)[1]
+        stats['max_price'] = max(prices)[1]
     
     return stats
 
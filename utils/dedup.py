@@ -0,0 +1,192 @@
+"""
+중복 매물 묶기
+여러 중개사가 같은 세대를 각각 등록한 매물을 지문(단지, 동, 층, 면적, 거래유형, 가격 허용 오차)으로 묶음
+지문 해시 버킷으로 비교 대상을 좁혀 전체 쌍 비교 없이 거의 선형 시간에 처리
+"""
+
+import math
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+GROUP_FIELD = '그룹'
+
+# 억 뒤 만원 단위는 "만" 없이 올 수 있음 (list API dealOrWarrantPrc "5억 5,000")
+_EOK_RE = re.compile(r"([\d,.]+)\s*억\s*([\d,]+)?")
+_MAN_RE = re.compile(r"([\d,]+)\s*만")
+_NUMBER_RE = re.compile(r"[\d,]+(?:\.\d+)?")
+_FLOOR_RE = re.compile(r"([^\s/]+)\s*/\s*(\d+)")
+
+
+def parse_price(text: object) -> Optional[int]:
+    """
+    가격 문자열 → 만원 단위 정수
+
+    Args:
+        text: "12억 5,000만원", "12억 5,000", "12억원", "9,500만원", 125000 등 (월세 "보증금/월세"는 보증금 기준)
+
+    Returns:
+        만원 단위 금액 (해석 불가 시 None)
+    """
+    if text is None or text == '':
+        return None
+    if isinstance(text, (int, float)):
+        return int(text)
+    return _parse_price_text(str(text))
+
+
+@lru_cache(maxsize=65536)
+def _parse_price_text(text: str) -> Optional[int]:
+    # 같은 가격 문자열이 반복되므로 파싱 결과 캐시
+    text = text.split('/')[0]
+    eok = _EOK_RE.search(text)
+    if eok:
+        total = int(float(eok.group(1).replace(',', '')) * 10000)
+        if eok.group(2):
+            total += int(eok.group(2).replace(',', ''))
+        return total
+    man = _MAN_RE.search(text)
+    if man:
+        return int(man.group(1).replace(',', ''))
+    match = _NUMBER_RE.search(text)
+    if match:
+        return int(float(match.group(0).replace(',', '')))
+    return None
+
+
+def parse_area(text: object) -> Optional[float]:
+    """면적 문자열("84.95㎡") → 소수 첫째 자리 반올림 값"""
+    if text is None or text == '':
+        return None
+    if isinstance(text, (int, float)):
+        return round(float(text), 1)
+    return _parse_area_text(str(text))
+
+
+@lru_cache(maxsize=4096)
+def _parse_area_text(text: str) -> Optional[float]:
+    match = _NUMBER_RE.search(text)
+    if not match:
+        return None
+    return round(float(match.group(0).replace(',', '')), 1)
+
+
+def normalize_floor(text: object) -> str:
+    """층수 표기 정규화 ("5/30층", "5 / 30" → "5/30")"""
+    return _normalize_floor_text(str(text or ''))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_floor_text(text: str) -> str:
+    text = text.strip()
+    match = _FLOOR_RE.search(text)
+    if match:
+        return f"{match.group(1).rstrip('층')}/{match.group(2)}"
+    return text.rstrip('층')
+
+
+def fingerprint(record: Dict) -> Tuple:
+    """가격을 제외한 지문 (해시 버킷 키)"""
+    return (
+        str(record.get('complex_id') or ''),
+        str(record.get('동') or '').strip(),
+        normalize_floor(record.get('층수')),
+        parse_area(record.get('면적')),
+        str(record.get('거래유형') or ''),
+    )
+
+
+class DuplicateGrouper:
+    """
+    증분 중복 그룹 할당기
+
+    (지문, 가격 로그 버킷)별로 가격 기준점(그룹 첫 매물 가격)을 두고,
+    새 매물은 자기 버킷과 앞뒤 버킷 3개 안에서만 허용 오차 이내 기준점을 찾음
+    """
+
+    def __init__(self, price_tolerance: float = 0.01):
+        """
+        Args:
+            price_tolerance: 같은 세대로 볼 가격 차이 비율 (기본 1%)
+        """
+        self.price_tolerance = price_tolerance
+        self._buckets: Dict[Tuple, List[Tuple[Optional[int], int]]] = {}
+        if price_tolerance >= 1:
+            # 기준점보다 낮은 가격은 모두 허용 → 버킷 1개
+            self._log_step = math.inf
+        elif price_tolerance > 0:
+            # 기준점 아래쪽 로그 거리 -log(1 - tol)가 위쪽 log(1 + tol)보다 크므로 아래쪽 기준
+            self._log_step = -math.log1p(-price_tolerance)
+        else:
+            self._log_step = 0.0
+        self.sizes: List[int] = []
+
+    def _price_bucket(self, price: Optional[int]) -> Optional[int]:
+        """버킷 폭 = 허용 오차 범위의 최대 로그 거리 → 허용 오차 이내 가격은 항상 같거나 인접한 버킷에 위치"""
+        if price is None or price <= 0:
+            return price
+        if not self._log_step:
+            return price
+        return int(math.log(price) / self._log_step)
+
+    @property
+    def group_count(self) -> int:
+        return len(self.sizes)
+
+    def add(self, record: Dict) -> int:
+        """매물 1건의 그룹 ID 반환 (1부터 시작, 등장 순서)"""
+        price = parse_price(record.get('가격'))
+        key = fingerprint(record)
+        bucket = self._price_bucket(price)
+        if price is None or price <= 0 or not self._log_step:
+            neighbours = (bucket,)
+        else:
+            neighbours = (bucket, bucket - 1, bucket + 1)
+        for candidate in neighbours:
+            for anchor, group_id in self._buckets.get((key, candidate), ()):
+                if price is None or anchor is None or anchor <= 0:
+                    matched = anchor == price
+                else:
+                    matched = abs(price - anchor) <= anchor * self.price_tolerance
+                if matched:
+                    self.sizes[group_id - 1] += 1
+                    return group_id
+        self.sizes.append(1)
+        group_id = len(self.sizes)
+        self._buckets.setdefault((key, bucket), []).append((price, group_id))
+        return group_id
+
+    def size_of(self, group_id: int) -> int:
+        """그룹에 속한 매물 수"""
+        return self.sizes[group_id - 1]
+
+
+def group_records(records: List[Dict], price_tolerance: float = 0.01) -> DuplicateGrouper:
+    """
+    매물 목록 전체에 그룹 ID 부여 (각 레코드에 GROUP_FIELD 추가)
+
+    Args:
+        records: 매물 데이터 리스트
+        price_tolerance: 같은 세대로 볼 가격 차이 비율
+
+    Returns:
+        그룹 크기 정보를 가진 DuplicateGrouper
+    """
+    grouper = DuplicateGrouper(price_tolerance)
+    for record in records:
+        record[GROUP_FIELD] = grouper.add(record)
+    return grouper
+
+
+def collapse_groups(records: List[Dict]) -> List[Tuple[Dict, int]]:
+    """그룹별 대표 매물(첫 등장)과 매물 수 목록"""
+    representatives: Dict[int, Dict] = {}
+    counts: Dict[int, int] = {}
+    for record in records:
+        group_id = record.get(GROUP_FIELD)
+        if group_id is None:
+            group_id = -(len(representatives) + 1)
+        if group_id not in representatives:
+            representatives[group_id] = record
+        counts[group_id] = counts.get(group_id, 0) + 1
+    return [(record, counts[group_id]) for group_id, record in representatives.items()]
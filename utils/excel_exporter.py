@@ -2,20 +2,112 @@
 엑셀 파일 저장 기능
 """
 
-import pandas as pd
 from datetime import datetime
-from typing import List, Dict
-from openpyxl import load_workbook
-from openpyxl.styles import Alignment, Font
+from typing import Callable, List, Dict, Optional, Sequence, Tuple
 
+from utils.dedup import GROUP_FIELD
 
-def save_to_excel(data: List[Dict[str, str]], filename: str) -> bool:
+# 기본 컬럼 (거래유형/매물번호/중복 매물 그룹 ID는 데이터에 있을 때만 추가)
+BASE_COLUMNS = ['동', '가격', '면적', '층수']
+COLUMN_WIDTHS = {
+    '거래유형': 10,
+    '매물번호': 14,
+    '동': 15,
+    '가격': 20,
+    '면적': 15,
+    '층수': 15,
+    GROUP_FIELD: 8
+}
+SHEET_NAME = '매물정보'
+
+
+def export_columns(data: List[Dict[str, str]]) -> List[str]:
+    """저장할 컬럼 순서 (거래유형/매물번호/그룹은 한 건이라도 있으면 포함)"""
+    columns = list(BASE_COLUMNS)
+    if any('매물번호' in record for record in data):
+        columns.insert(0, '매물번호')
+    if any('거래유형' in record for record in data):
+        columns.insert(0, '거래유형')
+    if any(GROUP_FIELD in record for record in data):
+        columns.append(GROUP_FIELD)
+    return columns
+
+
+def write_excel_rows(rows: Sequence[Tuple], columns: List[str], filename: str,
+                     progress_callback: Optional[Callable[[int], None]] = None,
+                     chunk_size: int = 5000,
+                     extra_sheets: Sequence[Tuple[str, List[str], Sequence[Tuple]]] = ()):
+    """
+    행 튜플을 엑셀 파일로 스트리밍 저장 (write-only 모드, 셀은 행 단위로 만들어 바로 기록)
+
+    Args:
+        rows: 컬럼 순서의 값 튜플 목록
+        columns: 컬럼 이름
+        filename: 저장할 파일 경로
+        progress_callback: chunk_size 행마다 누적 저장 행 수로 호출 (예외를 던지면 중단)
+        chunk_size: 진행률 보고 단위
+        extra_sheets: 매물 시트 뒤에 추가할 (시트 이름, 컬럼, 행) 목록 (시세 분석 등)
+    """
+    # openpyxl은 무거우므로 저장 시점에만 로드 (GUI 시작 속도)
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font
+    from openpyxl.utils import get_column_letter
+
+    workbook = Workbook(write_only=True)
+    header_font = Font(bold=True, size=11)
+    header_alignment = Alignment(horizontal='center', vertical='center')
+    data_alignment = Alignment(horizontal='left', vertical='center')
+
+    def create_sheet(title: str, sheet_columns: List[str], default_width: int):
+        sheet = workbook.create_sheet(title)
+        # 컬럼 너비 (write-only 모드는 행 추가 전에 지정)
+        for idx, column in enumerate(sheet_columns, start=1):
+            sheet.column_dimensions[get_column_letter(idx)].width = COLUMN_WIDTHS.get(column, default_width)
+        # 헤더 스타일 설정
+        header = []
+        for column in sheet_columns:
+            cell = WriteOnlyCell(sheet, value=column)
+            cell.font = header_font
+            cell.alignment = header_alignment
+            header.append(cell)
+        sheet.append(header)
+        return sheet
+
+    def data_row(sheet, row: Tuple) -> List:
+        # 데이터 정렬 설정 (숫자 형태 값도 왼쪽 정렬)
+        cells = []
+        for value in row:
+            cell = WriteOnlyCell(sheet, value=value)
+            cell.alignment = data_alignment
+            cells.append(cell)
+        return cells
+
+    worksheet = create_sheet(SHEET_NAME, columns, 12)
+
+    written = 0
+    for row in rows:
+        worksheet.append(data_row(worksheet, row))
+        written += 1
+        if progress_callback and written % chunk_size == 0:
+            progress_callback(written)
+    if progress_callback:
+        progress_callback(written)
+    for title, sheet_columns, sheet_rows in extra_sheets:
+        sheet = create_sheet(title, sheet_columns, 16)
+        for row in sheet_rows:
+            sheet.append(data_row(sheet, row))
+    workbook.save(filename)
+
+
+def save_to_excel(data: List[Dict[str, str]], filename: str, analytics: bool = True) -> bool:
     """
     데이터를 엑셀 파일로 저장
     
     Args:
         data: 저장할 데이터 리스트
         filename: 저장할 파일 경로
+        analytics: 시세 분석 시트(요약/동별/평형별/층별) 추가 여부
         
     Returns:
         성공 여부
@@ -24,45 +116,13 @@ def save_to_excel(data: List[Dict[str, str]], filename: str) -> bool:
         if not data:
             return False
         
-        # DataFrame 생성
-        df = pd.DataFrame(data)
-        
-        # 컬럼 순서 지정
-        columns = ['동', '가격', '면적', '층수']
-        df = df.reindex(columns=columns)
-        
-        # 엑셀 파일로 저장
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='매물정보', index=False)
-            
-            # 워크시트 가져오기
-            worksheet = writer.sheets['매물정보']
-            
-            # 헤더 스타일 설정
-            header_font = Font(bold=True, size=11)
-            header_alignment = Alignment(horizontal='center', vertical='center')
-            
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.alignment = header_alignment
-            
-            # 데이터 정렬 설정
-            data_alignment = Alignment(horizontal='left', vertical='center')
-            for row in worksheet.iter_rows(min_row=2, max_row=worksheet.max_row):
-                for cell in row:
-                    cell.alignment = data_alignment
-            
-            # 컬럼 너비 자동 조정
-            column_widths = {
-                'A': 15,  # 동
-                'B': 20,  # 가격
-                'C': 15,  # 면적
-                'D': 15   # 층수
-            }
-            
-            for col, width in column_widths.items():
-                worksheet.column_dimensions[col].width = width
-        
+        columns = export_columns(data)
+        rows = [tuple(record.get(column, '') for column in columns) for record in data]
+        extra_sheets = []
+        if analytics:
+            from utils.analytics import analytics_sheets
+            extra_sheets = analytics_sheets(data)
+        write_excel_rows(rows, columns, filename, extra_sheets=extra_sheets)
         return True
         
     except Exception as e:
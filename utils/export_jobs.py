@@ -0,0 +1,170 @@
+"""
+백그라운드 내보내기 작업
+매물 스냅샷 1개를 행 튜플로 1회 변환한 뒤 여러 형식(엑셀/CSV/JSONL)으로 순서대로 저장
+엑셀에는 시세 분석 시트(요약/동별/평형별/층별)를 함께 저장
+행 단위 진행률 콜백과 취소를 지원 (GUI는 gui/export_thread.py 작업자 스레드에서 실행)
+"""
+
+import csv
+import json
+import os
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from utils.excel_exporter import export_columns, write_excel_rows
+
+# 진행률 보고/취소 확인 단위 (행)
+CHUNK_SIZE = 5000
+
+
+class ExportCancelled(Exception):
+    """내보내기 취소"""
+
+
+def detect_format(path: str) -> str:
+    """확장자 → 저장 형식 (xlsx/csv/jsonl)"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".xlsx", ".xlsm"):
+        return "xlsx"
+    if ext in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if ext == ".csv":
+        return "csv"
+    raise ValueError(f"지원하지 않는 저장 형식: {path}")
+
+
+def _write_csv(rows: Sequence[Tuple], columns: List[str], path: str,
+               progress_callback: Callable[[int], None]):
+    # 엑셀에서 한글이 깨지지 않도록 BOM 포함
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for start in range(0, len(rows), CHUNK_SIZE):
+            chunk = rows[start:start + CHUNK_SIZE]
+            writer.writerows(chunk)
+            progress_callback(start + len(chunk))
+
+
+def _write_jsonl(rows: Sequence[Tuple], columns: List[str], path: str,
+                 progress_callback: Callable[[int], None]):
+    with open(path, "w", encoding="utf-8") as f:
+        for start in range(0, len(rows), CHUNK_SIZE):
+            chunk = rows[start:start + CHUNK_SIZE]
+            f.write("".join(
+                json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n" for row in chunk
+            ))
+            progress_callback(start + len(chunk))
+
+
+def _write_xlsx(rows: Sequence[Tuple], columns: List[str], path: str,
+                progress_callback: Callable[[int], None], extra_sheets=()):
+    write_excel_rows(rows, columns, path, progress_callback, chunk_size=CHUNK_SIZE,
+                     extra_sheets=extra_sheets)
+
+
+WRITERS = {
+    "xlsx": _write_xlsx,
+    "csv": _write_csv,
+    "jsonl": _write_jsonl,
+}
+
+
+class ExportJob:
+    """
+    매물 내보내기 작업 (여러 파일을 한 스냅샷에서 저장)
+
+    생성 시 레코드 목록을 얕은 복사해 두므로 이후 원본 목록에 행이 추가되어도 영향 없음
+    run()은 작업자 스레드에서, cancel()은 어느 스레드에서나 호출 가능
+    """
+
+    def __init__(self, records: List[Dict], paths: List[str],
+                 progress_callback: Optional[Callable[[int, int, str], None]] = None,
+                 analytics: bool = True):
+        """
+        Args:
+            records: 매물 데이터 리스트
+            paths: 저장할 파일 경로 목록 (확장자로 형식 결정)
+            progress_callback: (누적 저장 행 수, 전체 행 수, 현재 파일 경로) 콜백
+            analytics: 엑셀에 시세 분석 시트 추가 여부
+        """
+        self.records = list(records)
+        self.targets = [(path, detect_format(path)) for path in paths]
+        self.progress_callback = progress_callback
+        self.analytics = analytics
+        self._cancel = threading.Event()
+
+    @property
+    def total_rows(self) -> int:
+        """모든 파일 기준 전체 저장 행 수"""
+        return len(self.records) * len(self.targets)
+
+    def cancel(self):
+        """취소 요청 (다음 진행률 보고 시점에 중단, 미완성 파일은 삭제)"""
+        self._cancel.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def _snapshot_rows(self, columns: List[str]) -> List[Tuple]:
+        """레코드 → 컬럼 순서 값 튜플 (모든 형식이 공유)"""
+        rows = []
+        for start in range(0, len(self.records), CHUNK_SIZE):
+            if self._cancel.is_set():
+                raise ExportCancelled()
+            rows.extend(
+                tuple(record.get(column, '') for column in columns)
+                for record in self.records[start:start + CHUNK_SIZE]
+            )
+        return rows
+
+    def run(self) -> List[Dict]:
+        """
+        모든 대상 파일 저장
+
+        Returns:
+            파일별 결과 목록 ({"path", "format", "rows", "ok", "error"})
+
+        Raises:
+            ExportCancelled: 취소 요청 시 (이미 완료된 파일은 유지)
+        """
+        columns = export_columns(self.records)
+        rows = self._snapshot_rows(columns)
+        extra_sheets = []
+        if self.analytics and any(fmt == "xlsx" for _, fmt in self.targets):
+            from utils.analytics import analytics_sheets
+            extra_sheets = analytics_sheets(self.records)
+            if self._cancel.is_set():
+                raise ExportCancelled()
+        total = self.total_rows
+        results = []
+        for index, (path, fmt) in enumerate(self.targets):
+            done_before = index * len(rows)
+
+            def report(written: int, path=path, done_before=done_before):
+                if self._cancel.is_set():
+                    raise ExportCancelled()
+                if self.progress_callback:
+                    self.progress_callback(done_before + written, total, path)
+
+            # 임시 파일에 쓴 뒤 교체 (취소/오류 시 기존 파일 보존)
+            tmp_path = f"{path}.part"
+            try:
+                options = {"extra_sheets": extra_sheets} if fmt == "xlsx" else {}
+                WRITERS[fmt](rows, columns, tmp_path, report, **options)
+                os.replace(tmp_path, path)
+                results.append({"path": path, "format": fmt, "rows": len(rows), "ok": True, "error": None})
+            except ExportCancelled:
+                self._remove(tmp_path)
+                raise
+            except Exception as e:
+                self._remove(tmp_path)
+                results.append({"path": path, "format": fmt, "rows": 0, "ok": False, "error": str(e)})
+        return results
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,29 @@
+"""
+JSON 디코딩 유틸리티
+orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 대체
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    JSON 본문을 한 번만 디코딩
+
+    Args:
+        data: 응답 본문 (bytes 권장, 별도 문자열 변환 없이 바로 파싱)
+
+    Returns:
+        파싱된 객체
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
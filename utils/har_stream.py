@@ -0,0 +1,266 @@
+"""
+스트리밍 HAR 처리 유틸리티
+HAR 전체를 json.load 하지 않고 entries 배열을 한 건씩 디코딩 (메모리 사용량 일정)
+"""
+
+import base64
+import json
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Pattern, Set, Tuple
+from urllib.parse import urlparse
+
+_ENTRIES_RE = re.compile(r'"entries"\s*:\s*\[')
+_NUMERIC_SEGMENT_RE = re.compile(r"/\d+(?=/|$)")
+
+LIST_ENDPOINT = "/front-api/v1/complex/article/list"
+DETAIL_ENDPOINT_RE = re.compile(r"/api/articles/\d+$")
+
+
+def iter_har_entries(path: str, chunk_size: int = 1 << 20) -> Iterator[Dict]:
+    """
+    HAR 파일의 entries를 한 건씩 순회
+
+    Args:
+        path: HAR 파일 경로
+        chunk_size: 한 번에 읽을 문자 수
+
+    Returns:
+        entry 딕셔너리 이터레이터 (버퍼에는 최대 entry 1건 + chunk만 유지)
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf = ""
+        # entries 배열 시작 위치까지 이동
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            buf += chunk
+            match = _ENTRIES_RE.search(buf)
+            if match:
+                buf = buf[match.end():]
+                break
+            # 키가 chunk 경계에 걸칠 수 있으므로 꼬리만 유지
+            buf = buf[-64:]
+
+        pos = 0
+        eof = False
+        while True:
+            # 공백/쉼표 건너뛰기
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\r\n,":
+                    pos += 1
+                if pos < len(buf) or eof:
+                    break
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    eof = True
+                buf, pos = buf[pos:] + chunk, 0
+
+            if pos >= len(buf) or buf[pos] == "]":
+                return
+
+            try:
+                entry, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                if eof:
+                    # 잘린 HAR (녹화 중단): 읽은 곳까지만 처리
+                    return
+                # 큰 entry는 읽는 양을 두 배씩 늘려 재파싱 비용을 선형으로 유지
+                chunk = f.read(max(chunk_size, len(buf) - pos))
+                if not chunk:
+                    eof = True
+                buf, pos = buf[pos:] + chunk, 0
+                continue
+
+            yield entry
+            pos = end
+            if pos > chunk_size:
+                buf, pos = buf[pos:], 0
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """엔드포인트 집계 키 (숫자 경로 세그먼트는 {id}로 치환)"""
+    parsed = urlparse(url)
+    path = _NUMERIC_SEGMENT_RE.sub("/{id}", parsed.path)
+    return f"{method.upper()} {parsed.netloc}{path}"
+
+
+def is_json_mime(mime: str) -> bool:
+    """JSON MIME 여부"""
+    mime = (mime or "").lower()
+    return "application/json" in mime or mime.endswith("+json")
+
+
+def classify_endpoint(url: str) -> Optional[str]:
+    """크롤러가 사용하는 list/detail 엔드포인트 분류"""
+    path = urlparse(url).path
+    if path == LIST_ENDPOINT:
+        return "list"
+    if DETAIL_ENDPOINT_RE.search(path):
+        return "detail"
+    return None
+
+
+class HarFilter:
+    """상태 코드 / MIME / URL 패턴 필터"""
+
+    def __init__(self, statuses: Optional[Set[int]] = None, mime: Optional[str] = None,
+                 url_pattern: Optional[str] = None):
+        self.statuses = statuses
+        self.mime = mime.lower() if mime else None
+        self.url_re: Optional[Pattern] = re.compile(url_pattern) if url_pattern else None
+
+    def match(self, entry: Dict) -> bool:
+        res = entry.get("response") or {}
+        if self.statuses and res.get("status") not in self.statuses:
+            return False
+        if self.mime:
+            mime = ((res.get("content") or {}).get("mimeType") or "").lower()
+            if self.mime == "json":
+                if not is_json_mime(mime):
+                    return False
+            elif self.mime not in mime:
+                return False
+        if self.url_re and not self.url_re.search((entry.get("request") or {}).get("url", "")):
+            return False
+        return True
+
+
+def decode_content(content: Dict) -> bytes:
+    """HAR content 본문 디코딩 (base64는 이 시점에만 디코딩)"""
+    text = content.get("text") or ""
+    if content.get("encoding") == "base64":
+        return base64.b64decode(text)
+    return text.encode("utf-8")
+
+
+def _decode_payload(job: Tuple[str, str, Dict]) -> Optional[Dict]:
+    """작업 프로세스용: 본문 디코딩 + JSON 파싱"""
+    kind, url, content = job
+    try:
+        payload = json.loads(decode_content(content))
+    except (ValueError, TypeError):
+        return None
+    return {"endpoint": kind, "url": url, "payload": payload}
+
+
+class EndpointStats:
+    """엔드포인트별 건수/크기/소요시간 집계 (소요시간은 고정 크기 표본으로 유지)"""
+
+    SAMPLE_SIZE = 4096
+
+    def __init__(self):
+        self.count = 0
+        self.bytes = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.times: List[float] = []
+        self.statuses: Dict[int, int] = {}
+        self._rng = random.Random(0)
+
+    def add(self, size: int, elapsed: float, status: int):
+        self.count += 1
+        self.bytes += max(0, size)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if elapsed < 0:
+            return
+        self.total_ms += elapsed
+        self.max_ms = max(self.max_ms, elapsed)
+        # reservoir sampling: entry 수와 무관하게 메모리 일정
+        if len(self.times) < self.SAMPLE_SIZE:
+            self.times.append(elapsed)
+        else:
+            slot = self._rng.randrange(self.count)
+            if slot < self.SAMPLE_SIZE:
+                self.times[slot] = elapsed
+
+    def as_dict(self) -> Dict:
+        times = sorted(self.times)
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))] if times else 0.0
+        return {
+            "count": self.count,
+            "bytes": self.bytes,
+            "avg_bytes": self.bytes // self.count if self.count else 0,
+            "avg_ms": round(self.total_ms / self.count, 1) if self.count else 0.0,
+            "p95_ms": round(p95, 1),
+            "max_ms": round(self.max_ms, 1),
+            "statuses": dict(self.statuses),
+        }
+
+
+def analyze_har(path: str, har_filter: Optional[HarFilter] = None,
+                extract_path: Optional[str] = None, workers: int = 0,
+                batch_size: int = 64) -> Dict:
+    """
+    HAR 스트리밍 분석: 엔드포인트별 요약 + list/detail JSON 추출
+
+    Args:
+        path: HAR 파일 경로
+        har_filter: 요약 대상 필터 (None이면 전체)
+        extract_path: list/detail 응답 JSON을 JSONL로 저장할 경로
+        workers: 본문 디코딩 프로세스 수 (0이면 현재 프로세스에서 처리)
+        batch_size: 작업 프로세스에 한 번에 넘길 본문 수
+
+    Returns:
+        {"entries": 전체 건수, "matched": 필터 통과 건수, "extracted": 추출 건수, "endpoints": {...}}
+    """
+    stats: Dict[str, EndpointStats] = {}
+    total = matched = extracted = 0
+    out = open(extract_path, "w", encoding="utf-8") if extract_path else None
+    pool = ProcessPoolExecutor(max_workers=workers) if (out and workers > 0) else None
+    pending: List[Tuple[str, str, Dict]] = []
+
+    def flush():
+        nonlocal extracted
+        if not pending:
+            return
+        if pool:
+            results = pool.map(_decode_payload, pending, chunksize=max(1, len(pending) // (workers * 2)))
+        else:
+            results = map(_decode_payload, pending)
+        for result in results:
+            if result is not None:
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                extracted += 1
+        pending.clear()
+
+    try:
+        for entry in iter_har_entries(path):
+            total += 1
+            if har_filter and not har_filter.match(entry):
+                continue
+            matched += 1
+            req = entry.get("request") or {}
+            res = entry.get("response") or {}
+            content = res.get("content") or {}
+            url = req.get("url", "")
+            key = endpoint_key(req.get("method", "GET"), url)
+            size = content.get("size")
+            if size is None or size < 0:
+                size = res.get("bodySize") or 0
+            stats.setdefault(key, EndpointStats()).add(size, entry.get("time") or 0.0, res.get("status", 0))
+
+            if out is not None and res.get("status") == 200:
+                kind = classify_endpoint(url)
+                if kind and content.get("text"):
+                    # 필요한 필드만 넘겨 entry 전체가 메모리에 남지 않도록 함
+                    pending.append((kind, url, {"text": content.get("text"), "encoding": content.get("encoding")}))
+                    if len(pending) >= batch_size:
+                        flush()
+        if out is not None:
+            flush()
+    finally:
+        if pool:
+            pool.shutdown()
+        if out:
+            out.close()
+
+    return {
+        "entries": total,
+        "matched": matched,
+        "extracted": extracted,
+        "endpoints": {key: s.as_dict() for key, s in sorted(stats.items(), key=lambda kv: -kv[1].count)},
+    }
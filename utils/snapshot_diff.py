@@ -0,0 +1,365 @@
+"""
+매물 스냅샷 비교 (신규/삭제/가격 변동/층수 확인)
+두 스냅샷(스케줄러 JSONL, CLI/GUI 저장 파일 또는 레코드 목록)을 매물번호(없으면 지문) 키로 해시 조인
+값을 정수 코드로 factorize한 뒤 numpy/pandas 컬럼 연산으로 조인하므로 백만 행 단위도 수 초 내 비교
+
+사용법:
+    python -m utils.snapshot_diff 이전.jsonl 현재.jsonl [-o 변경사항.xlsx]
+    python -m utils.snapshot_diff --latest 12345 [--snapshot-dir ./snapshots]
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Tuple, Union
+
+from utils.dedup import parse_price
+
+ID_FIELD = '매물번호'
+# 매물번호가 없는 스냅샷의 조인 지문 (가격/층수는 비교 대상이므로 제외)
+FINGERPRINT_FIELDS = ('complex_id', '거래유형', '동', '면적')
+# 결과 표시 컬럼 (있는 컬럼만)
+DISPLAY_COLUMNS = ('complex_id', ID_FIELD, '거래유형', '동', '가격', '면적', '층수')
+
+# 결과 구분 (속성명, 표시 이름)
+SECTIONS = (
+    ('added', '신규'),
+    ('removed', '삭제'),
+    ('price_changed', '가격 변동'),
+    ('floor_resolved', '층수 확인'),
+)
+
+# 상세 층수로 확인된 층수 ("7/15", "B1/15"; "저/15"는 미확인)
+_RESOLVED_FLOOR_PATTERN = r'^\s*B?\d+\s*/'
+
+# pandas.DataFrame (pandas는 사용 시점에 import하므로 주석용 별칭)
+Frame = object
+Snapshot = Union[str, List[Dict], Frame]
+
+
+def _pandas():
+    # GUI 시작 속도를 위해 비교 시점에 import
+    import pandas as pd
+    return pd
+
+
+def load_snapshot(path: str) -> Tuple[Dict[str, list], int]:
+    """
+    스냅샷 파일 → (컬럼별 값 목록, 행 수)
+
+    Args:
+        path: .jsonl/.ndjson, .csv, .xlsx 파일
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext in ('.jsonl', '.ndjson'):
+        from utils import fastjson
+        with open(path, 'rb') as f:
+            return _columns_from_records([fastjson.loads(line) for line in f if line.strip()])
+    pd = _pandas()
+    if ext == '.csv':
+        frame = pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+    elif ext in ('.xlsx', '.xlsm'):
+        frame = pd.read_excel(path, dtype=str, keep_default_na=False)
+    else:
+        raise ValueError(f"지원하지 않는 스냅샷 형식: {path}")
+    return _columns_from_frame(frame)
+
+
+def _columns_from_records(records: List[Dict]) -> Tuple[Dict[str, list], int]:
+    # 비교/표시에 쓰는 컬럼만 추출 (값이 하나도 없는 컬럼은 제외, 빈 값은 None)
+    columns = {}
+    for column in DISPLAY_COLUMNS:
+        values = [record.get(column) for record in records]
+        if any(value is not None for value in values):
+            columns[column] = values
+    return columns, len(records)
+
+
+def _columns_from_frame(frame) -> Tuple[Dict[str, list], int]:
+    columns = {
+        column: frame[column].fillna('').to_numpy(dtype=object)
+        for column in DISPLAY_COLUMNS if column in frame.columns
+    }
+    return columns, len(frame)
+
+
+def _as_columns(snapshot: Snapshot) -> Tuple[Dict[str, list], int]:
+    if isinstance(snapshot, str):
+        return load_snapshot(snapshot)
+    if hasattr(snapshot, 'columns'):
+        return _columns_from_frame(snapshot)
+    return _columns_from_records(list(snapshot))
+
+
+def latest_snapshots(snapshot_dir: str, complex_id: str) -> Tuple[str, str]:
+    """스케줄러 스냅샷 디렉터리에서 단지의 직전/최신 스냅샷 경로"""
+    paths = sorted(glob.glob(os.path.join(snapshot_dir, f"{complex_id}_*.jsonl")))
+    if len(paths) < 2:
+        raise FileNotFoundError(f"{complex_id} 스냅샷이 2개 미만입니다: {snapshot_dir}")
+    return paths[-2], paths[-1]
+
+
+def _combine(*codes):
+    """정수 코드 배열 여러 개 → 조합 코드 (단계마다 다시 factorize해 범위 유지)"""
+    pd = _pandas()
+    key = codes[0]
+    for code in codes[1:]:
+        key, _ = pd.factorize(key * (int(code.max(initial=0)) + 1) + code)
+    return key
+
+
+def _occurrence(keys, order):
+    """같은 키 안에서의 순번 (order 오름차순)"""
+    import numpy as np
+    if not len(keys):
+        return keys
+    index = np.argsort(keys * (int(order.max()) + 1) + order, kind='stable')
+    sorted_keys = keys[index]
+    positions = np.arange(len(keys))
+    starts = np.where(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]], positions, 0)
+    occurrence = np.empty(len(keys), dtype=np.int64)
+    occurrence[index] = positions - np.maximum.accumulate(starts)
+    return occurrence
+
+
+def _match(keys, order, old_rows, new_rows):
+    """
+    키 해시 조인 (같은 키가 여러 건이면 order 순으로 1:1 대응)
+
+    Returns:
+        new_rows 각 행에 대응하는 old_rows 행 번호 배열 (없으면 -1)
+    """
+    import numpy as np
+    pd = _pandas()
+    if not len(old_rows) or not len(new_rows):
+        return np.full(len(new_rows), -1, dtype=np.int64)
+    rows = np.concatenate([old_rows, new_rows])
+    # 순번은 이전/현재 각각 부여 (키 코드는 공유)
+    occurrence = np.concatenate([
+        _occurrence(keys[old_rows], order[old_rows]),
+        _occurrence(keys[new_rows], order[new_rows]),
+    ])
+    joined = _combine(keys[rows], occurrence)
+    position = pd.Index(joined[:len(old_rows)]).get_indexer(joined[len(old_rows):])
+    return np.where(position >= 0, old_rows[position], -1)
+
+
+class SnapshotDiff:
+    """스냅샷 비교 결과 (구분별 DataFrame)"""
+
+    def __init__(self, added, removed, price_changed, floor_resolved, unchanged: int, join: str):
+        self.added = added
+        self.removed = removed
+        self.price_changed = price_changed
+        self.floor_resolved = floor_resolved
+        self.unchanged = unchanged
+        # 조인 방식 ("매물번호" 또는 "지문")
+        self.join = join
+
+    def sections(self) -> List[Tuple[str, Frame]]:
+        """(표시 이름, DataFrame) 목록"""
+        return [(label, getattr(self, name)) for name, label in SECTIONS]
+
+    def summary(self) -> Dict[str, int]:
+        """구분별 건수"""
+        counts = {label: len(frame) for label, frame in self.sections()}
+        counts['변동 없음'] = self.unchanged
+        return counts
+
+    def to_excel(self, filename: str) -> str:
+        """구분별 시트로 엑셀 저장"""
+        pd = _pandas()
+        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+            for label, frame in self.sections():
+                frame.to_excel(writer, sheet_name=label, index=False)
+        return filename
+
+    def to_csv(self, directory: str) -> List[str]:
+        """구분별 CSV 저장 (엑셀 시트 행 수 한도를 넘는 비교용)"""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for label, frame in self.sections():
+            path = os.path.join(directory, f"{label}.csv")
+            frame.to_csv(path, index=False, encoding='utf-8-sig')
+            paths.append(path)
+        return paths
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> SnapshotDiff:
+    """
+    두 스냅샷 비교
+
+    매물번호가 양쪽에 있으면 매물번호로, 없으면 지문(단지/거래유형/동/면적)으로 조인
+    (매물번호가 일부 행에만 있으면 매물번호 없는 행은 지문으로 조인)
+    지문 조인은 가격·층수까지 같은 매물을 먼저 짝짓고 남은 매물을 가격순으로 대응
+
+    Args:
+        old: 이전 스냅샷 (파일 경로, 레코드 목록 또는 DataFrame)
+        new: 현재 스냅샷
+
+    Returns:
+        SnapshotDiff (신규/삭제/가격 변동(변동액·변동률)/층수 확인)
+    """
+    import numpy as np
+    pd = _pandas()
+    old_columns, old_count = _as_columns(old)
+    new_columns, new_count = _as_columns(new)
+    total = old_count + new_count
+
+    # 이전/현재 값을 이어 붙여 한 번에 factorize (양쪽 코드 공유)
+    values: Dict[str, np.ndarray] = {}
+    codes: Dict[str, np.ndarray] = {}
+    uniques: Dict[str, np.ndarray] = {}
+    for column in DISPLAY_COLUMNS:
+        if column not in old_columns and column not in new_columns:
+            continue
+        values[column] = np.concatenate([
+            np.asarray(old_columns.get(column, [''] * old_count), dtype=object),
+            np.asarray(new_columns.get(column, [''] * new_count), dtype=object),
+        ])
+        values[column][values[column] == None] = ''  # noqa: E711 (원소별 비교)
+        codes[column], uniques[column] = pd.factorize(values[column])
+
+    def column_codes(column: str):
+        return codes[column] if column in codes else np.zeros(total, dtype=np.int64)
+
+    # 가격: 고유 문자열만 파싱 → 행별 금액/가격 순위
+    if '가격' in codes:
+        parsed = np.array([parse_price(value) for value in uniques['가격']], dtype=float)
+        price = parsed[codes['가격']]
+        price_rank = np.argsort(np.argsort(parsed, kind='stable'), kind='stable')[codes['가격']]
+    else:
+        price = np.full(total, np.nan)
+        price_rank = np.zeros(total, dtype=np.int64)
+    if '층수' in codes:
+        pattern = re.compile(_RESOLVED_FLOOR_PATTERN)
+        floor_resolved = np.array(
+            [bool(pattern.match(str(value))) for value in uniques['층수']], dtype=bool
+        )[codes['층수']]
+    else:
+        floor_resolved = np.zeros(total, dtype=bool)
+
+    is_old = np.arange(total) < old_count
+    # 양쪽 모두 매물번호가 있을 때만 매물번호 조인 (이전 형식 파일은 지문 조인)
+    has_id = values[ID_FIELD] != '' if ID_FIELD in values else np.zeros(total, dtype=bool)
+    use_ids = bool(has_id[is_old].any() and has_id[~is_old].any())
+    if not use_ids:
+        has_id = np.zeros(total, dtype=bool)
+    fields = [f for f in FINGERPRINT_FIELDS
+              if f != 'complex_id' or (f in old_columns and f in new_columns)]
+    fingerprint = _combine(*(column_codes(f) for f in fields))
+
+    match = np.full(new_count, -1, dtype=np.int64)
+    rows = np.arange(total)
+    # 이미 짝지어진 행 (이전/현재 공통 행 번호)
+    claimed = np.zeros(total, dtype=bool)
+
+    def join(keys, new_subset, old_subset):
+        old_rows = rows[old_subset & is_old & ~claimed]
+        new_rows = rows[new_subset & ~is_old & ~claimed]
+        matched = _match(keys, price_rank, old_rows, new_rows)
+        found = matched >= 0
+        match[new_rows[found] - old_count] = matched[found]
+        claimed[matched[found]] = True
+        claimed[new_rows[found]] = True
+
+    everything = np.ones(total, dtype=bool)
+    # 1) 매물번호 조인
+    if use_ids:
+        join(column_codes(ID_FIELD), has_id, has_id)
+    # 2) 지문 + 가격 + 층수가 같은 매물 (변동 없음), 3) 남은 매물은 지문 안에서 가격순으로 대응
+    # 매물번호가 서로 다른 두 행은 다른 매물이므로 한쪽이라도 매물번호가 없는 쌍만 지문 조인
+    exact = _combine(fingerprint, column_codes('가격'), column_codes('층수'))
+    for keys in (exact, fingerprint):
+        join(keys, ~has_id, everything)
+        join(keys, has_id, ~has_id)
+
+    matched_new = np.flatnonzero(match >= 0)
+    matched_old = match[matched_new]
+    in_new = np.zeros(old_count, dtype=bool)
+    in_new[matched_old] = True
+    current = matched_new + old_count
+
+    def frame(row_index, extra=None, drop=()):
+        data = {c: values[c][row_index] for c in DISPLAY_COLUMNS if c in values and c not in drop}
+        data.update(extra or {})
+        return pd.DataFrame(data)
+
+    old_price = price[matched_old]
+    new_price = price[current]
+    repriced = ~np.isnan(old_price) & ~np.isnan(new_price) & (old_price != new_price)
+    delta = (new_price - old_price)[repriced]
+    price_changed = frame(current[repriced], {
+        '이전 가격': values['가격'][matched_old[repriced]] if '가격' in values else '',
+        '현재 가격': values['가격'][current[repriced]] if '가격' in values else '',
+        '변동(만원)': delta.astype(np.int64),
+        '변동률(%)': np.round(delta / old_price[repriced] * 100, 2),
+    }, drop=('가격',))
+
+    resolved = ~floor_resolved[matched_old] & floor_resolved[current]
+    if '층수' in values:
+        floor_frame = frame(current[resolved], {
+            '이전 층수': values['층수'][matched_old[resolved]],
+            '현재 층수': values['층수'][current[resolved]],
+        }, drop=('층수',))
+    else:
+        floor_frame = frame(current[resolved])
+
+    return SnapshotDiff(
+        added=frame(np.flatnonzero(match < 0) + old_count),
+        removed=frame(np.flatnonzero(~in_new)),
+        price_changed=price_changed,
+        floor_resolved=floor_frame,
+        unchanged=int((~repriced & ~resolved).sum()),
+        join='매물번호' if use_ids else '지문',
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.snapshot_diff",
+        description="매물 스냅샷 비교 (신규/삭제/가격 변동/층수 확인)",
+    )
+    parser.add_argument("old", nargs="?", help="이전 스냅샷 (.jsonl/.csv/.xlsx)")
+    parser.add_argument("new", nargs="?", help="현재 스냅샷")
+    parser.add_argument("--latest", metavar="COMPLEX_ID", help="스냅샷 디렉터리에서 단지의 최근 두 스냅샷 비교")
+    parser.add_argument("--snapshot-dir", default="./snapshots", help="스케줄러 스냅샷 경로 (--latest)")
+    parser.add_argument("-o", "--output", help="결과 저장 (.xlsx는 구분별 시트, 그 외는 CSV 디렉터리)")
+    parser.add_argument("--json", action="store_true", help="건수 요약을 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.latest:
+            old_path, new_path = latest_snapshots(args.snapshot_dir, args.latest)
+        elif args.old and args.new:
+            old_path, new_path = args.old, args.new
+        else:
+            parser.error("이전/현재 스냅샷 또는 --latest 단지 ID를 지정하세요")
+        result = diff_snapshots(old_path, new_path)
+    except (OSError, ValueError) as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+
+    summary = result.summary()
+    if args.json:
+        print(json.dumps(dict(summary, old=old_path, new=new_path, join=result.join), ensure_ascii=False))
+    else:
+        print(f"{old_path} → {new_path} ({result.join} 기준)")
+        print(", ".join(f"{label} {count:,}건" for label, count in summary.items()))
+        if len(result.price_changed):
+            print(result.price_changed.head(20).to_string(index=False))
+
+    if args.output:
+        if args.output.lower().endswith('.xlsx'):
+            written = [result.to_excel(args.output)]
+        else:
+            written = result.to_csv(args.output)
+        print(f"저장: {', '.join(written)}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())